@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 로컬 픽스처 사이트
+
+통신3사 공시지원금 페이지의 DOM 구조만 재현한 정적 HTML을 로컬에서 서비스한다.
+크롤러는 base_url 설정으로 실제 사이트 대신 이 서버를 바라본다.
+
+주요 특징:
+    - 크롤러가 접근하는 경로 → 픽스처 파일 매핑 (쿼리 문자열은 페이지 스크립트가 해석)
+    - 응답 지연(latency) 주입으로 네트워크 조건 재현
+    - 포트 0 지정 시 빈 포트 자동 할당 (병렬 실행 충돌 방지)
+    - 외부 의존성 없음 (http.server)
+
+사용법:
+    python benchmarks/fixture_server.py --port 8765
+    python benchmarks/fixture_server.py --latency 0.2
+"""
+
+import os
+import time
+import argparse
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 크롤러 접근 경로 → 픽스처 파일
+ROUTES = {
+    '/kt/smart/supportAmtList.do': 'kt_support_amt_list.html',
+    '/skt/wireless/product/subscription/list': 'skt_subscription_list.html',
+    '/skt/notice': 'skt_notice.html',
+    '/lg/mobile/financing-model': 'lg_financing_model.html',
+}
+
+# 통신사 → 크롤러 base_url 경로 (SKT는 사이트 루트, KT/LG는 페이지 주소)
+CARRIER_PATHS = {
+    'SKT': '/skt',
+    'KT': '/kt/smart/supportAmtList.do',
+    'LG': '/lg/mobile/financing-model',
+}
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+}
+
+
+def make_handler(latency: float = 0.0):
+    """픽스처 요청 핸들러 클래스 생성"""
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = urlsplit(self.path).path
+            if path.startswith('/static/'):
+                file_name = os.path.join('static', os.path.basename(path))
+            else:
+                file_name = ROUTES.get(path.rstrip('/') or '/')
+
+            file_path = os.path.join(FIXTURE_DIR, file_name) if file_name else None
+            if not file_path or not os.path.isfile(file_path):
+                self.send_error(404)
+                return
+
+            if latency:
+                time.sleep(latency)
+
+            with open(file_path, 'rb') as f:
+                body = f.read()
+
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPES.get(os.path.splitext(file_path)[1],
+                                                               'application/octet-stream'))
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    return FixtureHandler
+
+
+class FixtureServer:
+    """백그라운드 스레드에서 도는 픽스처 HTTP 서버"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0 = 자동 할당)
+            latency: 응답마다 추가할 지연 (초)
+        """
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(latency))
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def root_url(self) -> str:
+        """서버 루트 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, carrier: str) -> str:
+        """통신사 크롤러에 넘길 base_url"""
+        return self.root_url + CARRIER_PATHS[carrier]
+
+    def start(self) -> 'FixtureServer':
+        """백그라운드 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        logger.info(f"픽스처 서버 시작: {self.root_url}")
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main(argv: Optional[list] = None):
+    """픽스처 서버 단독 실행 (브라우저로 픽스처 확인용)"""
+    parser = argparse.ArgumentParser(description='통신3사 공시지원금 픽스처 사이트')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본: 8765)')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초, 기본: 0)')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    server = FixtureServer(args.host, args.port, args.latency)
+    for carrier in CARRIER_PATHS:
+        print(f"{carrier}: {server.base_url(carrier)}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+/*
+ * 벤치마크 픽스처 공통 데이터
+ *
+ * 세 통신사 픽스처 페이지가 같은 기기 목록과 지원금 규칙을 사용한다.
+ * 값은 (요금제, 기기) 조합으로 결정되므로 실행마다 같은 결과가 나온다.
+ */
+var FIXTURE = (function () {
+    var MODELS = [
+        ['갤럭시 S25 울트라', 'SM-S938N', 1698400],
+        ['갤럭시 S25+', 'SM-S936N', 1353000],
+        ['갤럭시 S25', 'SM-S931N', 1155000],
+        ['갤럭시 Z 폴드6', 'SM-F956N', 2229700],
+        ['갤럭시 Z 플립6', 'SM-F741N', 1485000],
+        ['갤럭시 A35', 'SM-A356N', 499400],
+        ['아이폰 16 Pro Max', 'A3296', 1900000],
+        ['아이폰 16 Pro', 'A3293', 1550000],
+        ['아이폰 16', 'A3287', 1250000],
+        ['아이폰 15', 'A3090', 1090000],
+        ['갤럭시 퀀텀5', 'SM-A556S', 618200],
+        ['샤오미 레드미 노트13', '23124RA7EO', 399300]
+    ];
+    var STORAGES = [['256GB', 0], ['512GB', 154000], ['1TB', 462000]];
+
+    // 모델 × 저장용량 → 기기 목록 (36종)
+    var devices = [];
+    MODELS.forEach(function (model) {
+        STORAGES.forEach(function (storage) {
+            devices.push({
+                name: model[0] + ' ' + storage[0],
+                model: model[1] + (storage[0] === '256GB' ? '' : storage[0].replace('GB', '')),
+                price: model[2] + storage[1]
+            });
+        });
+    });
+
+    function hash(text) {
+        var h = 0;
+        for (var i = 0; i < text.length; i++) {
+            h = (h * 31 + text.charCodeAt(i)) % 1000003;
+        }
+        return h;
+    }
+
+    // 요금제 월정액과 기기 출고가로 정해지는 공시지원금 (만원 단위)
+    function subsidy(monthlyFee, device, salt) {
+        var base = Math.min(Math.round(monthlyFee * 6 / 10000) * 10000, 600000);
+        var spread = (hash(device.name + (salt || '')) % 8) * 10000;
+        return Math.min(base + spread, device.price - 100000);
+    }
+
+    function won(value) {
+        return String(value).replace(/\B(?=(\d{3})+(?!\d))/g, ',') + '원';
+    }
+
+    function page(list, pageNo, size) {
+        return list.slice((pageNo - 1) * size, pageNo * size);
+    }
+
+    function pageCount(list, size) {
+        return Math.max(1, Math.ceil(list.length / size));
+    }
+
+    function param(name) {
+        var match = new RegExp('[?&]' + name + '=([^&]*)').exec(window.location.search);
+        return match ? decodeURIComponent(match[1].replace(/\+/g, ' ')) : '';
+    }
+
+    return {
+        devices: devices,
+        subsidy: subsidy,
+        won: won,
+        page: page,
+        pageCount: pageCount,
+        param: param
+    };
+})();
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+후처리 파이프라인 부하 테스트
+
+합성 행(synthetic.py)을 행 수별로 만들어 통합 크롤러의 후처리 경로에 그대로 넣고
+단계별 처리량(행/초)과 최대 메모리(RSS)를 측정한다. 행 수를 늘려 가며 측정하므로
+어느 단계가 선형보다 나쁘게 늘어나는지 곡선으로 확인할 수 있다.
+
+주요 특징:
+    - 단계: 생성 / 수집 중 검증(StreamingValidator) / 행 단위 검증(DataValidator) /
+      벡터화 검증(VectorizedDataValidator) / 중복 제거(to_canonical + dedupe_canonical) /
+      Excel · CSV · JSON 저장(UnifiedTelecomCrawler.save_results)
+    - 저장 단계는 save_results 전체(표준 스키마 변환, 기기키 포함) 시간
+    - --parse: 합성 대형 페이지를 Chrome으로 열어 LG extract_table_data / KT _collect_products /
+      SKT _collect_current_page_data 파싱 처리량 측정 (Chrome 필요)
+    - 결과는 Rich 테이블 + JSON (행 수 × 단계별 초, 행/초, 최대 RSS)
+
+사용법:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --sizes 100000 300000 1000000 --stages validate_vectorized dedup save_csv
+    python benchmarks/load_test.py --sizes 100000 --parse --page-sizes 1000 5000
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import shutil
+import argparse
+import logging
+import tempfile
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic import generate_rows, write_pages  # noqa: E402
+from run_benchmarks import MemorySampler, PSUTIL_AVAILABLE, RICH_AVAILABLE, console  # noqa: E402
+from integrated_crawler import (DataValidator, VectorizedDataValidator, StreamingValidator,  # noqa: E402
+                                UnifiedTelecomCrawler, SKTCrawler, KTCrawler, LGCrawler)
+from schema import to_canonical, dedupe_canonical  # noqa: E402
+from records import ColumnarRows  # noqa: E402
+
+if RICH_AVAILABLE:
+    from rich.table import Table
+
+logger = logging.getLogger(__name__)
+
+# 후처리 단계 (실행 순서)
+PIPELINE_STAGES = ['generate', 'stream_validate', 'validate_row', 'validate_vectorized', 'dedup',
+                   'save_excel', 'save_csv', 'save_json']
+
+STAGE_LABELS = {
+    'generate': '행 생성',
+    'stream_validate': '수집 중 검증',
+    'validate_row': '행 단위 검증',
+    'validate_vectorized': '벡터화 검증',
+    'dedup': '표준화 + 중복 제거',
+    'save_excel': 'Excel 저장',
+    'save_csv': 'CSV 저장',
+    'save_json': 'JSON 저장',
+    'parse_lg': 'LG U+ 표 파싱',
+    'parse_kt': 'KT 목록 파싱',
+    'parse_skt': 'SKT 표 파싱',
+}
+
+# 수집 중 검증 청크 (크롤러 페이지 1개 분량)
+STREAM_CHUNK = 500
+
+
+def measure(stage: str, rows: int, func: Callable) -> Dict:
+    """단계 1회 실행 → 소요 시간 / 처리량 / 최대 RSS"""
+    gc.collect()
+    with MemorySampler(interval=0.2) as sampler:
+        start = time.perf_counter()
+        output = func()
+        elapsed = time.perf_counter() - start
+
+    result = {
+        'stage': stage,
+        'rows': rows,
+        'elapsed': round(elapsed, 3),
+        'rows_per_sec': round(rows / elapsed) if elapsed else 0,
+        'peak_rss_mb': sampler.peak_mb(),
+    }
+    if isinstance(output, int):
+        result['output_rows'] = output
+    logger.info(f"{STAGE_LABELS.get(stage, stage)} ({rows:,}행): {elapsed:.2f}s")
+    return result
+
+
+def run_pipeline(size: int, stages: List[str], work_dir: str, seed: int) -> List[Dict]:
+    """행 수 1개에 대해 선택한 후처리 단계 측정"""
+    results = []
+    data = []
+
+    def generate():
+        data.extend(generate_rows(size, seed=seed))
+        return len(data)
+
+    results.append(measure('generate', size, generate))
+
+    if 'stream_validate' in stages:
+        def stream_validate():
+            validator = StreamingValidator('합성', DataValidator(), abort_rate=0, report_every=0)
+            valid = 0
+            for start in range(0, len(data), STREAM_CHUNK):
+                valid += len(validator.process(data[start:start + STREAM_CHUNK]))
+            return valid
+        results.append(measure('stream_validate', size, stream_validate))
+
+    if 'validate_row' in stages:
+        results.append(measure('validate_row', size, lambda: len(DataValidator().validate_dataset(data)[0])))
+
+    valid_data = data
+    if 'validate_vectorized' in stages:
+        holder = {}
+
+        def validate_vectorized():
+            holder['rows'] = VectorizedDataValidator().validate_dataset(data)[0]
+            return len(holder['rows'])
+        results.append(measure('validate_vectorized', size, validate_vectorized))
+        valid_data = holder['rows']
+
+    if 'dedup' in stages:
+        results.append(measure('dedup', len(valid_data), lambda: len(
+            dedupe_canonical(to_canonical(pd.DataFrame(valid_data), 'unified', keep_extra=True)))))
+
+    for stage in ('save_excel', 'save_csv', 'save_json'):
+        if stage not in stages:
+            continue
+        output_dir = os.path.join(work_dir, f"{size}_{stage}")
+        crawler = UnifiedTelecomCrawler({
+            'save_formats': [stage.split('_', 1)[1]],
+            'output_dir': output_dir,
+            'checkpoint_dir': os.path.join(work_dir, 'checkpoints'),
+            'stream_validation': False,
+        })
+        crawler.all_data = ColumnarRows(valid_data)
+
+        holder = {}
+
+        def save():
+            holder['files'] = crawler.save_results()
+            return len(valid_data)
+        result = measure(stage, len(valid_data), save)
+        result['file_mb'] = round(sum(os.path.getsize(path) for path in holder['files']) / (1024 * 1024), 1)
+        results.append(result)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    data.clear()
+    return results
+
+
+def run_parse(device_count: int, work_dir: str) -> List[Dict]:
+    """합성 대형 페이지 파싱 처리량 (크롤러 추출 메서드를 그대로 호출)"""
+    pages = write_pages(os.path.join(work_dir, 'pages'), device_count)
+    results = []
+
+    lg = LGCrawler({'headless': True, 'delay_between_actions': 0})
+    lg.setup_driver()
+    try:
+        lg.driver.get('file://' + os.path.abspath(pages['LG']))
+        results.append(measure('parse_lg', device_count * 2, lambda: lg.extract_table_data('기기변경', '5G폰', '합성 요금제')))
+    finally:
+        lg.driver.quit()
+
+    kt = KTCrawler({'headless': True})
+    driver = kt.create_driver()
+    try:
+        driver.get('file://' + os.path.abspath(pages['KT']))
+        plan = {'name': '합성 요금제', 'plan_type': '5G', 'monthlyFee': 69000}
+        results.append(measure('parse_kt', device_count, lambda: len(kt._collect_products(driver, plan))))
+    finally:
+        driver.quit()
+
+    skt = SKTCrawler({'headless': True})
+    driver = skt.setup_driver()
+    try:
+        driver.get('file://' + os.path.abspath(pages['SKT']))
+        combo = {
+            'plan': {'name': '합성 요금제', 'category': '합성', 'monthly_fee': 69000},
+            'network': {'code': '5G', 'name': '5G'},
+            'scrb_type': {'value': '31', 'name': '기기변경'},
+        }
+        results.append(measure('parse_skt', device_count, lambda: len(skt._collect_current_page_data(driver, combo))))
+    finally:
+        driver.quit()
+
+    return results
+
+
+def print_results(results: List[Dict]):
+    """행 수 × 단계별 결과 출력"""
+    if RICH_AVAILABLE:
+        table = Table(title="후처리 부하 테스트", show_header=True, header_style="bold magenta")
+        table.add_column("단계", style="cyan")
+        table.add_column("행", justify="right")
+        table.add_column("소요 시간", justify="right", style="yellow")
+        table.add_column("행/초", justify="right", style="green")
+        table.add_column("최대 RSS", justify="right")
+        table.add_column("파일", justify="right")
+
+        for r in results:
+            table.add_row(STAGE_LABELS.get(r['stage'], r['stage']), f"{r['rows']:,}", f"{r['elapsed']:.2f}s",
+                          f"{r['rows_per_sec']:,}", f"{r['peak_rss_mb']:.0f}MB",
+                          f"{r['file_mb']:.1f}MB" if 'file_mb' in r else '-')
+        console.print(table)
+    else:
+        print("\n후처리 부하 테스트 (단계 | 행 | 소요 시간 | 행/초 | 최대 RSS | 파일)")
+        for r in results:
+            file_mb = f"{r['file_mb']:.1f}MB" if 'file_mb' in r else '-'
+            print(f"{STAGE_LABELS.get(r['stage'], r['stage'])} | {r['rows']:,} | {r['elapsed']:.2f}s | "
+                  f"{r['rows_per_sec']:,} | {r['peak_rss_mb']:.0f}MB | {file_mb}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """부하 테스트 CLI"""
+    parser = argparse.ArgumentParser(description='합성 대용량 데이터로 후처리 파이프라인 부하 테스트')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100000, 300000, 1000000],
+                        help='행 수 목록 (기본: 100000 300000 1000000)')
+    parser.add_argument('--stages', nargs='+', choices=PIPELINE_STAGES[1:], default=PIPELINE_STAGES[1:],
+                        help='측정할 단계 (기본: 전체, 행 생성은 항상 측정)')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 시드 (기본: 0)')
+    parser.add_argument('--parse', action='store_true', help='합성 페이지 파싱 처리량도 측정 (Chrome 필요)')
+    parser.add_argument('--page-sizes', nargs='+', type=int, default=[1000, 5000],
+                        help='파싱 측정용 페이지당 기기 수 (기본: 1000 5000)')
+    parser.add_argument('--work-dir', help='임시 출력 디렉토리 (기본: 시스템 임시 디렉토리)')
+    parser.add_argument('--output', help='측정 결과 JSON 경로 (기본: load_test_YYYYMMDD_HHMMSS.json)')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if not PSUTIL_AVAILABLE:
+        print("Warning: psutil not installed - 단계별 최대 RSS 대신 프로세스 전체 최대 RSS가 기록됩니다. "
+              "Install with: pip install psutil")
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix='load_test_')
+    os.makedirs(work_dir, exist_ok=True)
+
+    results = []
+    try:
+        for size in sorted(args.sizes):
+            results.extend(run_pipeline(size, args.stages, work_dir, args.seed))
+        if args.parse:
+            for device_count in sorted(args.page_sizes):
+                results.extend(run_parse(device_count, work_dir))
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = args.output or f"load_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(timespec='seconds'),
+                   'psutil': PSUTIL_AVAILABLE, 'results': results}, f, ensure_ascii=False, indent=2)
+
+    print_results(results)
+    print(f"측정 결과 저장: {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
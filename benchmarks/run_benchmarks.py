@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+통신3사 크롤러 오프라인 벤치마크
+
+로컬 픽스처 사이트(fixture_server.py)를 띄우고 통합 크롤러의 통신사별 크롤러를
+워커 수별로 실행해 처리량과 자원 사용량을 측정한다. 실제 사이트에 접속하지 않으므로
+같은 환경에서는 실행마다 같은 데이터가 나오고, 결과를 기준값과 비교해 성능 저하를 잡는다.
+
+주요 특징:
+    - 측정 항목: 소요 시간, 초당 행 수, 초당 페이지 수, 드라이버 실행 횟수, 최대 메모리(RSS)
+    - 워커 수별 실행 (--workers 1 3 5, LG U+는 단일 드라이버라 1회만 실행)
+    - 기준값(baseline.json)과 비교 → 허용 범위를 벗어나면 종료 코드 1
+    - psutil이 있으면 Chrome/ChromeDriver 자식 프로세스까지 합산한 RSS 샘플링
+      (없으면 resource 모듈의 최대 RSS로 대체)
+
+사용법:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --carriers SKT KT --workers 1 3 5
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --tolerance 0.15 --output bench.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    from rich.console import Console
+    from rich.table import Table
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fixture_server import FixtureServer  # noqa: E402
+from integrated_crawler import SKTCrawler, KTCrawler, LGCrawler  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+console = Console() if RICH_AVAILABLE else None
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+CRAWLERS = {
+    'SKT': SKTCrawler,
+    'KT': KTCrawler,
+    'LG': LGCrawler,
+}
+
+# 단일 드라이버로 순차 처리하는 크롤러 (워커 수 무관)
+SINGLE_WORKER = {'LG'}
+
+# 기준값 비교 항목 → 방향 (lower: 낮을수록 좋음, higher: 높을수록 좋음)
+COMPARED_METRICS = {
+    'elapsed': 'lower',
+    'rows_per_sec': 'higher',
+    'peak_rss_mb': 'lower',
+}
+
+
+class MemorySampler:
+    """현재 프로세스 + 자식 프로세스(Chrome 등) RSS 최대값 샘플링"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self) -> int:
+        process = psutil.Process()
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.peak = max(self.peak, self._sample())
+            except Exception as e:
+                logger.debug(f"메모리 샘플링 오류: {e}")
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if PSUTIL_AVAILABLE:
+            self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def peak_mb(self) -> float:
+        """최대 RSS (MB) - psutil이 없으면 resource 모듈의 최대 RSS (종료된 자식 포함)"""
+        if PSUTIL_AVAILABLE:
+            return round(self.peak / (1024 * 1024), 1)
+        try:
+            import resource
+        except ImportError:
+            return 0.0
+        # Linux의 ru_maxrss 단위는 KB
+        peak_kb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss +
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+        return round(peak_kb / 1024, 1)
+
+
+def run_case(server: FixtureServer, carrier: str, workers: int, max_rate_plans: int) -> Dict:
+    """통신사 크롤러 1회 실행 후 측정값 반환"""
+    config = {
+        'base_url': server.base_url(carrier),
+        'headless': True,
+        'max_workers': workers,
+        'max_rate_plans': max_rate_plans,
+    }
+    crawler = CRAWLERS[carrier](config)
+
+    with MemorySampler() as sampler:
+        start = time.perf_counter()
+        data = crawler.crawl() or []
+        elapsed = time.perf_counter() - start
+
+    stages = crawler.timer.stage_stats()
+    pages = stages.get('extract', {}).get('count', 0)
+
+    return {
+        'carrier': carrier,
+        'workers': workers,
+        'rows': len(data),
+        'pages': pages,
+        'elapsed': round(elapsed, 2),
+        'rows_per_sec': round(len(data) / elapsed, 2) if elapsed else 0.0,
+        'pages_per_sec': round(pages / elapsed, 3) if elapsed else 0.0,
+        'driver_launches': stages.get('driver_launch', {}).get('count', 0),
+        'peak_rss_mb': sampler.peak_mb(),
+        'stages': stages,
+    }
+
+
+def case_key(result: Dict) -> str:
+    """기준값 키 (통신사@워커수)"""
+    return f"{result['carrier']}@{result['workers']}"
+
+
+def compare_with_baseline(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """기준값 대비 허용 범위를 벗어난 항목 목록"""
+    regressions = []
+    for result in results:
+        base = baseline.get(case_key(result))
+        if not base:
+            continue
+
+        # 같은 픽스처에서 행 수가 달라지면 파싱 회귀
+        if result['rows'] != base.get('rows'):
+            regressions.append(f"{case_key(result)} 행 수: {base.get('rows')} → {result['rows']}")
+
+        for metric, direction in COMPARED_METRICS.items():
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            if direction == 'lower' and new > old * (1 + tolerance):
+                regressions.append(f"{case_key(result)} {metric}: {old} → {new} (+{(new / old - 1) * 100:.1f}%)")
+            elif direction == 'higher' and new < old * (1 - tolerance):
+                regressions.append(f"{case_key(result)} {metric}: {old} → {new} ({(new / old - 1) * 100:.1f}%)")
+    return regressions
+
+
+def print_results(results: List[Dict], baseline: Dict):
+    """측정 결과 출력 (기준값이 있으면 소요 시간 변화율 표시)"""
+    def change(result):
+        base = baseline.get(case_key(result), {})
+        if not base.get('elapsed'):
+            return '-'
+        return f"{(result['elapsed'] / base['elapsed'] - 1) * 100:+.1f}%"
+
+    if RICH_AVAILABLE:
+        table = Table(title="오프라인 벤치마크 결과", show_header=True, header_style="bold magenta")
+        table.add_column("통신사", style="cyan")
+        table.add_column("워커", justify="right")
+        table.add_column("행", justify="right")
+        table.add_column("소요 시간", justify="right", style="yellow")
+        table.add_column("행/초", justify="right", style="green")
+        table.add_column("페이지/초", justify="right")
+        table.add_column("드라이버", justify="right")
+        table.add_column("최대 RSS", justify="right")
+        table.add_column("기준 대비", justify="right")
+
+        for r in results:
+            table.add_row(r['carrier'], str(r['workers']), f"{r['rows']:,}", f"{r['elapsed']:.1f}s",
+                          f"{r['rows_per_sec']:.1f}", f"{r['pages_per_sec']:.2f}",
+                          str(r['driver_launches']), f"{r['peak_rss_mb']:.0f}MB", change(r))
+        console.print(table)
+    else:
+        print("\n오프라인 벤치마크 결과")
+        print("통신사 | 워커 | 행 | 소요 시간 | 행/초 | 페이지/초 | 드라이버 | 최대 RSS | 기준 대비")
+        for r in results:
+            print(f"{r['carrier']} | {r['workers']} | {r['rows']:,} | {r['elapsed']:.1f}s | "
+                  f"{r['rows_per_sec']:.1f} | {r['pages_per_sec']:.2f} | {r['driver_launches']} | "
+                  f"{r['peak_rss_mb']:.0f}MB | {change(r)}")
+
+
+def load_baseline(path: str) -> Dict:
+    """기준값 파일 로드 (없으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('cases', {})
+
+
+def save_baseline(path: str, results: List[Dict]):
+    """측정 결과를 기준값으로 저장 (단계별 분포는 제외)"""
+    cases = {case_key(r): {k: v for k, v in r.items() if k != 'stages'} for r in results}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(timespec='seconds'), 'cases': cases},
+                  f, ensure_ascii=False, indent=2)
+    print(f"기준값 저장: {path}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """벤치마크 CLI"""
+    parser = argparse.ArgumentParser(
+        description='통신3사 크롤러 오프라인 벤치마크 (로컬 픽스처 사이트)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  python benchmarks/run_benchmarks.py                           # 3사 전체, 워커 1/3/5
+  python benchmarks/run_benchmarks.py --carriers KT --workers 3 # KT만, 워커 3
+  python benchmarks/run_benchmarks.py --save-baseline           # 현재 결과를 기준값으로 저장
+        """
+    )
+    parser.add_argument('--carriers', nargs='+', choices=list(CRAWLERS), default=list(CRAWLERS),
+                        help='측정할 통신사 (기본: 전체)')
+    parser.add_argument('--workers', nargs='+', type=int, default=[1, 3, 5],
+                        help='워커 수 목록 (기본: 1 3 5)')
+    parser.add_argument('--max-rate-plans', type=int, default=0,
+                        help='통신사별 최대 요금제 수 (기본: 0 = 픽스처 전체)')
+    parser.add_argument('--latency', type=float, default=0.0, help='픽스처 응답 지연 (초, 기본: 0)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준값 파일 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='기준값 대비 허용 변화율 (기본: 0.10 = 10%%)')
+    parser.add_argument('--output', help='측정 결과 JSON 저장 경로 (기본: benchmark_YYYYMMDD_HHMMSS.json)')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if not PSUTIL_AVAILABLE:
+        print("Warning: psutil not installed - Chrome 자식 프로세스 메모리는 종료 후 최대값만 반영됩니다. "
+              "Install with: pip install psutil")
+
+    results = []
+    with FixtureServer(latency=args.latency) as server:
+        for carrier in args.carriers:
+            worker_counts = [1] if carrier in SINGLE_WORKER else sorted(set(args.workers))
+            for workers in worker_counts:
+                logger.info(f"벤치마크: {carrier} (워커 {workers})")
+                results.append(run_case(server, carrier, workers, args.max_rate_plans))
+
+    output = args.output or f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(timespec='seconds'),
+                   'psutil': PSUTIL_AVAILABLE, 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"측정 결과 저장: {output}")
+
+    baseline = load_baseline(args.baseline)
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        return 0
+
+    if not baseline:
+        print(f"기준값 없음: {args.baseline} (--save-baseline 으로 생성)")
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n성능 저하 감지 (허용 {args.tolerance * 100:.0f}%):")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    print(f"\n기준값 대비 허용 범위 이내 ({args.tolerance * 100:.0f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+대용량 합성 데이터 생성기 (부하 테스트용)
+
+실제 페이지는 기기 수백 개 규모라 파싱/검증/중복 제거/저장 경로가 10만~100만 행에서
+어떻게 늘어나는지 알 수 없다. 크롤러 출력과 같은 모양의 행 스트림과,
+크롤러가 읽는 DOM 구조 그대로의 대형 정적 페이지를 결정적으로 생성한다.
+
+주요 특징:
+    - 행 스트림: 통합 크롤러 행(dict)과 같은 필드 / 통신사별 값 형식 (LG U+ 추가 필드 포함)
+    - 키 공간을 순서대로 펼쳐 생성 → 지정 비율의 중복 행 / 무효 행만 정확히 섞임
+    - 페이지: LG U+ rowspan 표, KT #prodList 목록, SKT disclosure-list 표 (스크립트 없는 정적 HTML)
+    - 같은 seed면 항상 같은 결과
+
+사용법:
+    python benchmarks/synthetic.py rows 1000000 --output rows.jsonl
+    python benchmarks/synthetic.py pages 20000 --output-dir synthetic_pages
+"""
+
+import os
+import json
+import zlib
+import random
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+# 기기 이름 재료 (제조사 분류가 실제처럼 나뉘도록 실제 시리즈명 사용)
+DEVICE_SERIES = [
+    ('갤럭시 S', 'SM-S9', 1150000),
+    ('갤럭시 Z 폴드', 'SM-F9', 2230000),
+    ('갤럭시 Z 플립', 'SM-F7', 1480000),
+    ('갤럭시 A', 'SM-A3', 500000),
+    ('갤럭시 퀀텀', 'SM-A5', 620000),
+    ('아이폰 Pro', 'A30', 1550000),
+    ('아이폰', 'A31', 1250000),
+    ('샤오미 레드미 노트', '2312R', 400000),
+]
+STORAGES = [('128GB', 0), ('256GB', 110000), ('512GB', 260000), ('1TB', 560000)]
+
+# 통신사별 가입유형 / 네트워크 / 요금제 이름 규칙
+CARRIER_SHAPES = {
+    'SKT': {
+        'subscription_types': ['기기변경', '신규가입', '번호이동'],
+        'networks': ['5G', '4G/LTE'],
+        'plan_prefix': '5GX 요금제',
+    },
+    'KT': {
+        'subscription_types': ['전체'],
+        'networks': ['5G', 'LTE'],
+        'plan_prefix': '초이스 요금제',
+    },
+    'LG U+': {
+        'subscription_types': ['기기변경', '번호이동', '신규가입'],
+        'networks': ['5G폰', 'LTE폰'],
+        'plan_prefix': '5G 요금제',
+    },
+}
+
+# 통신사별 요금제 수 (키 공간 = 가입유형 × 네트워크 × 요금제 × 기기)
+PLANS_PER_CARRIER = 40
+
+
+def synthetic_devices(count: int) -> List[Dict]:
+    """결정적 기기 목록 (이름은 모두 다름)"""
+    devices = []
+    generation = 0
+    while len(devices) < count:
+        for series, model_prefix, base_price in DEVICE_SERIES:
+            for storage, extra in STORAGES:
+                if len(devices) >= count:
+                    break
+                number = 10 + generation
+                devices.append({
+                    'name': f"{series}{number} {storage}",
+                    'model': f"{model_prefix}{number:03d}N{storage[:-2]}",
+                    'price': base_price + extra + (generation % 7) * 11000,
+                })
+        generation += 1
+    return devices
+
+
+def _subsidy(monthly_fee: int, device: Dict, salt: int) -> int:
+    """요금제 월정액과 기기로 정해지는 공시지원금 (만원 단위)"""
+    base = min(monthly_fee * 6 // 10000 * 10000, 600000)
+    spread = (zlib.crc32(f"{device['name']}|{salt}".encode('utf-8')) & 7) * 10000
+    return min(base + spread, device['price'] - 100000)
+
+
+def _plans(carrier: str) -> List[Dict]:
+    """통신사 요금제 목록 (이름, 월정액)"""
+    prefix = CARRIER_SHAPES[carrier]['plan_prefix']
+    return [{'name': f"{prefix} {i + 1:02d}", 'monthly_fee': 33000 + (i % 10) * 10000}
+            for i in range(PLANS_PER_CARRIER)]
+
+
+def _make_row(carrier: str, subscription_type: str, network: str, plan: Dict, device: Dict,
+              crawled_at: str) -> Dict:
+    """통합 크롤러 행 1개 (통신사별 필드 형식 그대로)"""
+    public_fee = _subsidy(plan['monthly_fee'], device, len(carrier))
+    additional = public_fee * 15 // 1000 * 10
+    row = {
+        '통신사': carrier,
+        '가입유형': subscription_type,
+        '네트워크': network,
+        '요금제_카테고리': network,
+        '요금제': plan['name'],
+        # LG U+는 월요금을 수집하지 않음 (0)
+        '월요금': 0 if carrier == 'LG U+' else plan['monthly_fee'],
+        '기기명': f"{device['name']} ({device['model']})" if carrier == 'LG U+' else device['name'],
+        '제조사': '삼성' if device['name'].startswith('갤럭시') else
+                 ('애플' if device['name'].startswith('아이폰') else '기타'),
+        '출고가': device['price'],
+        '공시지원금': public_fee,
+        '추가지원금': additional,
+        '총지원금': public_fee + additional,
+        '공시일자': '2025-01-10',
+        '크롤링시간': crawled_at,
+    }
+    if carrier == 'LG U+':
+        row['요금제유지기간'] = '24개월'
+        row['추천할인'] = plan['monthly_fee'] * 6
+        row['최종구매가'] = max(device['price'] - public_fee - additional, 0)
+    return row
+
+
+def _corrupt(row: Dict, kind: int) -> Dict:
+    """검증에서 걸러져야 하는 행 (실제 파싱 실패 유형)"""
+    row = dict(row)
+    if kind == 0:
+        row['기기명'] = '선택하세요'
+    elif kind == 1:
+        row['출고가'] = 0
+    elif kind == 2:
+        row['공시지원금'] = '-'
+    else:
+        row['크롤링시간'] = 'N/A'  # 무효는 아님 - 검증기가 현재 시각으로 교체
+    return row
+
+
+def generate_rows(count: int, seed: int = 0, duplicate_rate: float = 0.05,
+                  invalid_rate: float = 0.02) -> Iterator[Dict]:
+    """
+    합성 행 스트림
+
+    Args:
+        count: 생성할 행 수
+        seed: 난수 시드 (중복/무효 행 위치 결정)
+        duplicate_rate: 앞서 나온 키를 다시 내보낼 비율
+        invalid_rate: 검증 규칙을 어기는 행 비율
+    """
+    rng = random.Random(seed)
+    carriers = list(CARRIER_SHAPES)
+    plans = {carrier: _plans(carrier) for carrier in carriers}
+
+    # 키 공간이 count를 넘도록 기기 수 결정 (통신사당 가입유형×네트워크 조합은 최소 2)
+    device_count = max(36, count // (len(carriers) * 2 * PLANS_PER_CARRIER) + 1)
+    devices = synthetic_devices(device_count)
+    crawled_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    recent = []
+    produced = 0
+    position = 0
+    while produced < count:
+        if recent and rng.random() < duplicate_rate:
+            row = dict(rng.choice(recent))
+        else:
+            # 위치 → (기기, 요금제, 통신사, 네트워크, 가입유형) 혼합 기수 분해
+            index = position
+            position += 1
+            carrier = carriers[index % len(carriers)]
+            index //= len(carriers)
+            shape = CARRIER_SHAPES[carrier]
+            network = shape['networks'][index % len(shape['networks'])]
+            index //= len(shape['networks'])
+            subscription_type = shape['subscription_types'][index % len(shape['subscription_types'])]
+            index //= len(shape['subscription_types'])
+            plan = plans[carrier][index % PLANS_PER_CARRIER]
+            device = devices[(index // PLANS_PER_CARRIER) % len(devices)]
+            row = _make_row(carrier, subscription_type, network, plan, device, crawled_at)
+
+            # 중복 후보는 최근 행에서 고름 (크롤러의 가입유형 복사/재시도 중복과 비슷한 간격)
+            if len(recent) < 4096:
+                recent.append(row)
+            else:
+                recent[position % 4096] = row
+
+        if rng.random() < invalid_rate:
+            row = _corrupt(row, rng.randrange(4))
+
+        yield row
+        produced += 1
+
+
+def _won(value: int) -> str:
+    """가격 표기 (1,234,000원)"""
+    return f"{value:,}원"
+
+
+def _page(title: str, body: str) -> str:
+    """정적 HTML 문서"""
+    return (f'<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{title}</title>\n</head>\n<body>\n{body}\n</body>\n</html>\n')
+
+
+def lg_table_html(device_count: int, monthly_fee: int = 75000) -> str:
+    """LG U+ rowspan 표 (기기당 24개월/12개월 2행, extract_table_data 대상)"""
+    durations = [('24개월', 10), ('12개월', 6)]
+    rows = []
+    for device in synthetic_devices(device_count):
+        public_fee = _subsidy(monthly_fee, device, 6)
+        for index, (duration, ratio) in enumerate(durations):
+            subsidy = public_fee * ratio // 100 * 10
+            additional = subsidy * 15 // 1000 * 10
+            cells = (f"<td>{duration}</td><td>{_won(subsidy)}</td><td>{_won(additional)}</td>"
+                     f"<td>{_won(subsidy + additional)}</td>"
+                     f"<td><p class=\"fw-b\">{_won(monthly_fee * 6)}</p></td>"
+                     f"<td>{_won(max(device['price'] - subsidy - additional, 0))}</td>")
+            if index == 0:
+                cells = (f"<td rowspan=\"{len(durations)}\"><a class=\"link\" href=\"#\">"
+                         f"<span class=\"tit\">{device['name']}</span><span class=\"txt\">{device['model']}</span></a></td>"
+                         f"<td>{_won(device['price'])}</td><td>2025-01-10</td>" + cells)
+            rows.append(f"<tr>{cells}</tr>")
+    return _page('LG U+ 합성 지원금 표', '<table>\n<tbody>\n' + '\n'.join(rows) + '\n</tbody>\n</table>')
+
+
+def kt_product_list_html(device_count: int, monthly_fee: int = 69000) -> str:
+    """KT #prodList 상품 목록 (페이지 이동 없음, _collect_products 대상)"""
+    items = []
+    for device in synthetic_devices(device_count):
+        public_fee = _subsidy(monthly_fee, device, 2)
+        items.append(f"<li><strong class=\"prodName\">{device['name']}</strong>"
+                     f"<p>출고가 {_won(device['price'])}</p><p>공시지원금 {_won(public_fee)}</p>"
+                     f"<p>추가지원금 {_won(public_fee * 15 // 1000 * 10)}</p></li>")
+    return _page('KT 합성 상품 목록', '<ul id="prodList">\n' + '\n'.join(items) + '\n</ul>')
+
+
+def skt_disclosure_html(device_count: int, monthly_fee: int = 69000) -> str:
+    """SKT disclosure-list 표 (_collect_current_page_data 대상)"""
+    rows = []
+    for device in synthetic_devices(device_count):
+        public_fee = _subsidy(monthly_fee, device, 3)
+        additional = public_fee * 15 // 1000 * 10
+        rows.append(f"<tr><td>{device['name']}</td><td>2025-01-10</td><td>{_won(device['price'])}</td>"
+                    f"<td>{_won(public_fee)}</td><td>{_won(device['price'] - public_fee - additional)}</td>"
+                    f"<td>{_won(additional)}</td></tr>")
+    return _page('SKT 합성 공시지원금', '<table class="disclosure-list">\n<tbody>\n' + '\n'.join(rows) +
+                 '\n</tbody>\n</table>')
+
+
+# 통신사 → (파일명, 생성 함수)
+PAGE_GENERATORS = {
+    'SKT': ('skt_disclosure.html', skt_disclosure_html),
+    'KT': ('kt_product_list.html', kt_product_list_html),
+    'LG': ('lg_financing_table.html', lg_table_html),
+}
+
+
+def write_pages(output_dir: str, device_count: int, carriers: Optional[List[str]] = None) -> Dict[str, str]:
+    """통신사별 합성 페이지 저장 → {통신사: 파일 경로}"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {}
+    for carrier in carriers or list(PAGE_GENERATORS):
+        file_name, generator = PAGE_GENERATORS[carrier]
+        path = os.path.join(output_dir, f"{device_count}_{file_name}")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generator(device_count))
+        paths[carrier] = path
+    return paths
+
+
+def main(argv: Optional[List[str]] = None):
+    """합성 데이터 CLI"""
+    parser = argparse.ArgumentParser(description='부하 테스트용 합성 행 / 페이지 생성')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    rows_parser = subparsers.add_parser('rows', help='합성 행 스트림 (JSONL)')
+    rows_parser.add_argument('count', type=int, help='행 수')
+    rows_parser.add_argument('--output', required=True, help='JSONL 저장 경로')
+    rows_parser.add_argument('--seed', type=int, default=0, help='난수 시드 (기본: 0)')
+    rows_parser.add_argument('--duplicate-rate', type=float, default=0.05, help='중복 행 비율 (기본: 0.05)')
+    rows_parser.add_argument('--invalid-rate', type=float, default=0.02, help='무효 행 비율 (기본: 0.02)')
+
+    pages_parser = subparsers.add_parser('pages', help='통신사별 합성 페이지 (HTML)')
+    pages_parser.add_argument('devices', type=int, help='페이지당 기기 수')
+    pages_parser.add_argument('--output-dir', default='synthetic_pages', help='저장 디렉토리')
+    pages_parser.add_argument('--carriers', nargs='+', choices=list(PAGE_GENERATORS), help='통신사 (기본: 전체)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'rows':
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for row in generate_rows(args.count, args.seed, args.duplicate_rate, args.invalid_rate):
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+        print(f"합성 행 {args.count:,}개 저장: {args.output}")
+    else:
+        for carrier, path in write_pages(args.output_dir, args.devices, args.carriers).items():
+            print(f"{carrier}: {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+통신사 간 기기 식별 인덱스
+
+같은 단말이 통신사마다 다르게 표기되는 문제를 기기키 하나로 맞춘다.
+    SKT: "갤럭시 S25 울트라\\n512G"
+    KT : "갤럭시 S25 울트라 512GB"
+    LG : "갤럭시 S25 Ultra 512GB (SM-S938N512)"
+    → "galaxy s 25 ultra 512gb"
+
+주요 특징:
+    - 한글/영문 별칭 정규화 (갤럭시→galaxy, 울트라→ultra, 플립→flip ...)
+    - 저장용량 정규화 (512G / 512GB / 512기가 → 512gb, 1T → 1tb)
+    - 모델코드(SM-S938N512) 추출, 같은 모델코드는 같은 기기키로 연결
+    - 기기명 → 기기키 해시 조회 (한 번 계산한 이름은 캐시)
+    - 정렬된 기기키 목록으로 접두어 검색
+    - 사용자 별칭 / 모델코드 테이블 JSON 저장·로드
+"""
+
+import os
+import re
+import json
+import bisect
+import logging
+import threading
+from typing import List, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기본 별칭 (소문자 토큰 → 표준 토큰, 값에 공백이 있으면 여러 토큰)
+DEFAULT_ALIASES = {
+    '갤럭시': 'galaxy',
+    '아이폰': 'iphone',
+    '아이패드': 'ipad',
+    '울트라': 'ultra',
+    '엣지': 'edge',
+    '플러스': 'plus',
+    '+': 'plus',
+    '프로': 'pro',
+    '맥스': 'max',
+    '프로맥스': 'pro max',
+    'promax': 'pro max',
+    '폴드': 'fold',
+    '플립': 'flip',
+    '미니': 'mini',
+    '퀀텀': 'quantum',
+    '와이드': 'wide',
+    '버디': 'buddy',
+    '점프': 'jump',
+    '노트': 'note',
+    '탭': 'tab',
+    '워치': 'watch',
+    '클래식': 'classic',
+    '에어': 'air',
+    '라이트': 'lite',
+    '키즈': 'kids',
+    '폴더': 'folder',
+    '스타일': 'style',
+}
+
+# 기기키에서 제외할 토큰 (제조사, 네트워크, 판매 구분)
+NOISE_TOKENS = {
+    '삼성', 'samsung', '애플', 'apple', '자급제', 'new', '신규', '단말',
+    '5g', 'lte', '4g', 'skt', 'kt', 'lg', 'u+',
+}
+
+# 저장용량으로 인정할 GB 값
+STORAGE_SIZES_GB = {16, 32, 64, 128, 256, 512}
+
+_STORAGE_GB = re.compile(r'(?<![0-9])(\d{2,3})\s*(?:gb|g|기가)(?![a-z])')
+_STORAGE_TB = re.compile(r'(?<![0-9])([12])\s*(?:tb|t|테라)(?![a-z])')
+_MODEL_CODE = re.compile(r'\b([a-z]{2,3}-[a-z0-9]{3,})\b')
+_CODE_STORAGE_SUFFIX = re.compile(r'^(.*[a-z])(\d{2,3}|[12]t|[12]tb)$')
+_SEPARATORS = re.compile(r'[\s()\[\]{},/_·|]+')
+_SCRIPT_BOUNDARY = re.compile(r'(?<=[가-힣])(?=[a-z0-9+])|(?<=[a-z0-9+])(?=[가-힣])')
+_ALNUM_BOUNDARY = re.compile(r'(?<=[a-z])(?=[0-9])|(?<=[0-9])(?=[a-z])')
+_PLUS = re.compile(r'\+')
+
+
+def _normalize_storage(value: str) -> Optional[str]:
+    """저장용량 표기 → '512gb' / '1tb' (저장용량이 아니면 None)"""
+    value = value.lower()
+    if value.endswith('tb') or value.endswith('t'):
+        return f"{value.rstrip('tb')}tb"
+    digits = int(value)
+    return f"{digits}gb" if digits in STORAGE_SIZES_GB else None
+
+
+class DeviceIndex:
+    """기기명 → 기기키 인덱스"""
+
+    def __init__(self, alias_file: Optional[str] = None):
+        """
+        Args:
+            alias_file (str): 별칭 / 모델코드 테이블 JSON 경로 (있으면 로드)
+        """
+        self.alias_file = alias_file
+        self.aliases = dict(DEFAULT_ALIASES)
+        self.custom_aliases = {}
+        self.model_codes = {}  # 모델코드(용량 제외) → 기기키(용량 제외)
+
+        self._keys = {}  # 기기명 → 기기키 캐시
+        self._sorted_keys = None
+        self._lock = threading.Lock()
+
+        if alias_file and os.path.exists(alias_file):
+            self.load(alias_file)
+
+    # ------------------------------------------------------------------
+    # 별칭 테이블
+    # ------------------------------------------------------------------
+    def add_alias(self, alias: str, canonical: str):
+        """별칭 추가 (예: '갤탭' → 'galaxy tab')"""
+        alias = alias.lower().strip()
+        canonical = canonical.lower().strip()
+        with self._lock:
+            self.aliases[alias] = canonical
+            self.custom_aliases[alias] = canonical
+            self._keys.clear()
+            self._sorted_keys = None
+
+    def load(self, file_path: str):
+        """별칭 / 모델코드 테이블 로드"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                table = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"기기 별칭 테이블 로드 실패 ({file_path}): {e}")
+            return
+
+        with self._lock:
+            self.custom_aliases.update(table.get('aliases', {}))
+            self.aliases.update(table.get('aliases', {}))
+            self.model_codes.update(table.get('model_codes', {}))
+            self._keys.clear()
+            self._sorted_keys = None
+
+        logger.info(f"기기 별칭 테이블 로드: 별칭 {len(self.custom_aliases)}개, "
+                    f"모델코드 {len(self.model_codes)}개")
+
+    def save(self, file_path: Optional[str] = None) -> Optional[str]:
+        """별칭 / 모델코드 테이블 저장 (임시 파일 + rename)"""
+        file_path = file_path or self.alias_file
+        if not file_path:
+            return None
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            table = {
+                'aliases': dict(sorted(self.custom_aliases.items())),
+                'model_codes': dict(sorted(self.model_codes.items())),
+            }
+
+        with open(file_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(table, f, ensure_ascii=False, indent=2)
+        os.replace(file_path + '.tmp', file_path)
+        return file_path
+
+    # ------------------------------------------------------------------
+    # 정규화
+    # ------------------------------------------------------------------
+    def _parse(self, name: str):
+        """기기명 → (기본 토큰 목록, 저장용량, 모델코드)"""
+        text = name.lower().replace('\n', ' ')
+
+        # 모델코드 (괄호 안 SM-S938N512 등), 끝에 붙은 용량은 분리
+        model_code = None
+        storage = None
+        match = _MODEL_CODE.search(text)
+        if match:
+            code = match.group(1)
+            text = text[:match.start()] + ' ' + text[match.end():]
+            suffix = _CODE_STORAGE_SUFFIX.match(code)
+            if suffix:
+                storage = _normalize_storage(suffix.group(2))
+                if storage:
+                    code = suffix.group(1)
+            model_code = code.upper()
+
+        # 이름에 적힌 용량이 우선
+        found = []
+
+        def take_storage(match):
+            normalized = _normalize_storage(match.group(1) + ('tb' if match.re is _STORAGE_TB else ''))
+            if not normalized:
+                return match.group(0)
+            found.append(normalized)
+            return ' '
+
+        text = _STORAGE_GB.sub(take_storage, _STORAGE_TB.sub(take_storage, text))
+        if found:
+            storage = found[-1]
+
+        # 네트워크 표기는 숫자/영문 분리 전에 제거 (5g → "5 g" 방지)
+        text = _SEPARATORS.sub(' ', text)
+        tokens = [token for token in text.split() if token not in NOISE_TOKENS]
+
+        # 한글↔영숫자, 영문↔숫자 경계 분리 후 별칭 치환
+        words = []
+        for token in tokens:
+            if token in self.aliases:
+                words.extend(self.aliases[token].split())
+                continue
+            token = _PLUS.sub(' + ', _SCRIPT_BOUNDARY.sub(' ', token))
+            for part in token.split():
+                if part in self.aliases:
+                    words.extend(self.aliases[part].split())
+                elif part in NOISE_TOKENS:
+                    continue
+                else:
+                    words.extend(self.aliases.get(sub, sub) for sub in _ALNUM_BOUNDARY.sub(' ', part).split())
+
+        return words, storage, model_code
+
+    def _compute_key(self, name: str) -> str:
+        """기기명 → 기기키 계산 (캐시 미사용)"""
+        words, storage, model_code = self._parse(name)
+        base_key = ' '.join(words)
+
+        if model_code:
+            known = self.model_codes.get(model_code)
+            if known:
+                base_key = known
+            elif base_key:
+                self.model_codes[model_code] = base_key
+            else:
+                base_key = model_code.lower()
+
+        return f"{base_key} {storage}" if storage else base_key
+
+    def key_for(self, name) -> Optional[str]:
+        """기기명 → 기기키 (해시 조회, 처음 보는 이름만 계산)"""
+        if not isinstance(name, str) or not name.strip():
+            return None
+
+        key = self._keys.get(name)
+        if key is None:
+            with self._lock:
+                key = self._keys.get(name)
+                if key is None:
+                    key = self._compute_key(name)
+                    self._keys[name] = key
+                    self._sorted_keys = None
+        return key
+
+    def key_series(self, names: pd.Series) -> pd.Series:
+        """기기명 컬럼 → 기기키 컬럼 (고유 이름만 계산)"""
+        if isinstance(names.dtype, pd.CategoricalDtype):
+            categories = names.cat.categories
+            mapping = {name: self.key_for(name) for name in categories}
+            return names.map(mapping).astype(object)
+
+        unique_names = names.dropna().unique()
+        mapping = {name: self.key_for(name) for name in unique_names}
+        return names.map(mapping)
+
+    def same_device(self, name_a: str, name_b: str) -> bool:
+        """두 기기명이 같은 기기인지"""
+        key_a = self.key_for(name_a)
+        return key_a is not None and key_a == self.key_for(name_b)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def find(self, prefix: str, limit: int = 20) -> List[str]:
+        """기기키 접두어 검색 (예: 'galaxy s 25')"""
+        with self._lock:
+            if self._sorted_keys is None:
+                self._sorted_keys = sorted(set(self._keys.values()))
+            keys = self._sorted_keys
+
+        prefix = prefix.lower().strip()
+        start = bisect.bisect_left(keys, prefix)
+        results = []
+        for key in keys[start:]:
+            if not key.startswith(prefix) or len(results) >= limit:
+                break
+            results.append(key)
+        return results
+
+    def names_by_key(self) -> Dict[str, List[str]]:
+        """기기키 → 지금까지 본 기기명 목록"""
+        grouped = {}
+        for name, key in list(self._keys.items()):
+            grouped.setdefault(key, []).append(name)
+        return grouped
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name) -> bool:
+        return name in self._keys
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+실행 간 공시지원금 비교 (diff)
+
+두 크롤링 결과(파일 또는 이력 저장소 시점)를 비교해
+(통신사, 가입유형, 네트워크, 요금제, 기기명, 요금제유지기간) 단위로 추가 / 삭제 / 변경된 지원금을 보고한다.
+
+주요 특징:
+    - 키 컬럼을 64비트 해시 하나로 변환 → 해시 인덱스 조회로 O(n) 조인 (merge 미사용)
+    - 비교에 필요한 키/가격 컬럼만 보관 (표준 스키마로 변환 후 정수 가격)
+    - 새 스냅샷은 청크 단위로 읽어 비교 (csv / jsonl / parquet)
+    - 파일 형식(KT/SKT/LG/통합)과 이력 저장소(SQLite) 시점 스냅샷 모두 지원
+
+사용법:
+    python integrated_crawler.py diff data/KT_공시지원금_0110.csv data/KT_공시지원금_0111.csv
+    python integrated_crawler.py diff history.db@2025-01-10T00:00:00 history.db --output diff.csv
+"""
+
+import os
+import argparse
+import logging
+from typing import List, Optional, Iterator
+
+import numpy as np
+import pandas as pd
+
+from schema import to_canonical, detect_carrier_format
+from exporters import load_result_file, PYARROW_AVAILABLE
+from history_store import HistoryStore
+
+if PYARROW_AVAILABLE:
+    import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# 비교 키 / 비교 값 (LG U+는 기기·요금제마다 요금제유지기간별 행이 따로 있음)
+DIFF_KEYS = ['통신사', '가입유형', '네트워크', '요금제', '기기명', '요금제유지기간']
+DIFF_VALUES = ['공시지원금', '추가지원금', '출고가', '월요금']
+
+# 이력 저장소 파일 확장자
+HISTORY_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+# 청크 단위로 읽을 수 있는 형식
+CHUNKED_EXTENSIONS = ('.csv', '.jsonl', '.jsonl.gz', '.parquet')
+
+
+def _key_hash(df: pd.DataFrame) -> np.ndarray:
+    """키 컬럼 → 행별 64비트 해시"""
+    keys = df[DIFF_KEYS].astype(object).where(df[DIFF_KEYS].notna(), '')
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """비교에 필요한 컬럼만 남긴 표준 스키마 프레임"""
+    return df[DIFF_KEYS + DIFF_VALUES].reset_index(drop=True)
+
+
+def _is_history(spec: str) -> bool:
+    """이력 저장소 지정인지 (경로[@시점])"""
+    return spec.partition('@')[0].lower().endswith(HISTORY_EXTENSIONS)
+
+
+def load_snapshot(spec: str) -> pd.DataFrame:
+    """
+    스냅샷 전체 로드
+
+    Args:
+        spec: 결과 파일 경로 또는 '이력DB경로[@ISO시점]' (시점이 없으면 현재값)
+    """
+    if _is_history(spec):
+        db_path, _, at = spec.partition('@')
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(db_path)
+        with HistoryStore(db_path) as store:
+            rows = store.snapshot(at or None)
+        return _compact(to_canonical(pd.DataFrame(rows), 'history')) if rows else \
+            pd.DataFrame(columns=DIFF_KEYS + DIFF_VALUES)
+
+    return _compact(to_canonical(load_result_file(spec)))
+
+
+def iter_snapshot_chunks(spec: str, chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+    """스냅샷을 청크 단위로 읽기 (청크 읽기를 지원하지 않는 형식은 한 번에)"""
+    lower = spec.lower()
+    if _is_history(spec) or not lower.endswith(CHUNKED_EXTENSIONS):
+        yield load_snapshot(spec)
+        return
+
+    if lower.endswith('.csv'):
+        chunks = pd.read_csv(spec, encoding='utf-8-sig', chunksize=chunk_size)
+    elif lower.endswith('.parquet'):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet 파일을 읽으려면 pyarrow가 필요합니다. 설치: pip install pyarrow")
+        chunks = (batch.to_pandas() for batch in pq.ParquetFile(spec).iter_batches(batch_size=chunk_size))
+    else:
+        chunks = pd.read_json(spec, lines=True, dtype=False, chunksize=chunk_size,
+                              compression='gzip' if lower.endswith('.gz') else None)
+
+    carrier_format = None
+    for chunk in chunks:
+        if carrier_format is None:
+            carrier_format = detect_carrier_format(chunk.columns)
+        yield _compact(to_canonical(chunk, carrier_format))
+
+
+class SnapshotIndex:
+    """키 해시로 인덱싱된 기준(이전) 스냅샷"""
+
+    def __init__(self, df: pd.DataFrame):
+        # 같은 키가 여러 번 나오면 처음 행 사용 (새 스냅샷 청크 비교와 같은 규칙)
+        hashes = _key_hash(df)
+        keep = ~pd.Series(hashes).duplicated(keep='first').to_numpy()
+        self.frame = df[keep].reset_index(drop=True)
+        self.index = pd.Index(hashes[keep])
+        self.values = self.frame[DIFF_VALUES].to_numpy(dtype=np.int64)
+        self.matched = np.zeros(len(self.frame), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def lookup(self, hashes: np.ndarray) -> np.ndarray:
+        """해시 → 기준 스냅샷 행 위치 (없으면 -1)"""
+        return self.index.get_indexer(hashes)
+
+
+class DiffResult:
+    """비교 결과 (추가 / 삭제 / 변경)"""
+
+    def __init__(self, added: pd.DataFrame, removed: pd.DataFrame, changed: pd.DataFrame,
+                 unchanged_count: int):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.unchanged_count = unchanged_count
+
+    def summary(self) -> pd.DataFrame:
+        """통신사별 건수"""
+        counts = {}
+        for label, frame in (('추가', self.added), ('삭제', self.removed), ('변경', self.changed)):
+            counts[label] = frame.groupby('통신사', observed=True).size() if len(frame) else pd.Series(dtype='int64')
+        return pd.DataFrame(counts).fillna(0).astype('int64')
+
+    def to_frame(self) -> pd.DataFrame:
+        """변경유형 컬럼을 붙여 하나로 결합"""
+        frames = []
+        for label, frame in (('추가', self.added), ('삭제', self.removed), ('변경', self.changed)):
+            if len(frame):
+                frames.append(frame.assign(변경유형=label))
+        if not frames:
+            return pd.DataFrame(columns=['변경유형'] + DIFF_KEYS)
+        combined = pd.concat(frames, ignore_index=True)
+        return combined[['변경유형'] + [col for col in combined.columns if col != '변경유형']]
+
+
+def diff_snapshots(old_spec: str, new_spec: str, chunk_size: int = 100000) -> DiffResult:
+    """
+    두 스냅샷 비교
+
+    이전 스냅샷은 해시 인덱스로 메모리에 올리고, 새 스냅샷은 청크 단위로 조회한다.
+
+    Args:
+        old_spec: 이전 결과 (파일 경로 또는 '이력DB[@시점]')
+        new_spec: 새 결과
+        chunk_size: 새 스냅샷 청크 크기 (행)
+    """
+    base = SnapshotIndex(load_snapshot(old_spec))
+    logger.info(f"기준 스냅샷 인덱스: {len(base):,}행 ({old_spec})")
+
+    added_frames, changed_frames = [], []
+    unchanged_count = 0
+    seen = set()
+
+    for chunk in iter_snapshot_chunks(new_spec, chunk_size):
+        hashes = _key_hash(chunk)
+
+        # 청크 안/청크 간 중복 키는 처음 행만 비교 (기준 스냅샷 인덱스와 같은 규칙)
+        first = ~pd.Series(hashes).duplicated().to_numpy()
+        if seen:
+            first &= ~np.fromiter((h in seen for h in hashes), dtype=bool, count=len(hashes))
+        seen.update(hashes[first].tolist())
+        chunk, hashes = chunk[first].reset_index(drop=True), hashes[first]
+
+        positions = base.lookup(hashes)
+        found = positions >= 0
+
+        added_frames.append(chunk[~found])
+
+        matched_positions = positions[found]
+        base.matched[matched_positions] = True
+
+        old_values = base.values[matched_positions]
+        new_values = chunk.loc[found, DIFF_VALUES].to_numpy(dtype=np.int64)
+        differs = (old_values != new_values).any(axis=1)
+        unchanged_count += int((~differs).sum())
+
+        if differs.any():
+            changed = chunk.loc[found, DIFF_KEYS].reset_index(drop=True)[differs].reset_index(drop=True)
+            for i, column in enumerate(DIFF_VALUES):
+                changed[f'이전_{column}'] = old_values[differs, i]
+                changed[f'현재_{column}'] = new_values[differs, i]
+            changed['공시지원금_변동'] = new_values[differs, 0] - old_values[differs, 0]
+            changed_frames.append(changed)
+
+    removed = base.frame[~base.matched].reset_index(drop=True)
+    added = pd.concat(added_frames, ignore_index=True) if added_frames else removed.iloc[0:0]
+    changed = pd.concat(changed_frames, ignore_index=True) if changed_frames else pd.DataFrame(columns=DIFF_KEYS)
+
+    logger.info(f"비교 완료: 추가 {len(added):,} / 삭제 {len(removed):,} / 변경 {len(changed):,} / "
+                f"동일 {unchanged_count:,}")
+    return DiffResult(added, removed, changed, unchanged_count)
+
+
+def main(argv: Optional[List[str]] = None):
+    """diff CLI"""
+    parser = argparse.ArgumentParser(
+        prog='integrated_crawler.py diff',
+        description='두 크롤링 결과의 공시지원금 추가/삭제/변경 비교'
+    )
+    parser.add_argument('old', help='이전 결과 (파일 또는 이력DB경로[@ISO시점])')
+    parser.add_argument('new', help='새 결과 (파일 또는 이력DB경로[@ISO시점])')
+    parser.add_argument('--output', help='변경 내역 저장 경로 (.csv)')
+    parser.add_argument('--chunk-size', type=int, default=100000, help='새 결과 청크 크기 (기본: 100000행)')
+    parser.add_argument('--show', type=int, default=20, help='화면에 출력할 변경 행 수 (기본: 20)')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    result = diff_snapshots(args.old, args.new, args.chunk_size)
+
+    print("\n통신사별 변경 건수:")
+    print(result.summary().to_string())
+    print(f"\n동일: {result.unchanged_count:,}건")
+
+    if len(result.changed) and args.show:
+        print(f"\n공시지원금 변경 (상위 {args.show}건, 변동폭 순):")
+        changed = result.changed.reindex(
+            result.changed['공시지원금_변동'].abs().sort_values(ascending=False).index)
+        with pd.option_context('display.max_columns', None, 'display.width', 200):
+            print(changed.head(args.show).to_string(index=False))
+
+    if args.output:
+        result.to_frame().to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"\n변경 내역 저장: {args.output}")
+
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,483 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 저장 유틸리티
+
+3사 크롤러와 통합 크롤러가 공통으로 사용하는 파일 저장 함수 모음.
+
+주요 특징:
+    - Parquet / Arrow IPC 컬럼 포맷 저장
+    - 반복 문자열 컬럼(요금제명, 기기명, 제조사, 통신사) 딕셔너리 인코딩
+    - 가격 컬럼 정수 타입 고정
+    - 정규화 출력 (요금제 / 기기 / 팩트 테이블, 정수 키 조인)
+    - 스트리밍 Excel 저장 (xlsxwriter constant_memory, 시트명 중복 처리)
+    - 스트리밍 JSONL 저장 (gzip / zstd 압축, orjson 사용 가능 시 고속 직렬화)
+    - 저장된 결과 파일 로드 (비교/분석용)
+"""
+
+import os
+import re
+import io
+import gzip
+import json
+import logging
+from typing import List, Dict, Optional, Iterable, Sequence
+
+import pandas as pd
+
+from price_utils import parse_price_series
+
+# pyarrow (선택 의존성)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# xlsxwriter (선택 의존성, 없으면 openpyxl write-only 모드)
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+# orjson (선택 의존성, JSONL 고속 직렬화)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# zstandard (선택 의존성, JSONL zstd 압축)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 딕셔너리 인코딩 대상 컬럼 (영문/한글 컬럼명 모두 지원)
+DICTIONARY_COLUMNS = [
+    'carrier', 'plan_name', 'device_name', 'manufacturer',
+    'plan_type', 'plan_category', 'network_type', 'scrb_type_name',
+    '통신사', '요금제', '기기명', '제조사',
+    '가입유형', '기기종류', '네트워크', '요금제_카테고리', '기기키'
+]
+
+# 정수 타입으로 저장할 가격 컬럼
+PRICE_COLUMNS = [
+    'monthly_fee', 'plan_monthly_fee', 'release_price',
+    'public_support_fee', 'additional_support_fee', 'total_support_fee',
+    'device_discount_24', 'plan_discount_24',
+    '월요금', '월납부금액', '출고가', '공시지원금', '추가지원금', '추가공시지원금',
+    '총지원금', '지원금총액', '추천할인', '최종구매가'
+]
+
+# 정규화 출력: 요금제 테이블로 분리할 컬럼
+PLAN_COLUMNS = [
+    'carrier', 'plan_id', 'plan_name', 'plan_type', 'plan_category',
+    'monthly_fee', 'plan_monthly_fee',
+    '통신사', '요금제ID', '요금제', '요금제_카테고리', '월요금', '월납부금액'
+]
+
+# 정규화 출력: 기기 테이블로 분리할 컬럼
+DEVICE_COLUMNS = [
+    'device_name', 'manufacturer', 'release_price',
+    '기기명', '기기키', '제조사', '출고가'
+]
+
+# Excel 시트명에 쓸 수 없는 문자 / 최대 길이
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+MAX_SHEET_NAME_LENGTH = 31
+
+# JSONL 압축 방식별 확장자
+JSONL_EXTENSIONS = {
+    None: 'jsonl',
+    'gzip': 'jsonl.gz',
+    'zstd': 'jsonl.zst'
+}
+
+# 형식별 파일 확장자
+COLUMNAR_EXTENSIONS = {
+    'parquet': 'parquet',
+    'arrow': 'arrow'
+}
+
+
+def prepare_columnar_frame(df: pd.DataFrame,
+                           dictionary_columns: Optional[List[str]] = None,
+                           price_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """컬럼 포맷 저장용 DataFrame 변환 (가격 → int64, 반복 문자열 → category)"""
+    dictionary_columns = DICTIONARY_COLUMNS if dictionary_columns is None else dictionary_columns
+    price_columns = PRICE_COLUMNS if price_columns is None else price_columns
+
+    converted = {}
+    for col in df.columns:
+        if col in price_columns:
+            converted[col] = parse_price_series(df[col])
+        elif col in dictionary_columns:
+            converted[col] = df[col].astype('string').astype('category')
+
+    if not converted:
+        return df
+    return df.assign(**converted)
+
+
+def to_arrow_table(df: pd.DataFrame, **kwargs):
+    """DataFrame → pyarrow Table (category 컬럼은 dictionary 타입으로 변환됨)"""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow가 설치되지 않았습니다. 설치: pip install pyarrow")
+    return pa.Table.from_pandas(prepare_columnar_frame(df, **kwargs), preserve_index=False)
+
+
+def save_parquet(df: pd.DataFrame, file_path: str, compression: str = 'zstd', **kwargs) -> str:
+    """Parquet 저장"""
+    table = to_arrow_table(df, **kwargs)
+    pq.write_table(table, file_path, compression=compression, use_dictionary=True)
+    logger.info(f"Parquet 저장: {file_path} ({table.num_rows:,}행)")
+    return file_path
+
+
+def save_arrow(df: pd.DataFrame, file_path: str, compression: str = 'zstd', **kwargs) -> str:
+    """Arrow IPC (Feather v2) 저장"""
+    table = to_arrow_table(df, **kwargs)
+    feather.write_feather(table, file_path, compression=compression)
+    logger.info(f"Arrow 저장: {file_path} ({table.num_rows:,}행)")
+    return file_path
+
+
+def save_columnar_formats(df: pd.DataFrame, save_formats: List[str], output_dir: str,
+                          file_stem: str) -> List[str]:
+    """save_formats 중 parquet/arrow 형식 저장 후 저장된 파일 목록 반환"""
+    requested = [fmt for fmt in save_formats if fmt in COLUMNAR_EXTENSIONS]
+    if not requested:
+        return []
+
+    if not PYARROW_AVAILABLE:
+        logger.warning(f"pyarrow가 없어 {', '.join(requested)} 저장을 건너뜁니다. 설치: pip install pyarrow")
+        return []
+
+    saved_files = []
+    for fmt in requested:
+        file_path = os.path.join(output_dir, f'{file_stem}.{COLUMNAR_EXTENSIONS[fmt]}')
+        try:
+            if fmt == 'parquet':
+                save_parquet(df, file_path)
+            else:
+                save_arrow(df, file_path)
+            saved_files.append(file_path)
+        except Exception as e:
+            logger.error(f"{fmt} 저장 실패: {e}")
+
+    return saved_files
+
+
+def build_normalized_tables(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    결과 DataFrame → 요금제 / 기기 / 팩트 테이블 분리
+
+    요금제, 기기 메타데이터는 고유 조합마다 한 행만 남기고 정수 키(plan_key, device_key)를 부여한다.
+    팩트 테이블은 두 키와 나머지 컬럼(네트워크, 가입유형, 지원금 등)만 가진다.
+    """
+    plan_cols = [col for col in PLAN_COLUMNS if col in df.columns]
+    device_cols = [col for col in DEVICE_COLUMNS if col in df.columns]
+
+    facts = df.drop(columns=plan_cols + device_cols)
+    tables = {}
+
+    for name, key, cols in (('plans', 'plan_key', plan_cols), ('devices', 'device_key', device_cols)):
+        if not cols:
+            continue
+        codes = df.groupby(cols, sort=False, dropna=False).ngroup().astype('int32')
+        tables[name] = (
+            df[cols].assign(**{key: codes})
+            .drop_duplicates(key)
+            .sort_values(key)[[key] + cols]
+            .reset_index(drop=True)
+        )
+        facts.insert(len(tables) - 1, key, codes.values)
+
+    tables['facts'] = facts.reset_index(drop=True)
+    return tables
+
+
+def save_normalized_tables(df: pd.DataFrame, save_formats: List[str], output_dir: str,
+                           file_stem: str) -> List[str]:
+    """save_formats에 normalized가 있으면 정규화 테이블 저장 (pyarrow 있으면 Parquet, 없으면 CSV)"""
+    if 'normalized' not in save_formats:
+        return []
+
+    saved_files = []
+    try:
+        tables = build_normalized_tables(df)
+    except Exception as e:
+        logger.error(f"정규화 테이블 생성 실패: {e}")
+        return []
+
+    for name, table in tables.items():
+        try:
+            if PYARROW_AVAILABLE:
+                file_path = os.path.join(output_dir, f'{file_stem}_{name}.parquet')
+                save_parquet(table, file_path)
+            else:
+                file_path = os.path.join(output_dir, f'{file_stem}_{name}.csv')
+                table.to_csv(file_path, index=False, encoding='utf-8-sig')
+                logger.info(f"CSV 저장: {file_path} ({len(table):,}행)")
+            saved_files.append(file_path)
+        except Exception as e:
+            logger.error(f"정규화 테이블 저장 실패 ({name}): {e}")
+
+    return saved_files
+
+
+def unique_sheet_name(name: str, used_names: set) -> str:
+    """Excel 시트명 정리 (금지 문자 제거, 31자 제한, 대소문자 무시 중복 시 ' (2)' 등 접미사)"""
+    base = INVALID_SHEET_CHARS.sub('_', str(name)).strip().strip("'")[:MAX_SHEET_NAME_LENGTH].strip()
+    base = base or 'Sheet'
+
+    candidate = base
+    counter = 2
+    while candidate.lower() in used_names:
+        suffix = f' ({counter})'
+        candidate = base[:MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+        counter += 1
+
+    used_names.add(candidate.lower())
+    return candidate
+
+
+def iter_frame_rows(df: pd.DataFrame, chunk_size: int = 10000):
+    """DataFrame 행을 청크 단위로 변환하며 순회 (NaN → None, numpy 스칼라 → 파이썬 값)"""
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        yield from chunk.itertuples(index=False, name=None)
+
+
+class StreamingExcelWriter:
+    """
+    행 단위 스트리밍 Excel 저장
+
+    xlsxwriter constant_memory 모드로 행을 쓰는 즉시 디스크로 내보내므로
+    행 수와 관계없이 메모리 사용량이 일정하다.
+    여러 시트에 번갈아 써도 되지만 시트 안에서는 위에서 아래 순서로만 쓴다.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path (str): 저장할 xlsx 경로
+        """
+        self.file_path = file_path
+        self._sheets = {}
+        self._used_names = set()
+
+        if XLSXWRITER_AVAILABLE:
+            self.engine = 'xlsxwriter'
+            self._workbook = xlsxwriter.Workbook(file_path, {
+                'constant_memory': True,
+                'strings_to_numbers': False,
+                'strings_to_formulas': False,
+                'strings_to_urls': False
+            })
+        elif OPENPYXL_AVAILABLE:
+            self.engine = 'openpyxl'
+            self._workbook = openpyxl.Workbook(write_only=True)
+        else:
+            raise ImportError("xlsxwriter 또는 openpyxl이 필요합니다. 설치: pip install xlsxwriter")
+
+    def add_sheet(self, name: str, columns: Sequence) -> str:
+        """시트 추가 후 헤더 기록, 실제 시트명 반환"""
+        sheet_name = unique_sheet_name(name, self._used_names)
+
+        if self.engine == 'xlsxwriter':
+            worksheet = self._workbook.add_worksheet(sheet_name)
+        else:
+            worksheet = self._workbook.create_sheet(title=sheet_name)
+
+        self._sheets[sheet_name] = [worksheet, 0]
+        self.append_rows(sheet_name, [[str(col) for col in columns]])
+        return sheet_name
+
+    def append_rows(self, sheet_name: str, rows: Iterable[Sequence]):
+        """시트 끝에 행 추가"""
+        entry = self._sheets[sheet_name]
+        worksheet, row_index = entry
+
+        if self.engine == 'xlsxwriter':
+            for row in rows:
+                worksheet.write_row(row_index, 0, row)
+                row_index += 1
+        else:
+            for row in rows:
+                worksheet.append(list(row))
+                row_index += 1
+
+        entry[1] = row_index
+
+    def write_frame(self, name: str, df: pd.DataFrame, chunk_size: int = 10000) -> str:
+        """DataFrame 전체를 새 시트로 기록, 실제 시트명 반환"""
+        sheet_name = self.add_sheet(name, df.columns)
+        self.append_rows(sheet_name, iter_frame_rows(df, chunk_size))
+        return sheet_name
+
+    def row_count(self, sheet_name: str) -> int:
+        """헤더 포함 기록된 행 수"""
+        return self._sheets[sheet_name][1]
+
+    def close(self):
+        """워크북 저장"""
+        if self.engine == 'xlsxwriter':
+            self._workbook.close()
+        else:
+            self._workbook.save(self.file_path)
+        logger.debug(f"Excel 저장: {self.file_path} ({len(self._sheets)}개 시트)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def iter_frame_records(df: pd.DataFrame, chunk_size: int = 10000):
+    """DataFrame 행을 청크 단위로 dict로 변환하며 순회"""
+    columns = [str(col) for col in df.columns]
+    for row in iter_frame_rows(df, chunk_size):
+        yield dict(zip(columns, row))
+
+
+def _json_default(value):
+    """기본 직렬화가 안 되는 값 (numpy 스칼라, Timestamp 등) 처리"""
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _jsonl_line(row: Dict) -> bytes:
+    """행 1개 → 압축 표기 JSON 한 줄 (bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(row, default=_json_default,
+                            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(row, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+            + '\n').encode('utf-8')
+
+
+def _open_jsonl(file_path: str, compression: Optional[str]):
+    """압축 방식에 맞는 바이너리 쓰기 스트림 열기"""
+    if compression == 'gzip':
+        return gzip.open(file_path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(file_path, 'wb'), closefd=True)
+    return open(file_path, 'wb')
+
+
+def save_jsonl(rows: Iterable[Dict], file_path: str, compression: Optional[str] = None,
+               buffer_rows: int = 1000) -> int:
+    """
+    행을 순회하며 JSONL 저장 (전체 데이터를 문자열로 만들지 않음)
+
+    Args:
+        rows (iterable): 저장할 행 (dict)
+        file_path (str): 저장 경로
+        compression (str): None, 'gzip', 'zstd'
+        buffer_rows (int): 한 번에 기록할 행 수
+
+    Returns:
+        int: 저장된 행 수
+    """
+    count = 0
+    buffer = []
+    with _open_jsonl(file_path, compression) as f:
+        for row in rows:
+            buffer.append(_jsonl_line(row))
+            if len(buffer) >= buffer_rows:
+                f.write(b''.join(buffer))
+                count += len(buffer)
+                buffer = []
+        if buffer:
+            f.write(b''.join(buffer))
+            count += len(buffer)
+
+    logger.info(f"JSONL 저장: {file_path} ({count:,}행)")
+    return count
+
+
+def save_jsonl_format(rows: Iterable[Dict], save_formats: List[str], output_dir: str,
+                      file_stem: str, compression: Optional[str] = None) -> List[str]:
+    """save_formats에 jsonl이 있으면 JSONL 저장 후 저장된 파일 목록 반환"""
+    if 'jsonl' not in save_formats:
+        return []
+
+    compression = None if compression in (None, 'none') else compression
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        logger.warning("zstandard가 없어 gzip으로 압축합니다. 설치: pip install zstandard")
+        compression = 'gzip'
+    if compression not in JSONL_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+
+    file_path = os.path.join(output_dir, f'{file_stem}.{JSONL_EXTENSIONS[compression]}')
+    try:
+        save_jsonl(rows, file_path, compression)
+    except Exception as e:
+        logger.error(f"JSONL 저장 실패: {e}")
+        return []
+    return [file_path]
+
+
+def load_result_file(file_path: str) -> pd.DataFrame:
+    """
+    저장된 크롤링 결과 파일 → DataFrame (비교/분석용)
+
+    지원 형식: csv, json (행 목록 또는 {'data': [...]}), jsonl(.gz/.zst),
+    parquet, arrow/feather, xlsx ('전체데이터' 시트, 없으면 모든 시트 결합)
+    """
+    lower = file_path.lower()
+
+    if lower.endswith('.csv'):
+        return pd.read_csv(file_path, encoding='utf-8-sig')
+
+    if lower.endswith(('.jsonl', '.jsonl.gz', '.jsonl.zst')):
+        if lower.endswith('.zst'):
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstd JSONL을 읽으려면 zstandard가 필요합니다. 설치: pip install zstandard")
+            with open(file_path, 'rb') as raw, zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+                return pd.read_json(io.TextIOWrapper(reader, encoding='utf-8'), lines=True, dtype=False)
+        return pd.read_json(file_path, lines=True, dtype=False,
+                            compression='gzip' if lower.endswith('.gz') else None)
+
+    if lower.endswith('.json'):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        rows = payload.get('data', []) if isinstance(payload, dict) else payload
+        return pd.DataFrame(rows)
+
+    if lower.endswith(('.parquet', '.arrow', '.feather')):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet/Arrow 파일을 읽으려면 pyarrow가 필요합니다. 설치: pip install pyarrow")
+        if lower.endswith('.parquet'):
+            return pq.read_table(file_path).to_pandas()
+        return feather.read_table(file_path).to_pandas()
+
+    if lower.endswith('.xlsx'):
+        sheets = pd.read_excel(file_path, sheet_name=None)
+        if '전체데이터' in sheets:
+            return sheets['전체데이터']
+        # 요금제별 시트로 나뉜 파일 (요약/통계 시트 제외)
+        frames = [frame for name, frame in sheets.items()
+                  if not any(word in name for word in ('요약', '통계', '검증'))]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    raise ValueError(f"지원하지 않는 파일 형식: {file_path}")
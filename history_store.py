@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+공시지원금 이력 저장소 (SQLite)
+
+3사 크롤러가 수집한 행을 실행 간 누적 저장한다.
+같은 키의 값이 바뀌면 기존 행의 유효기간을 닫고 새 행을 추가한다.
+전체 수집을 마친 통신사는 이번 실행에서 보이지 않은 키(공시 철회)의 유효기간도 닫는다.
+
+키: (통신사, 요금제ID 또는 요금제명, 기기명, 가입유형, 네트워크, 약정기간)
+
+주요 특징:
+    - 유효기간(valid_from ~ valid_to) 기반 이력 관리
+    - 배치 단위 트랜잭션 + WAL 모드로 크롤링 속도에 맞춘 기록
+    - 자주 쓰는 조회(기기별, 요금제별, 현재값)용 인덱스
+    - 영문 컬럼(KT/SKT)과 한글 컬럼(LG/통합) 행 모두 지원
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from price_utils import parse_price
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subsidy_history (
+    id INTEGER PRIMARY KEY,
+    carrier TEXT NOT NULL,
+    plan_key TEXT NOT NULL,
+    plan_name TEXT,
+    device_name TEXT NOT NULL,
+    subscription_type TEXT NOT NULL DEFAULT '',
+    network TEXT NOT NULL DEFAULT '',
+    term TEXT NOT NULL DEFAULT '',
+    monthly_fee INTEGER,
+    release_price INTEGER,
+    public_support_fee INTEGER,
+    additional_support_fee INTEGER,
+    valid_from TEXT NOT NULL,
+    valid_to TEXT,
+    last_seen TEXT NOT NULL
+);
+
+-- 키별 현재 행은 하나만 존재 (valid_to IS NULL)
+CREATE UNIQUE INDEX IF NOT EXISTS ux_subsidy_current
+    ON subsidy_history(carrier, plan_key, device_name, subscription_type, network, term)
+    WHERE valid_to IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_subsidy_device
+    ON subsidy_history(device_name, carrier, valid_from);
+
+CREATE INDEX IF NOT EXISTS ix_subsidy_plan
+    ON subsidy_history(carrier, plan_key, valid_from);
+
+CREATE INDEX IF NOT EXISTS ix_subsidy_valid_from
+    ON subsidy_history(valid_from);
+"""
+
+# 값이 바뀐 현재 행의 유효기간 종료
+_CLOSE_CHANGED_SQL = """
+UPDATE subsidy_history
+   SET valid_to = :observed_at
+ WHERE valid_to IS NULL
+   AND carrier = :carrier AND plan_key = :plan_key AND device_name = :device_name
+   AND subscription_type = :subscription_type AND network = :network AND term = :term
+   AND (monthly_fee IS NOT :monthly_fee
+        OR release_price IS NOT :release_price
+        OR public_support_fee IS NOT :public_support_fee
+        OR additional_support_fee IS NOT :additional_support_fee)
+"""
+
+# 새 행 추가, 변경 없는 현재 행은 last_seen만 갱신
+_UPSERT_SQL = """
+INSERT INTO subsidy_history (
+    carrier, plan_key, plan_name, device_name, subscription_type, network, term,
+    monthly_fee, release_price, public_support_fee, additional_support_fee,
+    valid_from, valid_to, last_seen
+) VALUES (
+    :carrier, :plan_key, :plan_name, :device_name, :subscription_type, :network, :term,
+    :monthly_fee, :release_price, :public_support_fee, :additional_support_fee,
+    :observed_at, NULL, :observed_at
+)
+ON CONFLICT(carrier, plan_key, device_name, subscription_type, network, term)
+    WHERE valid_to IS NULL
+DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+# 이번 실행에서 관측되지 않은 현재 행의 유효기간 종료
+_CLOSE_UNSEEN_SQL = """
+UPDATE subsidy_history
+   SET valid_to = :closed_at
+ WHERE valid_to IS NULL
+   AND carrier = :carrier
+   AND last_seen < :since
+"""
+
+# 행 키 컬럼 (배치 내 중복 판단)
+KEY_FIELDS = ('carrier', 'plan_key', 'device_name', 'subscription_type', 'network', 'term')
+
+# 필드별 후보 컬럼 (앞쪽 우선)
+FIELD_ALIASES = {
+    'carrier': ['carrier', '통신사'],
+    'plan_id': ['plan_id', '요금제ID'],
+    'plan_name': ['plan_name', '요금제'],
+    'device_name': ['device_name', '기기명'],
+    'subscription_type': ['scrb_type_name', '가입유형'],
+    'network': ['network_type', 'plan_type', '네트워크', '기기종류'],
+    'term': ['요금제유지기간'],
+    'monthly_fee': ['monthly_fee', 'plan_monthly_fee', '월요금', '월납부금액'],
+    'release_price': ['release_price', '출고가'],
+    'public_support_fee': ['public_support_fee', '공시지원금'],
+    'additional_support_fee': ['additional_support_fee', '추가지원금', '추가공시지원금'],
+}
+
+
+def _pick(row: Dict, field: str):
+    """별칭 컬럼 중 첫 번째 값"""
+    for key in FIELD_ALIASES[field]:
+        value = row.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _to_int(value) -> Optional[int]:
+    """가격 값 정수 변환 (문자열이면 숫자만 추출)"""
+    return parse_price(value, default=None)
+
+
+class HistoryStore:
+    """SQLite 기반 공시지원금 이력 저장소"""
+
+    def __init__(self, db_path: str, batch_size: int = 500):
+        """
+        저장소 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            batch_size (int): 한 트랜잭션에 기록할 행 수
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+        # 워커 스레드에서 호출되므로 연결 하나를 lock으로 보호
+        self._lock = threading.Lock()
+        self._buffer = []
+        self.rows_recorded = 0
+        self.opened_at = datetime.now().isoformat(timespec='seconds')  # 이번 실행 시작 (미관측 키 판단 기준)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def normalize_row(self, row: Dict, carrier: Optional[str] = None,
+                      observed_at: Optional[str] = None) -> Optional[Dict]:
+        """크롤러 행 → 이력 저장소 행 (필수 값이 없으면 None)"""
+        device_name = _pick(row, 'device_name')
+        plan_name = _pick(row, 'plan_name')
+        plan_key = _pick(row, 'plan_id') or plan_name
+        carrier = _pick(row, 'carrier') or carrier
+
+        if not (device_name and plan_key and carrier):
+            return None
+
+        return {
+            'carrier': str(carrier),
+            'plan_key': str(plan_key),
+            'plan_name': plan_name,
+            'device_name': str(device_name),
+            'subscription_type': str(_pick(row, 'subscription_type') or ''),
+            'network': str(_pick(row, 'network') or ''),
+            'term': str(_pick(row, 'term') or ''),
+            'monthly_fee': _to_int(_pick(row, 'monthly_fee')),
+            'release_price': _to_int(_pick(row, 'release_price')),
+            'public_support_fee': _to_int(_pick(row, 'public_support_fee')),
+            'additional_support_fee': _to_int(_pick(row, 'additional_support_fee')),
+            'observed_at': observed_at or datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def record_rows(self, rows: List[Dict], carrier: Optional[str] = None):
+        """행 기록 (버퍼가 batch_size를 넘으면 한 트랜잭션으로 반영)"""
+        if not rows:
+            return
+
+        observed_at = datetime.now().isoformat(timespec='seconds')
+        normalized = []
+        for row in rows:
+            item = self.normalize_row(row, carrier, observed_at)
+            if item:
+                normalized.append(item)
+
+        with self._lock:
+            self._buffer.extend(normalized)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        """버퍼에 남은 행 반영"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """버퍼 반영 (lock 보유 상태에서 호출)"""
+        if not self._buffer:
+            return
+
+        # 같은 키가 한 배치에 여러 번 있으면 마지막 값만 반영
+        latest = {}
+        for item in self._buffer:
+            latest[tuple(item[field] for field in KEY_FIELDS)] = item
+        batch = list(latest.values())
+        self._buffer = []
+        try:
+            with self.conn:
+                self.conn.executemany(_CLOSE_CHANGED_SQL, batch)
+                self.conn.executemany(_UPSERT_SQL, batch)
+            self.rows_recorded += len(batch)
+            logger.debug(f"이력 저장소 반영: {len(batch)}행")
+        except sqlite3.Error as e:
+            logger.error(f"이력 저장소 기록 실패: {e}")
+
+    def close_unseen(self, carrier: str, since: Optional[str] = None) -> int:
+        """
+        이번 실행에서 관측되지 않은 통신사 키의 유효기간 종료 (전체 수집을 마친 경우에만 호출)
+
+        Args:
+            carrier (str): 통신사
+            since (str): 이 시각 이후 관측된 키는 유지 (기본: 저장소를 연 시각)
+
+        Returns:
+            int: 유효기간을 닫은 행 수
+        """
+        with self._lock:
+            self._flush_locked()
+            try:
+                with self.conn:
+                    cursor = self.conn.execute(_CLOSE_UNSEEN_SQL, {
+                        'carrier': carrier,
+                        'since': since or self.opened_at,
+                        'closed_at': datetime.now().isoformat(timespec='seconds'),
+                    })
+            except sqlite3.Error as e:
+                logger.error(f"이력 저장소 미관측 키 종료 실패 ({carrier}): {e}")
+                return 0
+
+        if cursor.rowcount:
+            logger.info(f"이력 저장소: {carrier} 목록에서 빠진 {cursor.rowcount:,}개 키 유효기간 종료")
+        return cursor.rowcount
+
+    def close(self):
+        """남은 행 반영 후 연결 종료"""
+        self.flush()
+        with self._lock:
+            self.conn.close()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def current(self, device_name: Optional[str] = None, carrier: Optional[str] = None) -> List[Dict]:
+        """현재 유효한 공시지원금 조회"""
+        sql = "SELECT * FROM subsidy_history WHERE valid_to IS NULL"
+        params = []
+        if device_name:
+            sql += " AND device_name = ?"
+            params.append(device_name)
+        if carrier:
+            sql += " AND carrier = ?"
+            params.append(carrier)
+        sql += " ORDER BY public_support_fee DESC"
+        return self._query(sql, params)
+
+    def device_history(self, device_name: str, carrier: Optional[str] = None) -> List[Dict]:
+        """기기별 공시지원금 변경 이력"""
+        sql = "SELECT * FROM subsidy_history WHERE device_name = ?"
+        params = [device_name]
+        if carrier:
+            sql += " AND carrier = ?"
+            params.append(carrier)
+        sql += " ORDER BY carrier, plan_key, valid_from"
+        return self._query(sql, params)
+
+    def changes_since(self, since: str, carrier: Optional[str] = None) -> List[Dict]:
+        """특정 시점 이후 새로 유효해진 행 (신규/변경)"""
+        sql = "SELECT * FROM subsidy_history WHERE valid_from >= ?"
+        params = [since]
+        if carrier:
+            sql += " AND carrier = ?"
+            params.append(carrier)
+        sql += " ORDER BY valid_from"
+        return self._query(sql, params)
+
+    def snapshot(self, at: Optional[str] = None, carrier: Optional[str] = None) -> List[Dict]:
+        """특정 시점에 유효했던 행 (at이 없으면 현재값)"""
+        if at:
+            sql = "SELECT * FROM subsidy_history WHERE valid_from <= ? AND (valid_to IS NULL OR valid_to > ?)"
+            params = [at, at]
+        else:
+            sql = "SELECT * FROM subsidy_history WHERE valid_to IS NULL"
+            params = []
+        if carrier:
+            sql += " AND carrier = ?"
+            params.append(carrier)
+        return self._query(sql, params)
+
+    def _query(self, sql: str, params: List) -> List[Dict]:
+        """조회 실행"""
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
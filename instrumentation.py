@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+크롤링 단계별 시간 계측
+
+드라이버 실행, 페이지 로드, 모달 처리, 요금제 선택, 데이터 추출, 페이지 이동 등
+각 단계를 컨텍스트 매니저 구간(span)으로 감싸 소요 시간을 모은다.
+
+주요 특징:
+    - with timer.span('page_load'): ... 형태의 가벼운 구간 계측 (perf_counter)
+    - @timed('modal') 메서드 데코레이터 (메서드 전체가 한 단계인 경우)
+    - 단계별 분포 (횟수 / 합계 / 평균 / p50 / p95 / p99 / 최대)
+    - 작업(요금제, 조합) 단위 단계별 시간 분해 - 스레드별 현재 작업에 자동 귀속
+    - 작업 완료/실패, 수집 행, 재시도, 드라이버 실행/종료 카운터 (metrics_exporter가 내보냄)
+    - profiler 지정 시 작업마다 cProfile 구간 (profiling.Profiler)
+    - Rich 테이블 출력 + JSON 메트릭 파일 저장
+"""
+
+import json
+import math
+import bisect
+import time
+import threading
+import logging
+import functools
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 단계 이름 → 표시 이름 (정의되지 않은 단계는 이름 그대로 표시)
+STAGE_LABELS = {
+    'job': '작업 전체',
+    'driver_launch': '드라이버 실행',
+    'page_load': '페이지 로드',
+    'modal': '모달 처리',
+    'plan_select': '요금제 선택',
+    'extract': '데이터 추출',
+    'pagination': '페이지 이동',
+    'plan_list': '요금제 목록 수집',
+    'rate_plan_price': '요금제 월요금 조회',
+}
+
+# 작업별 분해에 남길 최대 작업 수 (초과분은 합계에만 반영)
+MAX_JOB_BREAKDOWNS = 10000
+
+# 카운터 이름
+JOBS_STARTED = 'jobs_started'
+JOBS_COMPLETED = 'jobs_completed'
+JOBS_FAILED = 'jobs_failed'
+ROWS_COLLECTED = 'rows'
+RETRIES = 'retries'
+DRIVERS_STARTED = 'drivers_started'
+DRIVERS_CLOSED = 'drivers_closed'
+
+
+def timed(stage: str):
+    """메서드 전체를 단계 구간으로 계측하는 데코레이터 (self.timer가 있는 클래스용)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.timer.span(stage):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100.0 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class StageTimer:
+    """단계별 소요 시간 수집기 (스레드 안전)"""
+
+    def __init__(self, name: str = ''):
+        """
+        Args:
+            name: 메트릭 이름 (통신사 등, JSON / 테이블 제목에 사용)
+        """
+        self.name = name
+        self.started_at = time.time()
+        self._samples = {}  # 단계 → 소요 시간 목록 (초)
+        self._jobs = {}  # 작업 → {단계: 합계 초}
+        self._counters = {}  # 카운터 → 누적 값
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.last_activity = self.started_at  # 마지막 기록 시각 (멈춤 감지용)
+        self.profiler = None  # profiling.Profiler (None = 작업 프로파일링 안 함)
+
+    @property
+    def current_job(self) -> Optional[str]:
+        """현재 스레드에서 진행 중인 작업"""
+        return getattr(self._local, 'job', None)
+
+    def record(self, stage: str, seconds: float, job: Optional[str] = None):
+        """구간 소요 시간 기록"""
+        job = job or self.current_job
+        with self._lock:
+            self.last_activity = time.time()
+            self._samples.setdefault(stage, []).append(seconds)
+            if job is not None:
+                breakdown = self._jobs.get(job)
+                if breakdown is None:
+                    if len(self._jobs) >= MAX_JOB_BREAKDOWNS:
+                        return
+                    breakdown = self._jobs[job] = {}
+                breakdown[stage] = breakdown.get(stage, 0.0) + seconds
+
+    def increment(self, counter: str, value: int = 1):
+        """카운터 증가"""
+        with self._lock:
+            self.last_activity = time.time()
+            self._counters[counter] = self._counters.get(counter, 0) + value
+
+    def counters(self) -> Dict[str, int]:
+        """카운터 현재 값"""
+        with self._lock:
+            return dict(self._counters)
+
+    @property
+    def active_jobs(self) -> int:
+        """진행 중인 작업 수"""
+        with self._lock:
+            return self._counters.get(JOBS_STARTED, 0) - len(self._samples.get('job', ()))
+
+    @property
+    def active_drivers(self) -> int:
+        """실행 중인 드라이버 수"""
+        with self._lock:
+            return self._counters.get(DRIVERS_STARTED, 0) - self._counters.get(DRIVERS_CLOSED, 0)
+
+    @contextmanager
+    def span(self, stage: str):
+        """단계 구간 계측 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    @contextmanager
+    def job(self, job: str):
+        """작업 구간 - 안쪽 span은 이 작업에 귀속되고 전체 시간은 'job' 단계로 기록"""
+        previous = self.current_job
+        self._local.job = job
+        self.increment(JOBS_STARTED)
+        profile = self.profiler.profile(job) if self.profiler else nullcontext()
+        start = time.perf_counter()
+        try:
+            with profile:
+                yield
+        finally:
+            self.record('job', time.perf_counter() - start, job)
+            self._local.job = previous
+
+    def stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 분포 (기록 순서 유지)"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+
+        stats = {}
+        for stage, values in samples.items():
+            total = sum(values)
+            stats[stage] = {
+                'count': len(values),
+                'total': round(total, 4),
+                'mean': round(total / len(values), 4),
+                'p50': round(percentile(values, 50), 4),
+                'p95': round(percentile(values, 95), 4),
+                'p99': round(percentile(values, 99), 4),
+                'max': round(values[-1], 4),
+            }
+        return stats
+
+    def histograms(self, buckets: Sequence[float]) -> Dict[str, Tuple[List[int], float, int]]:
+        """단계별 누적 버킷 개수 (buckets 각 상한 이하 개수, 합계 초, 전체 개수)"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+        return {stage: ([bisect.bisect_right(values, bound) for bound in buckets], sum(values), len(values))
+                for stage, values in samples.items()}
+
+    def job_breakdown(self) -> Dict[str, Dict[str, float]]:
+        """작업별 단계 합계 (초)"""
+        with self._lock:
+            return {job: {stage: round(seconds, 4) for stage, seconds in stages.items()}
+                    for job, stages in self._jobs.items()}
+
+    def slowest_jobs(self, top: int = 5) -> List[tuple]:
+        """전체 시간이 가장 긴 작업 [(작업, 초)]"""
+        with self._lock:
+            totals = [(job, stages.get('job', sum(stages.values()))) for job, stages in self._jobs.items()]
+        return sorted(totals, key=lambda item: item[1], reverse=True)[:top]
+
+    def to_dict(self) -> Dict:
+        """JSON 메트릭 구조"""
+        return {
+            'name': self.name,
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+            'elapsed': round(time.time() - self.started_at, 3),
+            'stages': self.stage_stats(),
+            'counters': self.counters(),
+            'jobs': self.job_breakdown(),
+        }
+
+    def save(self, file_path: str) -> str:
+        """JSON 메트릭 파일 저장"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        logger.info(f"단계별 메트릭 저장: {file_path}")
+        return file_path
+
+    def rich_table(self, title: Optional[str] = None):
+        """단계별 분포 Rich 테이블 (Rich가 없으면 None)"""
+        try:
+            from rich.table import Table
+        except ImportError:
+            return None
+
+        table = Table(title=title or f"{self.name} 단계별 소요 시간".strip(), show_header=True,
+                      header_style="bold magenta")
+        table.add_column("단계", style="cyan")
+        table.add_column("횟수", justify="right")
+        table.add_column("합계", justify="right", style="yellow")
+        table.add_column("p50", justify="right")
+        table.add_column("p95", justify="right")
+        table.add_column("p99", justify="right")
+        table.add_column("최대", justify="right", style="red")
+
+        for stage, stats in self.stage_stats().items():
+            table.add_row(
+                STAGE_LABELS.get(stage, stage),
+                f"{stats['count']:,}",
+                f"{stats['total']:.1f}s",
+                f"{stats['p50']:.2f}s",
+                f"{stats['p95']:.2f}s",
+                f"{stats['p99']:.2f}s",
+                f"{stats['max']:.2f}s",
+            )
+        return table
+
+    def print_summary(self, console=None):
+        """단계별 분포 + 가장 느린 작업 출력 (console이 없으면 print)"""
+        stats = self.stage_stats()
+        if not stats:
+            return
+
+        table = self.rich_table() if console else None
+        if table is not None:
+            console.print(table)
+            for job, seconds in self.slowest_jobs(3):
+                console.print(f"  [dim]느린 작업:[/dim] {job} - {seconds:.1f}s")
+            return
+
+        print()
+        print(f"{self.name} 단계별 소요 시간 (횟수 / 합계 / p50 / p95 / p99 / 최대)".strip())
+        for stage, s in stats.items():
+            print(f"  {STAGE_LABELS.get(stage, stage)}: {s['count']:,}회 / {s['total']:.1f}s / "
+                  f"{s['p50']:.2f}s / {s['p95']:.2f}s / {s['p99']:.2f}s / {s['max']:.2f}s")
+        for job, seconds in self.slowest_jobs(3):
+            print(f"  느린 작업: {job} - {seconds:.1f}s")
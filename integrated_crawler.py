@@ -24,12 +24,12 @@ import json
 import logging
 import argparse
 import threading
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import traceback
-from collections import defaultdict
-import pickle
+from collections import defaultdict, deque
 
 # Rich library imports
 try:
@@ -57,6 +57,23 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 from webdriver_manager.chrome import ChromeDriverManager
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from exporters import (save_columnar_formats, save_normalized_tables, save_jsonl_format,
+                       StreamingExcelWriter, iter_frame_rows, iter_frame_records)
+from history_store import HistoryStore
+from segment_checkpoint import SegmentCheckpoint
+from records import ColumnarRows
+from price_utils import parse_price, parse_price_series
+from schema import to_canonical, dedupe_canonical
+from device_index import DeviceIndex
+from manufacturers import classify_manufacturer
+from tco_engine import TCOEngine
+from instrumentation import (StageTimer, timed, JOBS_COMPLETED, JOBS_FAILED, ROWS_COLLECTED, RETRIES,
+                             DRIVERS_STARTED, DRIVERS_CLOSED)
+from metrics_exporter import MetricsExporter
+from profiling import Profiler, SORT_KEYS
+import diff_engine
+import query_server
+
 # Console 초기화
 console = Console() if RICH_AVAILABLE else None
 
@@ -99,6 +116,26 @@ logger = loggers['main']
 class DataValidator:
     """데이터 정합성 검증 클래스"""
     
+    # 필수 필드
+    REQUIRED_FIELDS = ['통신사', '기기명', '출고가', '공시지원금']
+    
+    # 가격 필드별 허용 범위 (최소, 최대)
+    PRICE_RANGES = {
+        '출고가': (100000, 3000000),
+        '공시지원금': (0, 2000000),
+        '추가지원금': (0, 2000000),
+        '월요금': (10000, 200000)
+    }
+    
+    # 0이면 '수집하지 않음'으로 보고 범위 검사를 건너뛸 필드 (LG U+ 월요금)
+    ZERO_AS_UNKNOWN_FIELDS = ['월요금']
+    
+    # 유효하지 않은 기기명
+    INVALID_DEVICE_NAMES = ['선택하세요', '데이터없음', 'none', 'null']
+    
+    # 크롤링시간 형식
+    DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+    
     def __init__(self):
         self.logger = loggers['validator']
         self.validation_errors = []
@@ -107,30 +144,26 @@ class DataValidator:
         """디바이스명 검증"""
         if not device_name or len(device_name) < 3:
             return False
-        if device_name.lower() in ['선택하세요', '데이터없음', 'none', 'null']:
+        if device_name.lower() in self.INVALID_DEVICE_NAMES:
             return False
         return True
     
     def validate_price(self, price: any, field_name: str) -> Tuple[bool, int]:
         """가격 데이터 검증"""
         try:
-            # 문자열인 경우 숫자만 추출
-            if isinstance(price, str):
-                price = int(''.join(filter(str.isdigit, price)))
-            else:
-                price = int(price)
-            
-            # 가격 범위 검증
-            if field_name == '출고가' and (price < 100000 or price > 3000000):
-                return False, 0
-            elif field_name in ['공시지원금', '추가지원금'] and (price < 0 or price > 2000000):
-                return False, 0
-            elif field_name == '월요금' and (price < 10000 or price > 200000):
-                return False, 0
-                
-            return True, price
-        except:
+            price = parse_price(price, default=None)
+        except (TypeError, ValueError, OverflowError):
+            return False, 0
+        if price is None:
             return False, 0
+        
+        # 가격 범위 검증
+        if field_name in self.PRICE_RANGES:
+            low, high = self.PRICE_RANGES[field_name]
+            if price < low or price > high:
+                return False, 0
+            
+        return True, price
     
     def validate_row(self, row: dict) -> Tuple[bool, dict, List[str]]:
         """데이터 행 검증"""
@@ -138,8 +171,7 @@ class DataValidator:
         validated_row = row.copy()
         
         # 필수 필드 확인
-        required_fields = ['통신사', '기기명', '출고가', '공시지원금']
-        for field in required_fields:
+        for field in self.REQUIRED_FIELDS:
             if field not in row or not row[field]:
                 errors.append(f"필수 필드 누락: {field}")
         
@@ -157,6 +189,9 @@ class DataValidator:
         
         for field, name in price_fields.items():
             if field in row:
+                if field in self.ZERO_AS_UNKNOWN_FIELDS and row[field] in (0, '0'):
+                    validated_row[field] = 0
+                    continue
                 valid, price = self.validate_price(row[field], name)
                 if not valid:
                     errors.append(f"유효하지 않은 {name}: {row[field]}")
@@ -166,9 +201,9 @@ class DataValidator:
         # 날짜 검증
         if '크롤링시간' in row:
             try:
-                datetime.strptime(row['크롤링시간'], '%Y-%m-%d %H:%M:%S')
+                datetime.strptime(row['크롤링시간'], self.DATETIME_FORMAT)
             except:
-                validated_row['크롤링시간'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                validated_row['크롤링시간'] = datetime.now().strftime(self.DATETIME_FORMAT)
         
         return len(errors) == 0, validated_row, errors
     
@@ -206,13 +241,238 @@ class DataValidator:
         return valid_data, validation_result
 
 
+class VectorizedDataValidator(DataValidator):
+    """
+    DataFrame 컬럼 단위 데이터 검증 (대용량용)
+    
+    DataValidator.validate_dataset과 같은 행을 통과시키고 같은 validation_result를 만든다.
+    행 단위 함수 호출 대신 컬럼 연산(숫자 추출, 범위 검사, to_datetime)으로 검증한다.
+    """
+    
+    @staticmethod
+    def _present_mask(column: pd.Series) -> pd.Series:
+        """행에 키가 있는지 (DataFrame 생성 시 없는 키는 float NaN, 명시적 None은 그대로 유지됨)"""
+        return ~(column.isna() & column.map(type).eq(float))
+    
+    @staticmethod
+    def _missing_mask(column: pd.Series) -> pd.Series:
+        """필수 필드 누락 (키 없음, None, '', 0)"""
+        return column.isna() | column.eq('') | column.eq(0)
+    
+    @staticmethod
+    def _parse_prices(column: pd.Series) -> pd.Series:
+        """가격 컬럼 → 숫자 (문자열은 숫자만 추출, 그 외 값은 정수 변환, 실패 시 NaN)"""
+        return parse_price_series(column, default=None)
+    
+    def validate_frame(self, df: pd.DataFrame) -> Tuple[pd.Series, Dict[str, pd.Series], pd.Series, Dict[str, int]]:
+        """
+        DataFrame 검증
+        
+        Returns:
+            (유효 행 마스크, 필드별 정수 가격, 크롤링시간 교체 마스크, 오류 요약)
+        """
+        index = df.index
+        invalid = pd.Series(False, index=index)
+        error_summary = {}
+        
+        def add_errors(mask: pd.Series, messages):
+            """오류 마스크 반영 + 메시지별 건수 집계"""
+            nonlocal invalid
+            if not mask.any():
+                return
+            invalid |= mask
+            if isinstance(messages, str):
+                error_summary[messages] = error_summary.get(messages, 0) + int(mask.sum())
+            else:
+                for message, count in messages[mask].value_counts(sort=False).items():
+                    error_summary[message] = error_summary.get(message, 0) + int(count)
+        
+        # 필수 필드 확인
+        for field in self.REQUIRED_FIELDS:
+            if field in df.columns:
+                add_errors(self._missing_mask(df[field]), f"필수 필드 누락: {field}")
+            else:
+                add_errors(pd.Series(True, index=index), f"필수 필드 누락: {field}")
+        
+        # 디바이스명 검증
+        names = df['기기명'].fillna('').astype(str) if '기기명' in df.columns else pd.Series('', index=index)
+        bad_names = (names.str.len() < 3) | names.str.lower().isin(self.INVALID_DEVICE_NAMES)
+        add_errors(bad_names, "유효하지 않은 기기명")
+        
+        # 가격 필드 검증 (값이 있는 행만)
+        prices = {}
+        for field, (low, high) in self.PRICE_RANGES.items():
+            if field not in df.columns:
+                continue
+            column = df[field]
+            present = self._present_mask(column)
+            parsed = self._parse_prices(column)
+            bad = present & ~parsed.between(low, high)
+            if field in self.ZERO_AS_UNKNOWN_FIELDS:
+                bad &= ~(column.eq(0) | column.eq('0'))
+            add_errors(bad, f"유효하지 않은 {field}: " + column.map(str))  # None/NaN도 문자열로 (astype(str)은 None을 NaN으로 남김)
+            prices[field] = parsed.where(present & ~bad)
+        
+        # 날짜 검증 (형식이 맞지 않으면 현재 시각으로 교체)
+        if '크롤링시간' in df.columns:
+            column = df['크롤링시간']
+            parsed_times = pd.to_datetime(column.where(column.map(type).eq(str)),
+                                          format=self.DATETIME_FORMAT, errors='coerce')
+            bad_times = self._present_mask(column) & parsed_times.isna()
+        else:
+            bad_times = pd.Series(False, index=index)
+        
+        return ~invalid, prices, bad_times, error_summary
+    
+    def validate_dataset(self, data: List[dict]) -> Tuple[List[dict], Dict]:
+        """전체 데이터셋 검증 (컬럼 단위)"""
+        self.logger.info(f"데이터 검증 시작: {len(data)}개 항목 (벡터화)")
+        
+        if not data:
+            return [], {'total': 0, 'valid': 0, 'invalid': 0, 'error_summary': {}, 'validation_rate': 0}
+        
+        # 원본 값 그대로 비교/표시하도록 object 타입으로 생성
+        if isinstance(data, ColumnarRows):
+            df = data.to_dataframe(dtype=object)
+        else:
+            df = pd.DataFrame(data, dtype=object)
+        valid_mask, prices, bad_times, error_summary = self.validate_frame(df)
+        
+        # 유효 행만 원본 dict 복사 후 정수 가격 / 크롤링시간 반영
+        valid_positions = np.flatnonzero(valid_mask.to_numpy())
+        price_arrays = [(field, values.to_numpy()) for field, values in prices.items()]
+        bad_time_array = bad_times.to_numpy()
+        now_text = datetime.now().strftime(self.DATETIME_FORMAT)
+        
+        valid_data = []
+        for position in valid_positions:
+            row = data[position].copy()
+            for field, values in price_arrays:
+                value = values[position]
+                if value == value:  # NaN이 아니면 (필드가 있는 행)
+                    row[field] = int(value)
+            if bad_time_array[position]:
+                row['크롤링시간'] = now_text
+            valid_data.append(row)
+        
+        validation_result = {
+            'total': len(data),
+            'valid': len(valid_data),
+            'invalid': len(data) - len(valid_data),
+            'error_summary': error_summary,
+            'validation_rate': len(valid_data) / len(data) * 100
+        }
+        
+        self.logger.info(f"검증 완료: {validation_result['valid']}/{validation_result['total']} "
+                        f"({validation_result['validation_rate']:.1f}% 유효)")
+        
+        return valid_data, validation_result
+
+
+class StreamingValidator:
+    """
+    크롤링 중 행 단위 검증 (통신사별)
+    
+    수집 직후 행을 검증해 무효 행은 버리고 보정된 행만 메모리/체크포인트로 넘긴다.
+    최근 window개 행의 유효율이 abort_rate(%) 아래로 떨어지면 중단 신호를 낸다.
+    (페이지 구조 변경 등으로 수집이 깨진 경우 나머지 작업을 건너뛰기 위함)
+    """
+    
+    def __init__(self, carrier: str, validator: Optional[DataValidator] = None,
+                 window: int = 500, min_rows: int = 200, abort_rate: float = 50.0,
+                 report_every: int = 1000):
+        """
+        Args:
+            carrier (str): 통신사명
+            validator (DataValidator): 행 검증기 (없으면 새로 생성)
+            window (int): 유효율 계산에 쓸 최근 행 수
+            min_rows (int): 중단 판단 전 최소 처리 행 수
+            abort_rate (float): 중단 기준 유효율 (%, 0이면 중단하지 않음)
+            report_every (int): 유효율 로그 출력 간격 (행)
+        """
+        self.carrier = carrier
+        self.validator = validator or DataValidator()
+        self.logger = self.validator.logger
+        self.min_rows = min_rows
+        self.abort_rate = abort_rate
+        self.report_every = report_every
+        
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self._recent_valid = 0
+        
+        self.total = 0
+        self.valid = 0
+        self.error_summary = defaultdict(int)
+        self.aborted = False
+    
+    def process(self, rows: List[dict]) -> List[dict]:
+        """행 검증 → 유효한(보정된) 행만 반환"""
+        valid_rows = []
+        results = []
+        for row in rows:
+            is_valid, validated_row, errors = self.validator.validate_row(row)
+            results.append((is_valid, errors))
+            if is_valid:
+                valid_rows.append(validated_row)
+        
+        with self._lock:
+            previous_total = self.total
+            for is_valid, errors in results:
+                if len(self._recent) == self._recent.maxlen:
+                    self._recent_valid -= self._recent[0]
+                self._recent.append(is_valid)
+                self._recent_valid += is_valid
+                
+                self.total += 1
+                if is_valid:
+                    self.valid += 1
+                for error in errors:
+                    self.error_summary[error] += 1
+            
+            if self.report_every and self.total // self.report_every > previous_total // self.report_every:
+                self.logger.info(f"{self.carrier} 수집 중 검증: {self.total:,}행, 유효율 {self.validation_rate:.1f}% "
+                                 f"(최근 {self.window_rate:.1f}%)")
+            
+            if (not self.aborted and self.abort_rate and self.total >= self.min_rows
+                    and self.window_rate < self.abort_rate):
+                self.aborted = True
+                self.logger.error(f"{self.carrier} 유효율 급락 ({self.window_rate:.1f}% < {self.abort_rate:.0f}%), "
+                                  f"남은 작업 중단")
+        
+        return valid_rows
+    
+    @property
+    def validation_rate(self) -> float:
+        """전체 유효율 (%)"""
+        return self.valid / self.total * 100 if self.total else 100.0
+    
+    @property
+    def window_rate(self) -> float:
+        """최근 window개 행 유효율 (%)"""
+        return self._recent_valid / len(self._recent) * 100 if self._recent else 100.0
+    
+    def stats(self) -> Dict:
+        """검증 현황 (validate_dataset 결과와 같은 형식 + 최근 유효율)"""
+        with self._lock:
+            return {
+                'total': self.total,
+                'valid': self.valid,
+                'invalid': self.total - self.valid,
+                'error_summary': dict(self.error_summary),
+                'validation_rate': self.validation_rate,
+                'window_rate': self.window_rate,
+                'aborted': self.aborted
+            }
+
+
 class SKTCrawler:
     """SKT T world 크롤러 (v2.0 기반)"""
     
     def __init__(self, config=None):
         self.logger = loggers['skt']
         self.base_url = "https://shop.tworld.co.kr"
-        self.all_data = []
+        self.all_data = ColumnarRows()  # 컬럼 단위 저장 (반복 문자열 intern)
         self.data_lock = threading.Lock()
         self.rate_plans = []
         self.categories = []
@@ -224,17 +484,33 @@ class SKTCrawler:
             'retry_count': 3,
             'page_load_timeout': 30,
             'max_rate_plans': 0,
-            'show_browser': False
+            'show_browser': False,
+            'base_url': None  # 사이트 주소 대체 (로컬 벤치마크 픽스처 등, None = 실제 사이트)
         }
         
         if config:
             self.config.update(config)
+        if self.config.get('base_url'):
+            self.base_url = self.config['base_url'].rstrip('/')
         
         self.completed_count = 0
         self.failed_count = 0
         self.total_devices = 0
         self.all_combinations = []
         
+        # 세그먼트 체크포인트 (통합 크롤러가 설정)
+        self.checkpoint = None
+        self.crawl_completed = False
+        self.restored_count = 0  # 체크포인트에서 복원한 행 수 (데이터 앞쪽, 수집 중 검증을 거치지 않음)
+        self.copied_count = 0  # 가입유형 복제 행 수 (데이터 뒤쪽)
+        
+        # 수집 중 검증 (통합 크롤러가 설정)
+        self.stream_validator = None
+        
+        # 단계별 소요 시간 계측
+        self.timer = StageTimer('SKT')
+        
+    @timed('driver_launch')
     def setup_driver(self):
         """Chrome 드라이버 설정"""
         options = Options()
@@ -261,6 +537,7 @@ class SKTCrawler:
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(self.config['page_load_timeout'])
         driver.implicitly_wait(5)
+        self.timer.increment(DRIVERS_STARTED)
         
         return driver
     
@@ -270,9 +547,10 @@ class SKTCrawler:
         driver = self.setup_driver()
         
         try:
-            url = "https://shop.tworld.co.kr/wireless/product/subscription/list"
-            driver.get(url)
-            time.sleep(5)
+            url = f"{self.base_url}/wireless/product/subscription/list"
+            with self.timer.span('page_load'):
+                driver.get(url)
+                time.sleep(5)
             
             # 카테고리 수집
             self.collect_categories(driver)
@@ -305,6 +583,7 @@ class SKTCrawler:
             
         finally:
             driver.quit()
+            self.timer.increment(DRIVERS_CLOSED)
     
     def collect_categories(self, driver):
         """카테고리 목록 수집"""
@@ -408,11 +687,25 @@ class SKTCrawler:
         
         self.logger.info(f"총 {len(self.all_combinations)}개 조합 준비 완료")
     
+    def _combination_key(self, combo):
+        """세그먼트 키 (요금제ID|네트워크|가입유형)"""
+        return f"{combo['plan']['id']}|{combo['network']['code']}|{combo['scrb_type']['value']}"
+    
     def process_combination(self, combo_index):
+        """단일 조합 처리 (작업 단위 시간 계측)"""
+        combo = self.all_combinations[combo_index]
+        with self.timer.job(f"{combo['plan']['name']} - {combo['network']['name']}"):
+            return self._process_combination(combo_index)
+    
+    def _process_combination(self, combo_index):
         """단일 조합 처리"""
         combo = self.all_combinations[combo_index]
         driver = None
         
+        # 유효율 급락으로 중단된 경우 남은 조합 건너뜀
+        if self.stream_validator and self.stream_validator.aborted:
+            return False
+        
         try:
             driver = self.setup_driver()
             
@@ -429,11 +722,24 @@ class SKTCrawler:
             }
             url = f"{self.base_url}/notice?{urlencode(params, quote_via=quote_plus)}"
             
-            driver.get(url)
-            time.sleep(2)
+            with self.timer.span('page_load'):
+                driver.get(url)
+                time.sleep(2)
             
             # 데이터 수집
-            items_count = self._collect_all_pages_data(driver, combo)
+            combo_rows = self._collect_all_pages_data(driver, combo)
+            
+            # 수집 중 검증 (무효 행 제외, 가격/시간 보정)
+            if self.stream_validator:
+                combo_rows = self.stream_validator.process(combo_rows)
+            items_count = len(combo_rows)
+            
+            with self.data_lock:
+                self.all_data.extend(combo_rows)
+            
+            # 세그먼트 체크포인트 기록
+            if combo_rows and self.checkpoint:
+                self.checkpoint.write(self._combination_key(combo), combo_rows)
             
             with self.data_lock:
                 if items_count > 0:
@@ -441,6 +747,8 @@ class SKTCrawler:
                     self.total_devices += items_count
                 else:
                     self.failed_count += 1
+            self.timer.increment(JOBS_COMPLETED if items_count > 0 else JOBS_FAILED)
+            self.timer.increment(ROWS_COLLECTED, items_count)
             
             return True
             
@@ -448,15 +756,17 @@ class SKTCrawler:
             self.logger.error(f"처리 오류: {str(e)}")
             with self.data_lock:
                 self.failed_count += 1
+            self.timer.increment(JOBS_FAILED)
             return False
             
         finally:
             if driver:
                 driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
     
     def _collect_all_pages_data(self, driver, combo):
-        """모든 페이지 데이터 수집"""
-        all_items = 0
+        """모든 페이지 데이터 수집 (조합에서 수집한 행 목록 반환)"""
+        all_items = []
         current_page = 1
         max_pages = 10
         
@@ -466,9 +776,10 @@ class SKTCrawler:
             if not items:
                 break
                 
-            all_items += len(items)
+            all_items.extend(items)
             
             # 다음 페이지 확인
+            pagination_start = time.perf_counter()
             try:
                 pagination = driver.find_element(By.CSS_SELECTOR, ".pagination, .paginate, .paging")
                 
@@ -487,9 +798,12 @@ class SKTCrawler:
                     
             except:
                 break
+            finally:
+                self.timer.record('pagination', time.perf_counter() - pagination_start)
         
         return all_items
     
+    @timed('extract')
     def _collect_current_page_data(self, driver, combo):
         """현재 페이지 데이터 수집"""
         items = []
@@ -534,9 +848,6 @@ class SKTCrawler:
                             }
                             items.append(item)
                             
-                            with self.data_lock:
-                                self.all_data.append(item)
-                            
         except Exception as e:
             self.logger.debug(f"페이지 데이터 수집 오류: {e}")
         
@@ -544,38 +855,29 @@ class SKTCrawler:
     
     def clean_price(self, price_str):
         """가격 정리"""
-        if not price_str:
-            return 0
-        import re
-        cleaned = re.sub(r'[^0-9]', '', str(price_str))
-        try:
-            return int(cleaned) if cleaned else 0
-        except:
-            return 0
+        return parse_price(price_str)
     
     def get_manufacturer(self, device_name):
         """제조사 추출"""
-        name_lower = device_name.lower()
-        if '갤럭시' in name_lower or 'galaxy' in name_lower:
-            return '삼성'
-        elif '아이폰' in name_lower or 'iphone' in name_lower:
-            return '애플'
-        elif 'lg' in name_lower:
-            return 'LG'
-        elif '샤오미' in name_lower or 'xiaomi' in name_lower:
-            return '샤오미'
-        elif '모토로라' in name_lower:
-            return '모토로라'
-        else:
-            return '기타'
+        return classify_manufacturer(device_name)
     
     def run_parallel_crawling(self):
         """병렬 크롤링 실행"""
         self.logger.info("SKT 병렬 크롤링 시작...")
         
+        # 체크포인트에 있는 조합은 복원 후 건너뜀
+        pending = list(range(len(self.all_combinations)))
+        if self.checkpoint:
+            restored = self.checkpoint.load_rows()
+            self.all_data.extend(restored)
+            self.restored_count = len(restored)
+            pending = [i for i in pending if not self.checkpoint.has(self._combination_key(self.all_combinations[i]))]
+            if restored:
+                self.logger.info(f"SKT 체크포인트 복원: {len(restored)}개 데이터, 남은 조합 {len(pending)}개")
+        
         with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
             futures = []
-            for i in range(len(self.all_combinations)):
+            for i in pending:
                 future = executor.submit(self.process_combination, i)
                 futures.append(future)
             
@@ -603,6 +905,16 @@ class SKTCrawler:
                 new_item = item.copy()
                 new_item['가입유형'] = scrb_type['name']
                 self.all_data.append(new_item)
+        self.copied_count = len(self.all_data) - len(original_data)
+        
+        if self.timer.profiler:
+            self.timer.profiler.checkpoint('SKT 가입유형 복제', all_data=self.all_data, original_data=original_data)
+    
+    def restore_completed(self, rows: List[dict]) -> List[dict]:
+        """완료된 체크포인트 복원 (세그먼트에는 기기변경 행만 있으므로 가입유형 복제를 다시 적용)"""
+        self.all_data = ColumnarRows(rows)
+        self._duplicate_data_for_other_types()
+        return self.all_data
     
     def crawl(self):
         """SKT 크롤링 실행"""
@@ -620,6 +932,7 @@ class SKTCrawler:
             # 3. 병렬 크롤링
             self.run_parallel_crawling()
             
+            self.crawl_completed = not (self.stream_validator and self.stream_validator.aborted)
             return self.all_data
             
         except Exception as e:
@@ -634,7 +947,7 @@ class KTCrawler:
     def __init__(self, config=None):
         self.logger = loggers['kt']
         self.base_url = "https://shop.kt.com/smart/supportAmtList.do"
-        self.data = []
+        self.data = ColumnarRows()  # 컬럼 단위 저장 (반복 문자열 intern)
         self.data_lock = threading.Lock()
         
         # 기본 설정
@@ -645,17 +958,32 @@ class KTCrawler:
             'max_workers': 3,
             'retry_count': 2,
             'max_rate_plans': 0,
-            'show_browser': False
+            'show_browser': False,
+            'base_url': None  # 공시지원금 페이지 주소 대체 (None = 실제 사이트)
         }
         
         if config:
             self.config.update(config)
+        if self.config.get('base_url'):
+            self.base_url = self.config['base_url']
         
         self.all_plans = []
         self.completed_count = 0
         self.failed_count = 0
         self.total_products = 0
         
+        # 세그먼트 체크포인트 (통합 크롤러가 설정)
+        self.checkpoint = None
+        self.crawl_completed = False
+        self.restored_count = 0  # 체크포인트에서 복원한 행 수 (데이터 앞쪽, 수집 중 검증을 거치지 않음)
+        
+        # 수집 중 검증 (통합 크롤러가 설정)
+        self.stream_validator = None
+        
+        # 단계별 소요 시간 계측
+        self.timer = StageTimer('KT')
+        
+    @timed('driver_launch')
     def create_driver(self):
         """Chrome 드라이버 생성"""
         chrome_options = Options()
@@ -681,6 +1009,7 @@ class KTCrawler:
         driver.maximize_window()
         driver.set_page_load_timeout(self.config['page_load_timeout'])
         driver.implicitly_wait(3)
+        self.timer.increment(DRIVERS_STARTED)
         
         return driver
     
@@ -690,8 +1019,9 @@ class KTCrawler:
         driver = self.create_driver()
         
         try:
-            driver.get(self.base_url)
-            time.sleep(3)
+            with self.timer.span('page_load'):
+                driver.get(self.base_url)
+                time.sleep(3)
             
             # 팝업 처리
             self.handle_alert(driver)
@@ -724,6 +1054,7 @@ class KTCrawler:
             
         finally:
             driver.quit()
+            self.timer.increment(DRIVERS_CLOSED)
     
     def handle_alert(self, driver):
         """Alert 처리"""
@@ -746,6 +1077,7 @@ class KTCrawler:
             });
         """)
     
+    @timed('modal')
     def _open_plan_modal(self, driver):
         """요금제 모달 열기"""
         try:
@@ -877,19 +1209,34 @@ class KTCrawler:
         except:
             pass
     
+    def _plan_key(self, plan):
+        """세그먼트 키 (요금제 유형|요금제ID)"""
+        return f"{plan['plan_type']}|{plan.get('id') or plan['name']}"
+    
     def process_plan(self, plan_index):
+        """단일 요금제 처리 (작업 단위 시간 계측)"""
+        plan = self.all_plans[plan_index]
+        with self.timer.job(f"{plan['plan_type']} - {plan['name']}"):
+            return self._process_plan(plan_index)
+    
+    def _process_plan(self, plan_index):
         """단일 요금제 처리"""
         plan = self.all_plans[plan_index]
         driver = None
         
+        # 유효율 급락으로 중단된 경우 남은 요금제 건너뜀
+        if self.stream_validator and self.stream_validator.aborted:
+            return False
+        
         try:
             driver = self.create_driver()
             
             # 페이지 로드
-            driver.get(self.base_url)
-            time.sleep(3)
-            self.handle_alert(driver)
-            self._close_popups(driver)
+            with self.timer.span('page_load'):
+                driver.get(self.base_url)
+                time.sleep(3)
+                self.handle_alert(driver)
+                self._close_popups(driver)
             
             # 모달 열기
             if not self._open_plan_modal(driver):
@@ -903,29 +1250,43 @@ class KTCrawler:
             # 데이터 수집
             products = self._collect_products(driver, plan)
             
+            # 수집 중 검증 (무효 행 제외, 가격/시간 보정)
+            if self.stream_validator:
+                products = self.stream_validator.process(products)
+            
             if products:
                 with self.data_lock:
                     self.data.extend(products)
                     self.total_products += len(products)
                     self.completed_count += 1
+                self.timer.increment(JOBS_COMPLETED)
+                self.timer.increment(ROWS_COLLECTED, len(products))
+                
+                # 세그먼트 체크포인트 기록
+                if self.checkpoint:
+                    self.checkpoint.write(self._plan_key(plan), products)
                 
                 self.logger.info(f"✓ {plan['name']}: {len(products)}개")
                 return True
             else:
                 with self.data_lock:
                     self.failed_count += 1
+                self.timer.increment(JOBS_FAILED)
                 return False
                 
         except Exception as e:
             self.logger.error(f"처리 오류: {str(e)}")
             with self.data_lock:
                 self.failed_count += 1
+            self.timer.increment(JOBS_FAILED)
             return False
             
         finally:
             if driver:
                 driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
     
+    @timed('plan_select')
     def _select_plan(self, driver, plan):
         """요금제 선택"""
         try:
@@ -999,6 +1360,7 @@ class KTCrawler:
         while page <= max_pages:
             try:
                 # 현재 페이지 데이터 추출
+                extract_start = time.perf_counter()
                 products = driver.execute_script("""
                     const products = [];
                     const items = document.querySelectorAll('#prodList > li');
@@ -1025,9 +1387,7 @@ class KTCrawler:
                                 public_support_fee: extractPrice(fullText, '공시지원금'),
                                 additional_support_fee: extractPrice(fullText, '추가지원금'),
                                 device_discount_24: extractPrice(fullText, '단말할인'),
-                                plan_discount_24: extractPrice(fullText, '요금할인'),
-                                manufacturer: deviceName.includes('갤럭시') ? '삼성' : 
-                                             deviceName.includes('아이폰') ? '애플' : '기타'
+                                plan_discount_24: extractPrice(fullText, '요금할인')
                             };
                             
                             if (data.public_support_fee === 0 && data.device_discount_24 > 0) {
@@ -1059,7 +1419,7 @@ class KTCrawler:
                             '요금제': plan['name'],
                             '월요금': plan.get('monthlyFee', 0),
                             '기기명': product['device_name'],
-                            '제조사': product['manufacturer'],
+                            '제조사': classify_manufacturer(product['device_name']),
                             '출고가': product['release_price'],
                             '공시지원금': product['public_support_fee'],
                             '추가지원금': product['additional_support_fee'],
@@ -1069,12 +1429,15 @@ class KTCrawler:
                         }
                         new_products.append(unified_product)
                 
+                self.timer.record('extract', time.perf_counter() - extract_start)
+                
                 if not new_products:
                     break
                 
                 all_products.extend(new_products)
                 
                 # 다음 페이지로 이동
+                pagination_start = time.perf_counter()
                 next_clicked = driver.execute_script(f"""
                     const pageWrap = document.querySelector('.pageWrap');
                     if (!pageWrap) return false;
@@ -1093,6 +1456,7 @@ class KTCrawler:
                 
                 page += 1
                 time.sleep(1)
+                self.timer.record('pagination', time.perf_counter() - pagination_start)
                 
             except Exception as e:
                 self.logger.debug(f"페이지 {page} 수집 오류: {e}")
@@ -1104,9 +1468,20 @@ class KTCrawler:
         """병렬 크롤링 실행"""
         self.logger.info("KT 병렬 크롤링 시작...")
         
+        # 체크포인트에 있는 요금제는 복원 후 건너뜀
+        pending = list(range(len(self.all_plans)))
+        if self.checkpoint:
+            restored = self.checkpoint.load_rows()
+            self.data.extend(restored)
+            self.restored_count = len(restored)
+            self.total_products += len(restored)
+            pending = [i for i in pending if not self.checkpoint.has(self._plan_key(self.all_plans[i]))]
+            if restored:
+                self.logger.info(f"KT 체크포인트 복원: {len(restored)}개 데이터, 남은 요금제 {len(pending)}개")
+        
         with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
             futures = []
-            for i in range(len(self.all_plans)):
+            for i in pending:
                 future = executor.submit(self.process_plan, i)
                 futures.append(future)
             
@@ -1131,6 +1506,7 @@ class KTCrawler:
             # 2. 병렬 크롤링
             self.run_parallel_crawling()
             
+            self.crawl_completed = not (self.stream_validator and self.stream_validator.aborted)
             return self.data
             
         except Exception as e:
@@ -1146,7 +1522,7 @@ class LGCrawler:
         self.logger = loggers['lg']
         self.base_url = "https://www.lguplus.com/mobile/financing-model"
         self.driver = None
-        self.data = []
+        self.data = ColumnarRows()  # 컬럼 단위 저장 (반복 문자열 intern)
         self.wait = None
         
         # 기본 설정
@@ -1159,17 +1535,32 @@ class LGCrawler:
             'delay_between_actions': 2,
             'max_rate_plans': 0,
             'max_pages': 20,
-            'show_browser': False
+            'show_browser': False,
+            'base_url': None  # 지원금 페이지 주소 대체 (None = 실제 사이트)
         }
         
         if config:
             self.config.update(config)
+        if self.config.get('base_url'):
+            self.base_url = self.config['base_url']
         
         self.rate_plan_price_cache = {}
         self.all_rate_plans = defaultdict(dict)
         self.total_tasks = 0
         self.completed_tasks = 0
         
+        # 세그먼트 체크포인트 (통합 크롤러가 설정)
+        self.checkpoint = None
+        self.crawl_completed = False
+        self.restored_count = 0  # 체크포인트에서 복원한 행 수 (데이터 앞쪽, 수집 중 검증을 거치지 않음)
+        
+        # 수집 중 검증 (통합 크롤러가 설정)
+        self.stream_validator = None
+        
+        # 단계별 소요 시간 계측
+        self.timer = StageTimer('LG U+')
+        
+    @timed('driver_launch')
     def setup_driver(self):
         """Chrome 드라이버 설정"""
         chrome_options = Options()
@@ -1209,6 +1600,7 @@ class LGCrawler:
         })
         
         self.wait = WebDriverWait(self.driver, self.config['element_wait_timeout'])
+        self.timer.increment(DRIVERS_STARTED)
         self.logger.info("Chrome 드라이버 설정 완료")
         
     def get_wait_time(self, base_time: float) -> float:
@@ -1231,6 +1623,7 @@ class LGCrawler:
         except Exception as e:
             self.logger.debug(f"페이지 대기 중 타임아웃: {e}")
             
+    @timed('modal')
     def check_and_handle_modal(self, max_attempts=3) -> bool:
         """모달 확인 및 처리"""
         for attempt in range(max_attempts):
@@ -1325,6 +1718,7 @@ class LGCrawler:
             except Exception as e:
                 if retry < max_retries - 1:
                     self.logger.debug(f"{name} 선택 재시도 ({retry + 1}/{max_retries})")
+                    self.timer.increment(RETRIES)
                     time.sleep(self.get_wait_time(1))
                     continue
                 else:
@@ -1409,6 +1803,7 @@ class LGCrawler:
             self.logger.error(f"테이블 대기 중 오류: {e}")
             return False
     
+    @timed('extract')
     def extract_table_data(self, subscription_type: str, device_type: str, rate_plan_name: str = "전체", 
                           rate_plan_id: str = None, monthly_price: str = "0") -> int:
         """테이블 데이터 추출"""
@@ -1486,16 +1881,11 @@ class LGCrawler:
             """)
             
             # 추출된 데이터를 통합 형식으로 변환
+            page_rows = []
             for item in extracted_data:
                 # 제조사 추출
                 device_name = item['device']
-                manufacturer = '기타'
-                if '갤럭시' in device_name.lower() or 'galaxy' in device_name.lower():
-                    manufacturer = '삼성'
-                elif '아이폰' in device_name.lower() or 'iphone' in device_name.lower():
-                    manufacturer = '애플'
-                elif 'lg' in device_name.lower():
-                    manufacturer = 'LG'
+                manufacturer = classify_manufacturer(device_name)
                 
                 unified_data = {
                     '통신사': 'LG U+',
@@ -1503,22 +1893,28 @@ class LGCrawler:
                     '네트워크': device_type,
                     '요금제_카테고리': device_type,
                     '요금제': rate_plan_name,
-                    '월요금': int(monthly_price) if monthly_price != "0" else 0,
+                    '월요금': parse_price(monthly_price),
                     '기기명': item['device'],
                     '제조사': manufacturer,
-                    '출고가': int(item['price']) if item['price'] else 0,
-                    '공시지원금': int(item['subsidy']) if item['subsidy'] else 0,
-                    '추가지원금': int(item['additionalSubsidy']) if item['additionalSubsidy'] else 0,
-                    '총지원금': int(item['totalSubsidy']) if item['totalSubsidy'] else 0,
+                    '출고가': parse_price(item['price']),
+                    '공시지원금': parse_price(item['subsidy']),
+                    '추가지원금': parse_price(item['additionalSubsidy']),
+                    '총지원금': parse_price(item['totalSubsidy']),
                     '공시일자': item['date'],
                     '크롤링시간': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                     '요금제유지기간': item['planDuration'],
-                    '추천할인': int(item['recommendedDiscount']) if item['recommendedDiscount'] else 0,
-                    '최종구매가': int(item['finalPrice']) if item['finalPrice'] else 0
+                    '추천할인': parse_price(item['recommendedDiscount']),
+                    '최종구매가': parse_price(item['finalPrice'])
                 }
                 
-                self.data.append(unified_data)
+                page_rows.append(unified_data)
                 extracted_count += 1
+            
+            # 수집 중 검증 (무효 행 제외, 가격/시간 보정)
+            if self.stream_validator:
+                page_rows = self.stream_validator.process(page_rows)
+            self.data.extend(page_rows)
+            self.timer.increment(ROWS_COLLECTED, len(page_rows))
                 
             self.logger.info(f"페이지에서 {extracted_count}개 데이터 추출")
             return extracted_count
@@ -1559,6 +1955,7 @@ class LGCrawler:
                     break
                     
                 # 다음 페이지 확인
+                pagination_start = time.perf_counter()
                 has_next = self.driver.execute_script("""
                     var pagination = document.querySelector('ul.pagination, div.pagination, nav[aria-label="pagination"]');
                     if (!pagination) return false;
@@ -1592,6 +1989,7 @@ class LGCrawler:
                     self.logger.info(f"다음 페이지로 이동 (페이지 {page + 1})")
                     time.sleep(self.get_wait_time(3))
                     self.wait_for_page_ready()
+                    self.timer.record('pagination', time.perf_counter() - pagination_start)
                     page += 1
                 else:
                     self.logger.info(f"마지막 페이지 도달 (페이지 {page})")
@@ -1708,9 +2106,10 @@ class LGCrawler:
             for sub_value, sub_name in subscription_types:
                 try:
                     # 페이지 로드
-                    self.driver.get(self.base_url)
-                    self.wait_for_page_ready()
-                    time.sleep(self.get_wait_time(1))
+                    with self.timer.span('page_load'):
+                        self.driver.get(self.base_url)
+                        self.wait_for_page_ready()
+                        time.sleep(self.get_wait_time(1))
                     
                     # 옵션 선택
                     if not self.select_option('가입유형', sub_value):
@@ -1772,6 +2171,14 @@ class LGCrawler:
         # 전체 요금제 리스트 사전 수집
         self.collect_all_rate_plans()
         
+        # 체크포인트에 있는 조합 복원 (해당 요금제는 건너뜀)
+        if self.checkpoint:
+            restored = self.checkpoint.load_rows()
+            self.data.extend(restored)
+            self.restored_count = len(restored)
+            if restored:
+                self.logger.info(f"LG U+ 체크포인트 복원: {len(restored)}개 데이터")
+        
         self.logger.info("LG U+ 요금제별 상세 크롤링 시작")
         self._crawl_with_rate_plans(subscription_types, device_types)
     
@@ -1791,77 +2198,99 @@ class LGCrawler:
                 
                 # 각 요금제별로 크롤링
                 for i, rate_plan in enumerate(rate_plans):
+                    # 유효율 급락으로 중단된 경우 남은 요금제 건너뜀
+                    if self.stream_validator and self.stream_validator.aborted:
+                        return
+                    
+                    segment_key = f"{sub_value}|{dev_value}|{rate_plan['id']}"
+                    if self.checkpoint and self.checkpoint.has(segment_key):
+                        self.logger.debug(f"체크포인트에 있는 요금제 건너뜀: {rate_plan['name']}")
+                        continue
+                    
                     self.logger.info(f"요금제 ({i+1}/{len(rate_plans)}): {rate_plan['name']}")
+                    segment_start = len(self.data)
                     
-                    try:
-                        # 페이지 새로고침
-                        self.driver.get(self.base_url)
-                        self.wait_for_page_ready()
-                        time.sleep(self.get_wait_time(3))
+                    with self.timer.job(f"{sub_name} - {dev_name} - {rate_plan['name']}"):
+                        try:
+                            # 페이지 새로고침
+                            with self.timer.span('page_load'):
+                                self.driver.get(self.base_url)
+                                self.wait_for_page_ready()
+                                time.sleep(self.get_wait_time(3))
                         
-                        # 옵션 재선택
-                        self.select_option('가입유형', sub_value)
-                        self.select_option('기기종류', dev_value)
+                            # 옵션 재선택
+                            self.select_option('가입유형', sub_value)
+                            self.select_option('기기종류', dev_value)
                         
-                        # 요금제 선택
-                        if self.open_rate_plan_modal():
-                            # JavaScript로 요금제 선택
-                            selected = self.driver.execute_script("""
-                                var radio = document.querySelector('input[id="' + arguments[0] + '"]');
-                                if (radio && !radio.checked) {
-                                    radio.checked = true;
-                                    var event = new Event('change', { bubbles: true });
-                                    radio.dispatchEvent(event);
+                            # 요금제 선택
+                            plan_select_start = time.perf_counter()
+                            if self.open_rate_plan_modal():
+                                # JavaScript로 요금제 선택
+                                selected = self.driver.execute_script("""
+                                    var radio = document.querySelector('input[id="' + arguments[0] + '"]');
+                                    if (radio && !radio.checked) {
+                                        radio.checked = true;
+                                        var event = new Event('change', { bubbles: true });
+                                        radio.dispatchEvent(event);
                                     
-                                    var label = document.querySelector('label[for="' + arguments[0] + '"]');
-                                    if (label) label.click();
+                                        var label = document.querySelector('label[for="' + arguments[0] + '"]');
+                                        if (label) label.click();
                                     
-                                    return true;
-                                }
-                                return false;
-                            """, rate_plan["id"])
+                                        return true;
+                                    }
+                                    return false;
+                                """, rate_plan["id"])
                             
-                            if not selected:
-                                self.logger.error(f"요금제 선택 실패: {rate_plan['name']}")
-                                continue
+                                if not selected:
+                                    self.logger.error(f"요금제 선택 실패: {rate_plan['name']}")
+                                    self.timer.increment(JOBS_FAILED)
+                                    continue
                             
-                            time.sleep(self.get_wait_time(1))
+                                time.sleep(self.get_wait_time(1))
                             
-                            # 적용 버튼 클릭
-                            applied = self.driver.execute_script("""
-                                var applyBtn = document.querySelector('button.c-btn-solid-1-m');
-                                if (applyBtn) {
-                                    applyBtn.click();
-                                    return true;
-                                }
-                                return false;
-                            """)
+                                # 적용 버튼 클릭
+                                applied = self.driver.execute_script("""
+                                    var applyBtn = document.querySelector('button.c-btn-solid-1-m');
+                                    if (applyBtn) {
+                                        applyBtn.click();
+                                        return true;
+                                    }
+                                    return false;
+                                """)
                             
-                            if not applied:
-                                self.logger.error("적용 버튼을 찾을 수 없습니다")
-                                continue
+                                if not applied:
+                                    self.logger.error("적용 버튼을 찾을 수 없습니다")
+                                    self.timer.increment(JOBS_FAILED)
+                                    continue
                                 
-                            time.sleep(self.get_wait_time(3))
+                                time.sleep(self.get_wait_time(3))
+                            self.timer.record('plan_select', time.perf_counter() - plan_select_start)
                             
-                        # 제조사 전체 선택
-                        if not self.select_all_manufacturers():
-                            self.logger.error("제조사 전체 선택 실패")
-                            continue
+                            # 제조사 전체 선택
+                            if not self.select_all_manufacturers():
+                                self.logger.error("제조사 전체 선택 실패")
+                                self.timer.increment(JOBS_FAILED)
+                                continue
                         
-                        # 데이터 로딩 대기
-                        time.sleep(self.get_wait_time(3))
+                            # 데이터 로딩 대기
+                            time.sleep(self.get_wait_time(3))
                         
-                        # 데이터 추출
-                        extracted = self.handle_pagination(sub_name, dev_name, rate_plan['name'], 
-                                                         rate_plan.get('value'), "0")
+                            # 데이터 추출
+                            extracted = self.handle_pagination(sub_name, dev_name, rate_plan['name'], 
+                                                             rate_plan.get('value'), "0")
                         
-                        if extracted > 0:
-                            self.logger.info(f"✓ {rate_plan['name']}: {extracted}개 데이터 수집 성공")
-                        else:
-                            self.logger.warning(f"데이터 추출 실패: {rate_plan['name']}")
+                            if extracted > 0:
+                                self.logger.info(f"✓ {rate_plan['name']}: {extracted}개 데이터 수집 성공")
+                                self.timer.increment(JOBS_COMPLETED)
+                                if self.checkpoint:
+                                    self.checkpoint.write(segment_key, self.data[segment_start:])
+                            else:
+                                self.logger.warning(f"데이터 추출 실패: {rate_plan['name']}")
+                                self.timer.increment(JOBS_FAILED)
                             
-                    except Exception as e:
-                        self.logger.error(f"요금제별 크롤링 오류: {e}")
+                        except Exception as e:
+                            self.logger.error(f"요금제별 크롤링 오류: {e}")
+                            self.timer.increment(JOBS_FAILED)
     
     def crawl(self):
         """LG U+ 크롤링 실행"""
@@ -1871,14 +2300,16 @@ class LGCrawler:
             
             # 초기 페이지 로드
             self.logger.info(f"페이지 로딩: {self.base_url}")
-            self.driver.get(self.base_url)
-            self.wait_for_page_ready()
-            time.sleep(self.get_wait_time(3))
+            with self.timer.span('page_load'):
+                self.driver.get(self.base_url)
+                self.wait_for_page_ready()
+                time.sleep(self.get_wait_time(3))
             
             # 크롤링 실행
             self.crawl_all_combinations()
             
             self.logger.info(f"LG U+ 크롤링 완료: {len(self.data)}개 데이터 수집")
+            self.crawl_completed = not (self.stream_validator and self.stream_validator.aborted)
             return self.data
             
         except Exception as e:
@@ -1889,6 +2320,7 @@ class LGCrawler:
         finally:
             if self.driver:
                 self.driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
                 self.logger.info("드라이버 종료")
 
 
@@ -1901,6 +2333,7 @@ class UnifiedTelecomCrawler:
             'headless': True,
             'test_mode': False,
             'save_formats': ['excel', 'csv', 'json'],
+            'jsonl_compression': None,  # JSONL 압축 (None, 'gzip', 'zstd')
             'output_dir': 'data',
             'checkpoint_dir': 'checkpoints',
             'enable_skt': True,
@@ -1914,7 +2347,19 @@ class UnifiedTelecomCrawler:
             'lg_max_pages': 20,
             'show_browser': False,
             'debug_mode': False,
-            'validate_data': True
+            'validate_data': True,
+            'stream_validation': True,  # 수집 중 행 단위 검증 (validate_data가 켜진 경우)
+            'abort_validity_rate': 50.0,  # 최근 유효율이 이 값(%) 미만이면 해당 통신사 중단 (0 = 중단 안 함)
+            'resume': False,  # 세그먼트 체크포인트에서 이어서 수집
+            'history_db': None,  # 이력 저장소 경로 (None = 사용 안 함)
+            'device_aliases': None,  # 기기 별칭/모델코드 테이블 경로 (None = 기본 별칭만)
+            'metrics_file': None,  # 단계별 메트릭 JSON 경로 (None = output_dir에 자동 생성)
+            'metrics_port': None,  # 실행 중 /metrics 엔드포인트 포트 (None = 사용 안 함)
+            'metrics_textfile': None,  # Prometheus textfile collector 경로 (.prom, None = 사용 안 함)
+            'metrics_interval': 15.0,  # textfile 갱신 간격 (초)
+            'profile': False,  # 작업별 cProfile 병합 리포트 저장
+            'profile_memory': False,  # 체크포인트마다 tracemalloc 스냅샷 (profile 포함)
+            'profile_sort': 'cumulative'  # 프로파일 리포트 정렬 기준
         }
         
         if config:
@@ -1924,8 +2369,8 @@ class UnifiedTelecomCrawler:
         os.makedirs(self.config['output_dir'], exist_ok=True)
         os.makedirs(self.config['checkpoint_dir'], exist_ok=True)
         
-        # 데이터 저장소
-        self.all_data = []
+        # 데이터 저장소 (통신사 크롤러 결과를 컬럼 단위로 이어 붙임)
+        self.all_data = ColumnarRows()
         self.data_by_carrier = {
             'SKT': [],
             'KT': [],
@@ -1944,13 +2389,50 @@ class UnifiedTelecomCrawler:
         }
         
         # 검증기
-        self.validator = DataValidator()
+        self.validator = VectorizedDataValidator()
+        
+        # 통신사별 수집 중 검증기
+        self.stream_validators = {}
+        if self.config.get('validate_data', True) and self.config.get('stream_validation', True):
+            self.stream_validators = {
+                carrier: StreamingValidator(carrier, self.validator,
+                                            abort_rate=self.config.get('abort_validity_rate', 50.0))
+                for carrier in self.data_by_carrier
+            }
         
-        # 체크포인트 파일
-        self.checkpoint_file = os.path.join(
-            self.config['checkpoint_dir'], 
-            'unified_checkpoint.pkl'
-        )
+        # 통신사별 수집 중 검증을 통과한 구간 (데이터 내 [시작, 끝) 위치, 수집 후 검증에서 건너뜀)
+        self.stream_validated = {}
+        
+        # 실행 간 이력 저장소
+        self.history_store = HistoryStore(self.config['history_db']) if self.config.get('history_db') else None
+        
+        # 통신사 간 기기 식별 인덱스
+        self.device_index = DeviceIndex(self.config.get('device_aliases'))
+        
+        # 통신사별 단계 소요 시간 (crawl_carrier에서 크롤러 계측기를 등록)
+        self.stage_timers = {}
+        
+        # 요금제 제한/실패 없이 전체 수집을 마친 통신사 (이력 저장소에서 빠진 키를 닫을 수 있음)
+        self.full_crawl_carriers = set()
+        
+        # 실행 중 메트릭 노출 (통신사 라벨, 크롤링 시작 시 등록된 계측기부터 반영)
+        self.metrics_exporter = MetricsExporter(self.stage_timers,
+                                                port=self.config.get('metrics_port'),
+                                                textfile=self.config.get('metrics_textfile'),
+                                                interval=self.config.get('metrics_interval', 15.0))
+        
+        # 프로파일링 모드 (crawl_carrier에서 통신사 계측기에 연결 → 워커 작업마다 cProfile)
+        self.profiler = Profiler(self.config.get('profile', False),
+                                 memory=self.config.get('profile_memory', False),
+                                 sort=self.config.get('profile_sort', 'cumulative'),
+                                 worker_hint='--skt-workers 1 --kt-workers 1')
+        
+        # 통신사별 세그먼트 체크포인트 (resume이 아니면 crawl_all_carriers 시작 시 초기화)
+        segment_dir = os.path.join(self.config['checkpoint_dir'], 'segments')
+        self.carrier_checkpoints = {
+            carrier: SegmentCheckpoint(segment_dir, carrier)
+            for carrier in self.data_by_carrier
+        }
     
     def run_test_mode(self):
         """빠른 테스트 모드 실행"""
@@ -2089,27 +2571,75 @@ class UnifiedTelecomCrawler:
                 else:
                     print(f"{carrier}: 실패 - {result.get('error', '알 수 없는 오류')}")
     
-    def save_checkpoint(self, carrier: str, data: List[dict]):
-        """체크포인트 저장"""
+    def crawl_carrier(self, carrier: str, crawler) -> List[dict]:
+        """통신사 크롤링 (완료된 통신사는 체크포인트에서 복원, 진행 중이던 통신사는 남은 세그먼트만 수집)"""
+        checkpoint = self.carrier_checkpoints[carrier]
+        
+        if checkpoint.is_complete():
+            data = ColumnarRows(checkpoint.load_rows())
+            if hasattr(crawler, 'restore_completed'):
+                data = crawler.restore_completed(data)
+            if checkpoint.is_full_crawl():
+                self.full_crawl_carriers.add(carrier)
+            self.logger.info(f"{carrier} 체크포인트 복원: {len(data)}개 데이터 (크롤링 건너뜀)")
+            return data
+        
+        crawler.checkpoint = checkpoint
+        crawler.stream_validator = self.stream_validators.get(carrier)
+        self.stage_timers[carrier] = crawler.timer
+        if self.profiler.enabled:
+            crawler.timer.profiler = self.profiler
+        data = crawler.crawl()
+        self.profiler.checkpoint(f"{carrier} 수집 완료", data=data,
+                                 rate_plan_price_cache=getattr(crawler, 'rate_plan_price_cache', None))
+        
+        if crawler.stream_validator:
+            # 앞쪽 복원분과 뒤쪽 SKT 복사본을 뺀 나머지가 수집 중 검증을 거친 행
+            self.stream_validated[carrier] = (crawler.restored_count,
+                                              len(data) - getattr(crawler, 'copied_count', 0))
+            stats = crawler.stream_validator.stats()
+            self.logger.info(f"{carrier} 수집 중 검증: {stats['valid']:,}/{stats['total']:,} "
+                             f"({stats['validation_rate']:.1f}% 유효)")
+            if stats['aborted']:
+                self.logger.warning(f"{carrier} 유효율 급락으로 중단됨 - 체크포인트는 완료 처리하지 않음")
+        
+        # 실패한 작업은 세그먼트가 없으므로 완료 처리하지 않으면 --resume 시 다시 수집됨
+        failed_jobs = crawler.timer.counters().get(JOBS_FAILED, 0)
+        if crawler.crawl_completed and failed_jobs:
+            self.logger.warning(f"{carrier} 실패 작업 {failed_jobs:,}개 - 체크포인트는 완료 처리하지 않음 "
+                                f"(--resume 시 실패한 작업만 재시도)")
+        elif crawler.crawl_completed:
+            limited = bool(crawler.config.get('max_rate_plans'))
+            checkpoint.mark_complete(failed_jobs=failed_jobs, limited=limited)
+            if not limited:
+                self.full_crawl_carriers.add(carrier)
+        return data
+    
+    def clear_checkpoints(self):
+        """통신사별 세그먼트 체크포인트 삭제"""
+        for checkpoint in self.carrier_checkpoints.values():
+            checkpoint.clear()
+    
+    def record_history(self, carrier: str, data: List[dict]):
+        """통신사 수집 완료 시 이력 저장소에 기록"""
+        if not self.history_store or not data:
+            return
         try:
-            checkpoint_data = {
-                'carrier': carrier,
-                'data': data,
-                'timestamp': datetime.now().isoformat(),
-                'statistics': self.statistics
-            }
-            
-            with open(self.checkpoint_file, 'wb') as f:
-                pickle.dump(checkpoint_data, f)
-            
-            self.logger.debug(f"체크포인트 저장: {carrier}")
+            self.history_store.record_rows(data, carrier=carrier)
+            self.history_store.flush()
+            if carrier in self.full_crawl_carriers:
+                self.history_store.close_unseen(carrier)
         except Exception as e:
-            self.logger.error(f"체크포인트 저장 실패: {e}")
+            self.logger.error(f"이력 저장 실패 ({carrier}): {e}")
     
     def crawl_all_carriers(self):
         """모든 통신사 크롤링"""
         self.statistics['start_time'] = datetime.now()
         
+        # 이어서 수집하지 않으면 이전 실행의 세그먼트 삭제 (테스트 모드 등 다른 실행은 건드리지 않음)
+        if not self.config.get('resume'):
+            self.clear_checkpoints()
+        
         if RICH_AVAILABLE:
             # 전체 진행상황 표시
             layout = Layout()
@@ -2168,9 +2698,10 @@ class UnifiedTelecomCrawler:
                             'show_browser': self.config['show_browser']
                         })
                         
-                        skt_data = skt_crawler.crawl()
+                        skt_data = self.crawl_carrier('SKT', skt_crawler)
                         self.data_by_carrier['SKT'] = skt_data
                         self.all_data.extend(skt_data)
+                        self.record_history('SKT', skt_data)
                         
                         elapsed = time.time() - start_time
                         self.statistics['carrier_stats']['SKT'] = {
@@ -2205,9 +2736,10 @@ class UnifiedTelecomCrawler:
                             'show_browser': self.config['show_browser']
                         })
                         
-                        kt_data = kt_crawler.crawl()
+                        kt_data = self.crawl_carrier('KT', kt_crawler)
                         self.data_by_carrier['KT'] = kt_data
                         self.all_data.extend(kt_data)
+                        self.record_history('KT', kt_data)
                         
                         elapsed = time.time() - start_time
                         self.statistics['carrier_stats']['KT'] = {
@@ -2242,9 +2774,10 @@ class UnifiedTelecomCrawler:
                             'show_browser': self.config['show_browser']
                         })
                         
-                        lg_data = lg_crawler.crawl()
+                        lg_data = self.crawl_carrier('LG U+', lg_crawler)
                         self.data_by_carrier['LG U+'] = lg_data
                         self.all_data.extend(lg_data)
+                        self.record_history('LG U+', lg_data)
                         
                         elapsed = time.time() - start_time
                         self.statistics['carrier_stats']['LG U+'] = {
@@ -2275,9 +2808,10 @@ class UnifiedTelecomCrawler:
                 print("\nSKT 크롤링 중...")
                 try:
                     skt_crawler = SKTCrawler(self.config)
-                    skt_data = skt_crawler.crawl()
+                    skt_data = self.crawl_carrier('SKT', skt_crawler)
                     self.data_by_carrier['SKT'] = skt_data
                     self.all_data.extend(skt_data)
+                    self.record_history('SKT', skt_data)
                     print(f"SKT 완료: {len(skt_data)}개 데이터")
                 except Exception as e:
                     print(f"SKT 실패: {e}")
@@ -2286,9 +2820,10 @@ class UnifiedTelecomCrawler:
                 print("\nKT 크롤링 중...")
                 try:
                     kt_crawler = KTCrawler(self.config)
-                    kt_data = kt_crawler.crawl()
+                    kt_data = self.crawl_carrier('KT', kt_crawler)
                     self.data_by_carrier['KT'] = kt_data
                     self.all_data.extend(kt_data)
+                    self.record_history('KT', kt_data)
                     print(f"KT 완료: {len(kt_data)}개 데이터")
                 except Exception as e:
                     print(f"KT 실패: {e}")
@@ -2297,9 +2832,10 @@ class UnifiedTelecomCrawler:
                 print("\nLG U+ 크롤링 중...")
                 try:
                     lg_crawler = LGCrawler(self.config)
-                    lg_data = lg_crawler.crawl()
+                    lg_data = self.crawl_carrier('LG U+', lg_crawler)
                     self.data_by_carrier['LG U+'] = lg_data
                     self.all_data.extend(lg_data)
+                    self.record_history('LG U+', lg_data)
                     print(f"LG U+ 완료: {len(lg_data)}개 데이터")
                 except Exception as e:
                     print(f"LG U+ 실패: {e}")
@@ -2318,8 +2854,9 @@ class UnifiedTelecomCrawler:
         else:
             print("\n데이터 검증 및 정리 중...")
         
-        # 데이터 검증
-        valid_data, validation_result = self.validator.validate_dataset(self.all_data)
+        # 데이터 검증 (수집 중 검증을 통과한 행은 건너뛰고 체크포인트 복원분/SKT 복사본만 검증)
+        valid_data, validation_result = self._validate_unverified()
+        validation_result = self._merge_stream_validation(validation_result)
         
         self.statistics['valid_data'] = len(valid_data)
         self.statistics['invalid_data'] = validation_result['invalid']
@@ -2330,9 +2867,9 @@ class UnifiedTelecomCrawler:
         
         # 통신사별 재분류
         self.data_by_carrier = {
-            'SKT': [],
-            'KT': [],
-            'LG U+': []
+            'SKT': ColumnarRows(),
+            'KT': ColumnarRows(),
+            'LG U+': ColumnarRows()
         }
         
         for item in self.all_data:
@@ -2362,14 +2899,92 @@ class UnifiedTelecomCrawler:
             print(f"검증 완료: {validation_result['valid']}/{validation_result['total']} "
                   f"({validation_result['validation_rate']:.1f}% 유효)")
     
+    def _validate_unverified(self) -> Tuple[ColumnarRows, Dict]:
+        """
+        수집 중 검증을 거치지 않은 행만 검증
+        
+        통신사별 stream_validated 구간은 그대로 두고, 그 앞(체크포인트 복원분)과
+        뒤(SKT 가입유형 복사본) 행, 완료 체크포인트에서 통째로 복원한 통신사만 검증한다.
+        """
+        carrier_rows = self.data_by_carrier
+        if not self.stream_validated or sum(len(rows) for rows in carrier_rows.values()) != len(self.all_data):
+            valid_data, validation_result = self.validator.validate_dataset(self.all_data)
+            return ColumnarRows(valid_data), validation_result
+        
+        verified = {}
+        pending = ColumnarRows()
+        for carrier, rows in carrier_rows.items():
+            start, stop = self.stream_validated.get(carrier, (0, 0))
+            verified[carrier] = rows[start:stop]
+            pending.extend(rows[:start])
+            pending.extend(rows[stop:])
+        
+        skipped = len(self.all_data) - len(pending)
+        self.logger.info(f"수집 중 검증 통과 {skipped:,}개는 건너뛰고 {len(pending):,}개 검증")
+        valid_pending, validation_result = self.validator.validate_dataset(pending)
+        
+        # 통신사 순서 유지 (통신사별로 수집 중 검증 행 → 추가 검증 통과 행)
+        pending_by_carrier = defaultdict(list)
+        for row in valid_pending:
+            pending_by_carrier[row.get('통신사', '')].append(row)
+        valid_data = ColumnarRows()
+        for carrier in carrier_rows:
+            valid_data.extend(verified[carrier])
+            valid_data.extend(pending_by_carrier.pop(carrier, []))
+        for rows in pending_by_carrier.values():
+            valid_data.extend(rows)
+        
+        total = len(self.all_data)
+        validation_result = dict(validation_result)
+        validation_result.update({
+            'total': total,
+            'valid': len(valid_data),
+            'invalid': total - len(valid_data),
+            'validation_rate': len(valid_data) / total * 100 if total else 0
+        })
+        return valid_data, validation_result
+    
+    def _merge_stream_validation(self, validation_result: Dict) -> Dict:
+        """수집 중 제외된 행을 검증 결과에 합산"""
+        rejected = 0
+        error_summary = dict(validation_result['error_summary'])
+        aborted = []
+        
+        for carrier, stream_validator in self.stream_validators.items():
+            stats = stream_validator.stats()
+            rejected += stats['invalid']
+            for error, count in stats['error_summary'].items():
+                error_summary[error] = error_summary.get(error, 0) + count
+            if stats['aborted']:
+                aborted.append(carrier)
+        
+        if not rejected and not aborted:
+            return validation_result
+        
+        total = validation_result['total'] + rejected
+        merged = dict(validation_result)
+        merged.update({
+            'total': total,
+            'invalid': validation_result['invalid'] + rejected,
+            'error_summary': error_summary,
+            'validation_rate': validation_result['valid'] / total * 100 if total else 0,
+            'aborted_carriers': ', '.join(aborted)
+        })
+        return merged
+    
     def save_results(self):
         """결과 저장"""
         if not self.all_data:
             self.logger.warning("저장할 데이터가 없습니다.")
             return []
         
-        # DataFrame 생성
-        df = pd.DataFrame(self.all_data)
+        # 표준 스키마 DataFrame 생성 (3사 타입 통일 + 중복 제거를 한 번에)
+        df = dedupe_canonical(to_canonical(self.all_data.to_dataframe(), 'unified', keep_extra=True))
+        
+        # 통신사 간 같은 기기를 묶는 기기키
+        df.insert(df.columns.get_loc('기기명') + 1, '기기키', self.device_index.key_series(df['기기명']))
+        if self.config.get('device_aliases'):
+            self.device_index.save()
         
         # 타임스탬프
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -2382,66 +2997,19 @@ class UnifiedTelecomCrawler:
                 f'통신3사_공시지원금_통합_{timestamp}.xlsx'
             )
             
-            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-                # 전체 데이터
-                df.to_excel(writer, sheet_name='전체데이터', index=False)
-                
-                # 통신사별 시트
-                for carrier, data in self.data_by_carrier.items():
-                    if data:
-                        carrier_df = pd.DataFrame(data)
-                        sheet_name = carrier.replace(' ', '_')
-                        carrier_df.to_excel(writer, sheet_name=sheet_name, index=False)
+            with StreamingExcelWriter(excel_file) as writer:
+                self._write_data_sheets(writer, df)
                 
                 # 요약 통계
-                summary_data = []
-                
-                # 전체 통계
-                summary_data.append({
-                    '구분': '전체',
-                    '항목': '전체',
-                    '데이터수': len(df),
-                    '기기종류': df['기기명'].nunique() if '기기명' in df.columns else 0,
-                    '평균출고가': int(df['출고가'].mean()) if '출고가' in df.columns else 0,
-                    '평균공시지원금': int(df['공시지원금'].mean()) if '공시지원금' in df.columns else 0,
-                    '최대공시지원금': int(df['공시지원금'].max()) if '공시지원금' in df.columns else 0
-                })
-                
-                # 통신사별 통계
-                for carrier in ['SKT', 'KT', 'LG U+']:
-                    carrier_df = df[df['통신사'] == carrier] if '통신사' in df.columns else pd.DataFrame()
-                    if len(carrier_df) > 0:
-                        summary_data.append({
-                            '구분': '통신사',
-                            '항목': carrier,
-                            '데이터수': len(carrier_df),
-                            '기기종류': carrier_df['기기명'].nunique() if '기기명' in carrier_df.columns else 0,
-                            '평균출고가': int(carrier_df['출고가'].mean()) if '출고가' in carrier_df.columns else 0,
-                            '평균공시지원금': int(carrier_df['공시지원금'].mean()) if '공시지원금' in carrier_df.columns else 0,
-                            '최대공시지원금': int(carrier_df['공시지원금'].max()) if '공시지원금' in carrier_df.columns else 0
-                        })
-                
-                # 가입유형별 통계
-                if '가입유형' in df.columns:
-                    for sub_type in df['가입유형'].unique():
-                        sub_df = df[df['가입유형'] == sub_type]
-                        summary_data.append({
-                            '구분': '가입유형',
-                            '항목': sub_type,
-                            '데이터수': len(sub_df),
-                            '기기종류': sub_df['기기명'].nunique() if '기기명' in sub_df.columns else 0,
-                            '평균출고가': int(sub_df['출고가'].mean()) if '출고가' in sub_df.columns else 0,
-                            '평균공시지원금': int(sub_df['공시지원금'].mean()) if '공시지원금' in sub_df.columns else 0,
-                            '최대공시지원금': int(sub_df['공시지원금'].max()) if '공시지원금' in sub_df.columns else 0
-                        })
+                writer.write_frame('요약통계', self._build_summary(df))
                 
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='요약통계', index=False)
-                
-                # 검증 결과
+                # 검증 결과 (중첩 dict는 JSON 문자열로 기록)
                 if self.statistics.get('validation_result'):
-                    validation_df = pd.DataFrame([self.statistics['validation_result']])
-                    validation_df.to_excel(writer, sheet_name='검증결과', index=False)
+                    validation_row = {
+                        key: json.dumps(value, ensure_ascii=False) if isinstance(value, dict) else value
+                        for key, value in self.statistics['validation_result'].items()
+                    }
+                    writer.write_frame('검증결과', pd.DataFrame([validation_row]))
             
             saved_files.append(excel_file)
             self.logger.info(f"Excel 저장: {excel_file}")
@@ -2466,10 +3034,10 @@ class UnifiedTelecomCrawler:
             json_data = {
                 'metadata': {
                     'crawled_at': timestamp,
-                    'total_data': len(self.all_data),
+                    'total_data': len(df),
                     'statistics': self.statistics
                 },
-                'data': self.all_data
+                'data': list(iter_frame_records(df))
             }
             
             with open(json_file, 'w', encoding='utf-8') as f:
@@ -2478,8 +3046,81 @@ class UnifiedTelecomCrawler:
             saved_files.append(json_file)
             self.logger.info(f"JSON 저장: {json_file}")
         
+        # JSONL 저장 (행 단위 스트리밍, 선택적 압축)
+        saved_files.extend(save_jsonl_format(iter_frame_records(df), self.config['save_formats'],
+                                             self.config['output_dir'], f'통신3사_공시지원금_통합_{timestamp}',
+                                             self.config.get('jsonl_compression')))
+        
+        # Parquet / Arrow 저장
+        saved_files.extend(save_columnar_formats(df, self.config['save_formats'],
+                                                 self.config['output_dir'], f'통신3사_공시지원금_통합_{timestamp}'))
+        
+        # 정규화 저장 (요금제 / 기기 / 팩트 테이블)
+        saved_files.extend(save_normalized_tables(df, self.config['save_formats'],
+                                                  self.config['output_dir'], f'통신3사_공시지원금_통합_{timestamp}'))
+        
+        # 총소유비용(TCO) 표 (기기별 비용 순)
+        if 'tco' in self.config['save_formats']:
+            tco_file = os.path.join(self.config['output_dir'], f'통신3사_TCO_{timestamp}.csv')
+            try:
+                TCOEngine(df, device_index=self.device_index).to_frame().to_csv(tco_file, index=False, encoding='utf-8-sig')
+                saved_files.append(tco_file)
+                self.logger.info(f"TCO 저장: {tco_file}")
+            except Exception as e:
+                self.logger.error(f"TCO 저장 실패: {e}")
+        
         return saved_files
     
+    def _write_data_sheets(self, writer: StreamingExcelWriter, df: pd.DataFrame):
+        """전체데이터 + 통신사별 시트를 한 번의 순회로 기록"""
+        columns = list(df.columns)
+        all_sheet = writer.add_sheet('전체데이터', columns)
+        
+        # 통신사별 시트 (수집 순서 유지)
+        carrier_sheets = {}
+        if '통신사' in df.columns:
+            for carrier in df['통신사'].dropna().unique():
+                carrier_sheets[carrier] = writer.add_sheet(str(carrier).replace(' ', '_'), columns)
+            carrier_index = columns.index('통신사')
+        
+        for row in iter_frame_rows(df):
+            writer.append_rows(all_sheet, (row,))
+            if carrier_sheets:
+                carrier_sheet = carrier_sheets.get(row[carrier_index])
+                if carrier_sheet:
+                    writer.append_rows(carrier_sheet, (row,))
+    
+    def _build_summary(self, df: pd.DataFrame) -> pd.DataFrame:
+        """요약 통계 (전체 / 통신사별 / 가입유형별, 구분마다 groupby 한 번)"""
+        summary_columns = ['구분', '항목', '데이터수', '기기종류', '평균출고가', '평균공시지원금', '최대공시지원금']
+        
+        agg_spec = {}
+        if '기기명' in df.columns:
+            agg_spec['기기종류'] = ('기기명', 'nunique')
+        if '출고가' in df.columns:
+            agg_spec['평균출고가'] = ('출고가', 'mean')
+        if '공시지원금' in df.columns:
+            agg_spec['평균공시지원금'] = ('공시지원금', 'mean')
+            agg_spec['최대공시지원금'] = ('공시지원금', 'max')
+        
+        groupings = [('전체', pd.Series('전체', index=df.index))]
+        for column in ['통신사', '가입유형']:
+            if column in df.columns:
+                groupings.append((column, df[column]))
+        
+        frames = []
+        for label, key in groupings:
+            grouped = df.groupby(key.rename('항목'), sort=False)
+            stats = grouped.agg(**agg_spec) if agg_spec else pd.DataFrame(index=grouped.size().index)
+            stats['데이터수'] = grouped.size()
+            stats['구분'] = label
+            frames.append(stats.reset_index())
+        
+        summary = pd.concat(frames, ignore_index=True).reindex(columns=summary_columns, fill_value=0)
+        stat_columns = summary_columns[2:]
+        summary[stat_columns] = summary[stat_columns].fillna(0).astype('int64')
+        return summary
+    
     def print_final_summary(self):
         """최종 요약 출력"""
         elapsed_time = (self.statistics['end_time'] - self.statistics['start_time']).total_seconds()
@@ -2507,7 +3148,7 @@ class UnifiedTelecomCrawler:
             
             # 상세 통계 테이블
             if self.all_data:
-                df = pd.DataFrame(self.all_data)
+                df = self.all_data.to_dataframe()
                 
                 # 기기별 TOP 10
                 if '기기명' in df.columns:
@@ -2566,10 +3207,42 @@ class UnifiedTelecomCrawler:
                     print(f"  {carrier}: {stats['data_count']:,}개")
                 else:
                     print(f"  {carrier}: 실패")
+        
+        # 통신사별 단계 소요 시간 분포
+        for timer in self.stage_timers.values():
+            timer.print_summary(console)
+    
+    def save_profile(self) -> List[str]:
+        """프로파일 리포트 / .pstats / 메모리 체크포인트 저장"""
+        if not self.profiler.enabled:
+            return []
+        return self.profiler.stop(os.path.join(
+            self.config['output_dir'], f"통신3사_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"))
+    
+    def save_metrics(self) -> Optional[str]:
+        """통신사별 단계 메트릭을 JSON 하나로 저장"""
+        if not self.stage_timers:
+            return None
+        
+        metrics_file = self.config.get('metrics_file') or os.path.join(
+            self.config['output_dir'], f"통신3사_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            with open(metrics_file, 'w', encoding='utf-8') as f:
+                json.dump({carrier: timer.to_dict() for carrier, timer in self.stage_timers.items()},
+                          f, ensure_ascii=False, indent=2)
+            self.logger.info(f"단계별 메트릭 저장: {metrics_file}")
+            return metrics_file
+        except Exception as e:
+            self.logger.error(f"메트릭 저장 실패: {e}")
+            return None
     
     def run(self):
         """통합 크롤러 실행"""
         try:
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.start()
+            self.profiler.start()
+            
             if RICH_AVAILABLE:
                 console.print(Panel.fit(
                     "[bold cyan]한국 통신사 3사 통합 휴대폰 지원금 크롤러 v1.0[/bold cyan]\n"
@@ -2592,15 +3265,31 @@ class UnifiedTelecomCrawler:
             
             # 1. 전체 크롤링 실행
             self.crawl_all_carriers()
+            self.profiler.checkpoint('전체 크롤링 완료', all_data=self.all_data,
+                                     data_by_carrier=self.data_by_carrier)
             
             # 2. 데이터 검증 및 정리
             if self.all_data:
-                self.validate_and_clean_data()
+                with self.profiler.profile('validate'):
+                    self.validate_and_clean_data()
+                self.profiler.checkpoint('검증 완료', all_data=self.all_data,
+                                         data_by_carrier=self.data_by_carrier)
             
             # 3. 결과 저장
             saved_files = []
             if self.all_data:
-                saved_files = self.save_results()
+                with self.profiler.profile('save'):
+                    saved_files = self.save_results()
+                self.profiler.checkpoint('저장 완료', all_data=self.all_data)
+            
+            # 선택된 통신사가 모두 완료되고 저장까지 끝나면 체크포인트 삭제
+            enabled = {'SKT': 'enable_skt', 'KT': 'enable_kt', 'LG U+': 'enable_lg'}
+            if saved_files and all(
+                checkpoint.is_complete()
+                for carrier, checkpoint in self.carrier_checkpoints.items()
+                if self.config.get(enabled[carrier], True)
+            ):
+                self.clear_checkpoints()
             
             # 4. 최종 요약 출력
             self.print_final_summary()
@@ -2649,10 +3338,28 @@ class UnifiedTelecomCrawler:
                 saved_files = self.save_results()
                 return saved_files
             return []
+        
+        finally:
+            self.save_metrics()
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.stop()
+            self.save_profile()
+            if self.history_store:
+                self.history_store.close()
 
 
 def main():
     """메인 함수"""
+    # 하위 명령: 결과 비교
+    if len(sys.argv) > 1 and sys.argv[1] == 'diff':
+        diff_engine.main(sys.argv[2:])
+        return
+    
+    # 하위 명령: 조회 API 서버
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        query_server.main(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(
         description='한국 통신사 3사 통합 휴대폰 지원금 크롤러',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2663,6 +3370,10 @@ def main():
   python unified_crawler.py --carriers skt kt  # 특정 통신사만
   python unified_crawler.py --no-headless      # GUI 모드
   python unified_crawler.py --debug            # 디버그 모드
+  python unified_crawler.py diff OLD.csv NEW.csv  # 두 결과 비교 (추가/삭제/변경)
+  python unified_crawler.py serve --port 8080     # 최신 결과 조회 API 서버
+  python unified_crawler.py --metrics-port 9108  # 실행 중 Prometheus 메트릭 노출
+  python unified_crawler.py --profile --profile-memory  # cProfile 리포트 + 메모리 체크포인트
 
 데이터는 data/ 폴더에 저장됩니다.
         """
@@ -2696,11 +3407,33 @@ def main():
     parser.add_argument('--output', type=str, default='data',
                         help='출력 디렉토리 (기본: data)')
     parser.add_argument('--formats', nargs='+',
-                        choices=['excel', 'csv', 'json'],
+                        choices=['excel', 'csv', 'json', 'jsonl', 'parquet', 'arrow', 'normalized', 'tco'],
                         default=['excel', 'csv', 'json'],
                         help='저장 형식 (기본: excel csv json)')
     parser.add_argument('--no-validation', action='store_true',
                         help='데이터 검증 건너뛰기')
+    parser.add_argument('--abort-below', type=float, default=50.0,
+                        help='수집 중 최근 유효율이 이 값(%%) 미만이면 해당 통신사 중단 (0 = 중단 안 함, 기본: 50)')
+    parser.add_argument('--jsonl-compression', choices=['none', 'gzip', 'zstd'], default='none',
+                        help='JSONL 압축 방식 (기본: none)')
+    parser.add_argument('--history-db', type=str, default=None,
+                        help='공시지원금 이력 SQLite 경로 (지정 시 실행마다 누적 저장)')
+    parser.add_argument('--resume', action='store_true',
+                        help='통신사별 체크포인트에서 이어서 수집 (완료된 통신사 건너뜀)')
+    parser.add_argument('--device-aliases', type=str, default=None,
+                        help='기기 별칭/모델코드 테이블 JSON 경로 (실행마다 학습한 모델코드 누적)')
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help='단계별 소요 시간 메트릭 JSON 경로 (기본: 출력 디렉토리에 자동 생성)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='실행 중 Prometheus /metrics 엔드포인트 포트 (기본: 사용 안 함)')
+    parser.add_argument('--metrics-textfile', type=str, default=None,
+                        help='Prometheus textfile collector 경로 (.prom, 기본: 사용 안 함)')
+    parser.add_argument('--profile', action='store_true',
+                        help='작업별 cProfile 결과를 합쳐 리포트(.txt)와 .pstats 저장')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='체크포인트마다 tracemalloc 스냅샷 기록 (--profile 포함)')
+    parser.add_argument('--profile-sort', choices=SORT_KEYS, default='cumulative',
+                        help='프로파일 리포트 정렬 기준 (기본: cumulative)')
     
     args = parser.parse_args()
     
@@ -2730,8 +3463,19 @@ def main():
         'lg_max_pages': args.lg_max_pages if not args.test else 1,
         'output_dir': args.output,
         'save_formats': args.formats,
+        'jsonl_compression': args.jsonl_compression,
+        'resume': args.resume,
         'validate_data': not args.no_validation,
-        'show_browser': args.no_headless
+        'abort_validity_rate': args.abort_below,
+        'show_browser': args.no_headless,
+        'history_db': args.history_db,
+        'device_aliases': args.device_aliases,
+        'metrics_file': args.metrics_file,
+        'metrics_port': args.metrics_port,
+        'metrics_textfile': args.metrics_textfile,
+        'profile': args.profile,
+        'profile_memory': args.profile_memory,
+        'profile_sort': args.profile_sort
     }
     
     # 선택된 통신사 출력
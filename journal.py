@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+append-only 크롤링 작업 저널
+
+완료된 작업 키와 그 작업에서 수집한 행을 한 줄(JSONL)씩 이어 붙여 기록한다.
+재시작 시 저널을 읽어 완료된 작업 집합과 수집 데이터를 복원한다.
+
+주요 특징:
+    - 완료된 작업만 기록 (체크포인트 비용 O(새 작업))
+    - 작업 순서와 무관한 재개 (스레드 풀에서 순서 없이 완료되어도 정확히 건너뜀)
+    - 기록마다 flush + fsync, 마지막 줄이 깨진 경우 무시하고 로드
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlJournal:
+    """작업 키 + 행 단위 append-only 저널"""
+
+    def __init__(self, file_path: str, fsync: bool = True):
+        """
+        저널 초기화
+
+        Args:
+            file_path (str): 저널 파일 경로 (JSONL)
+            fsync (bool): 기록마다 fsync 여부
+        """
+        self.file_path = file_path
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._file = None
+        self.records_written = 0
+
+    def exists(self) -> bool:
+        """기록된 저널이 있는지 확인"""
+        return os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0
+
+    def load(self) -> Tuple[Set[str], List[Dict]]:
+        """저널 로드 → (완료된 작업 키 집합, 수집된 행 목록)"""
+        completed = set()
+        rows = []
+
+        if not self.exists():
+            return completed, rows
+
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    logger.warning(f"저널 {line_no}번째 줄 손상, 건너뜀: {self.file_path}")
+                    continue
+
+                key = record.get('key')
+                if key is None or key in completed:
+                    continue
+                completed.add(key)
+                rows.extend(record.get('rows', []))
+
+        return completed, rows
+
+    def open(self):
+        """기록용으로 열기 (기존 저널에 이어쓰기)"""
+        if self._file is not None:
+            return self
+
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 중단으로 마지막 줄이 잘린 경우 새 기록이 이어 붙지 않도록 줄바꿈 추가
+        needs_newline = False
+        if self.exists():
+            with open(self.file_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+
+        self._file = open(self.file_path, 'a', encoding='utf-8')
+        if needs_newline:
+            self._file.write('\n')
+        return self
+
+    def record(self, key: str, rows: Optional[List[Dict]] = None):
+        """완료된 작업 기록 (워커 스레드에서 호출 가능)"""
+        line = json.dumps({
+            'key': key,
+            'rows': rows or [],
+            'recorded_at': datetime.now().isoformat(timespec='seconds')
+        }, ensure_ascii=False, separators=(',', ':'))
+
+        with self._lock:
+            if self._file is None:
+                self.open()
+            self._file.write(line + '\n')
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.records_written += 1
+
+    def close(self):
+        """파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self):
+        """저널 삭제 (크롤링 정상 완료 후)"""
+        self.close()
+        if os.path.exists(self.file_path):
+            try:
+                os.remove(self.file_path)
+                logger.debug(f"저널 삭제: {self.file_path}")
+            except OSError as e:
+                logger.warning(f"저널 삭제 실패: {e}")
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -19,7 +19,6 @@ import time
 import os
 import json
 import re
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -37,6 +36,18 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import traceback
 from typing import List, Dict, Optional
 
+from result_sink import StreamingResultSink
+from records import ColumnarRows
+from exporters import (save_columnar_formats, save_normalized_tables, save_jsonl_format,
+                       StreamingExcelWriter, iter_frame_records)
+from history_store import HistoryStore
+from journal import CrawlJournal
+from manufacturers import classify_manufacturer
+from instrumentation import (StageTimer, JOBS_COMPLETED, JOBS_FAILED, ROWS_COLLECTED,
+                             DRIVERS_STARTED, DRIVERS_CLOSED)
+from metrics_exporter import MetricsExporter
+from profiling import Profiler, SORT_KEYS
+
 # Rich library for better UI
 try:
     from rich.console import Console
@@ -62,6 +73,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 출력 컬럼 순서
+COLUMN_ORDER = [
+    'carrier', 'plan_type', 'plan_name', 'monthly_fee',
+    'device_name', 'manufacturer', 'release_price',
+    'public_support_fee', 'additional_support_fee',
+    'device_discount_24', 'plan_discount_24', 'crawled_at'
+]
+
 
 class KTCrawlerV7:
     """KT 공시지원금 크롤러 v7.0 - Rich UI & 멀티스레딩"""
@@ -69,7 +88,7 @@ class KTCrawlerV7:
     def __init__(self, config=None):
         """초기화"""
         self.base_url = "https://shop.kt.com/smart/supportAmtList.do"
-        self.data = []
+        self.data = ColumnarRows()  # 컬럼 단위 저장 (반복 문자열 intern)
         self.data_lock = threading.Lock()
         
         # 기본 설정
@@ -82,10 +101,21 @@ class KTCrawlerV7:
             'output_dir': 'data',
             'checkpoint_dir': 'checkpoints',
             'save_formats': ['excel', 'csv', 'json'],
+            'jsonl_compression': None,  # JSONL 압축 (None, 'gzip', 'zstd')
             'max_rate_plans': 0,  # 0 = 모든 요금제
             'show_browser': False,
             'save_intermediate': True,  # 중간 저장 활성화
-            'intermediate_interval': 10  # 10개마다 중간 저장
+            'intermediate_interval': 10,  # 10개마다 중간 저장 (fsync 체크포인트)
+            'intermediate_format': 'csv',  # 중간 저장 형식 (csv, jsonl)
+            'resume': False,  # 이전 실행 저널에서 이어서 수집
+            'history_db': None,  # 이력 저장소 경로 (None = 사용 안 함)
+            'metrics_file': None,  # 단계별 메트릭 JSON 경로 (None = output_dir에 자동 생성)
+            'metrics_port': None,  # 실행 중 /metrics 엔드포인트 포트 (None = 사용 안 함)
+            'metrics_textfile': None,  # Prometheus textfile collector 경로 (.prom, None = 사용 안 함)
+            'metrics_interval': 15.0,  # textfile 갱신 간격 (초)
+            'profile': False,  # 작업별 cProfile 병합 리포트 저장
+            'profile_memory': False,  # 체크포인트마다 tracemalloc 스냅샷 (profile 포함)
+            'profile_sort': 'cumulative'  # 프로파일 리포트 정렬 기준
         }
         
         if config:
@@ -107,6 +137,32 @@ class KTCrawlerV7:
         self.current_tasks = {}
         self.checkpoint_file = os.path.join(self.config['checkpoint_dir'], 'kt_checkpoint.json')
         
+        # 완료된 요금제 + 수집 행 저널 (--resume 시 복원)
+        self.journal = CrawlJournal(os.path.join(self.config['checkpoint_dir'], 'kt_journal.jsonl'))
+        
+        # 중간 저장용 스트리밍 싱크 (run_parallel_crawling에서 생성)
+        self.result_sink = None
+        
+        # 실행 간 이력 저장소
+        self.history_store = HistoryStore(self.config['history_db']) if self.config.get('history_db') else None
+        
+        # 단계별 소요 시간 계측
+        self.timer = StageTimer('KT')
+        
+        # 실행 중 메트릭 노출 (/metrics, textfile)
+        self.metrics_exporter = MetricsExporter({self.timer.name: self.timer},
+                                                port=self.config.get('metrics_port'),
+                                                textfile=self.config.get('metrics_textfile'),
+                                                interval=self.config.get('metrics_interval', 15.0))
+        
+        # 프로파일링 모드 (작업마다 cProfile, 선택적으로 tracemalloc 체크포인트)
+        self.profiler = Profiler(self.config.get('profile', False),
+                                 memory=self.config.get('profile_memory', False),
+                                 sort=self.config.get('profile_sort', 'cumulative'),
+                                 worker_hint='--workers 1')
+        if self.profiler.enabled:
+            self.timer.profiler = self.profiler
+        
     def create_driver(self):
         """Chrome 드라이버 생성"""
         chrome_options = Options()
@@ -146,11 +202,13 @@ class KTCrawlerV7:
             chrome_options.add_argument('--headless=new')
             chrome_options.add_argument('--window-size=1920,1080')
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.maximize_window()
-        driver.set_page_load_timeout(self.config['page_load_timeout'])
-        driver.implicitly_wait(3)
+        with self.timer.span('driver_launch'):
+            service = Service(ChromeDriverManager().install())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver.maximize_window()
+            driver.set_page_load_timeout(self.config['page_load_timeout'])
+            driver.implicitly_wait(3)
+        self.timer.increment(DRIVERS_STARTED)
         
         return driver
     
@@ -185,9 +243,10 @@ class KTCrawlerV7:
         
         try:
             # 페이지 접속
-            driver.get(self.base_url)
-            self.wait_for_loading(driver, 3)
-            self.handle_alert(driver)
+            with self.timer.span('page_load'):
+                driver.get(self.base_url)
+                self.wait_for_loading(driver, 3)
+                self.handle_alert(driver)
             
             # 팝업 닫기
             driver.execute_script("""
@@ -201,7 +260,9 @@ class KTCrawlerV7:
             all_plans = []
             
             # 모달 열기
-            if not self._open_plan_modal(driver):
+            with self.timer.span('modal'):
+                modal_opened = self._open_plan_modal(driver)
+            if not modal_opened:
                 raise Exception("요금제 모달을 열 수 없습니다")
             
             # 5G 요금제 수집
@@ -244,6 +305,7 @@ class KTCrawlerV7:
             
         finally:
             driver.quit()
+            self.timer.increment(DRIVERS_CLOSED)
     
     def _open_plan_modal(self, driver):
         """요금제 모달 열기"""
@@ -433,7 +495,49 @@ class KTCrawlerV7:
         except:
             pass
     
+    def _plan_key(self, plan):
+        """저널용 요금제 키 (요금제 유형|요금제ID, ID가 없으면 요금제명)"""
+        return f"{plan['plan_type']}|{plan.get('id') or plan['name']}"
+    
+    def load_journal(self):
+        """저널에서 완료된 요금제와 행 복원 후 남은 요금제 인덱스 반환 (resume이 아니면 저널 초기화)"""
+        all_indices = list(range(len(self.all_plans)))
+        
+        if not self.config.get('resume'):
+            self.journal.clear()
+            return all_indices
+        
+        try:
+            completed_keys, rows = self.journal.load()
+        except Exception as e:
+            logger.error(f"저널 로드 실패: {e}")
+            return all_indices
+        
+        if rows:
+            with self.data_lock:
+                self.data.extend(rows)
+                self.total_products += len(rows)
+            # 복원 행도 이번 실행에서 관측된 것으로 기록 (미관측 키 종료 대상에서 제외)
+            if self.history_store:
+                self.history_store.record_rows(rows)
+        
+        pending = [i for i in all_indices if self._plan_key(self.all_plans[i]) not in completed_keys]
+        
+        message = f"이어서 수집: 완료 {len(self.all_plans) - len(pending)}개 요금제 건너뜀 ({len(rows):,}행 복원), 남은 요금제 {len(pending)}개"
+        if RICH_AVAILABLE:
+            console.print(f"[yellow]{message}[/yellow]")
+        else:
+            print(message)
+        
+        return pending
+    
     def process_plan(self, plan_index, progress=None, task_id=None):
+        """단일 요금제 처리 (작업 단위 시간 계측)"""
+        plan = self.all_plans[plan_index]
+        with self.timer.job(f"{plan['plan_type']} - {plan['name']}"):
+            return self._process_plan(plan_index, progress, task_id)
+    
+    def _process_plan(self, plan_index, progress=None, task_id=None):
         """단일 요금제 처리"""
         plan = self.all_plans[plan_index]
         driver = None
@@ -452,9 +556,10 @@ class KTCrawlerV7:
                 progress.update(task_id, description=desc)
             
             # 페이지 로드
-            driver.get(self.base_url)
-            self.wait_for_loading(driver, 3)
-            self.handle_alert(driver)
+            with self.timer.span('page_load'):
+                driver.get(self.base_url)
+                self.wait_for_loading(driver, 3)
+                self.handle_alert(driver)
             
             # 팝업 닫기
             driver.execute_script("""
@@ -464,15 +569,18 @@ class KTCrawlerV7:
             """)
             
             # 모달 열기
-            if not self._open_plan_modal(driver):
+            with self.timer.span('modal'):
+                modal_opened = self._open_plan_modal(driver)
+            if not modal_opened:
                 raise Exception("모달 열기 실패")
             
             # 요금제 선택
-            success = self._select_plan(driver, plan)
+            with self.timer.span('plan_select'):
+                success = self._select_plan(driver, plan)
             if not success:
                 raise Exception("요금제 선택 실패")
             
-            # 데이터 수집
+            # 데이터 수집 (추출 / 페이지 이동은 _collect_products 안에서 계측)
             products = self._collect_products(driver, plan)
             
             # 데이터 저장
@@ -481,6 +589,17 @@ class KTCrawlerV7:
                     self.data.extend(products)
                     self.total_products += len(products)
                     self.completed_count += 1
+                self.timer.increment(JOBS_COMPLETED)
+                self.timer.increment(ROWS_COLLECTED, len(products))
+                
+                # 중간 저장 싱크로 새 행만 전달 (실제 기록은 writer 스레드)
+                if self.result_sink:
+                    self.result_sink.write_rows(products)
+                if self.history_store:
+                    self.history_store.record_rows(products)
+                
+                # 완료된 요금제를 저널에 기록 (--resume 시 건너뜀)
+                self.journal.record(self._plan_key(plan), products)
                 
                 logger.info(f"✓ [{plan_index+1}] {plan['name']}: {len(products)}개")
                 
@@ -491,17 +610,20 @@ class KTCrawlerV7:
             else:
                 with self.status_lock:
                     self.failed_count += 1
+                self.timer.increment(JOBS_FAILED)
                 return False
                 
         except Exception as e:
             logger.error(f"처리 오류 [{plan_index+1}]: {str(e)}")
             with self.status_lock:
                 self.failed_count += 1
+            self.timer.increment(JOBS_FAILED)
             return False
             
         finally:
             if driver:
                 driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
             # 작업 상태 제거
             with self.status_lock:
                 self.current_tasks.pop(thread_id, None)
@@ -580,6 +702,7 @@ class KTCrawlerV7:
         while page <= max_pages:
             try:
                 # 현재 페이지 데이터 추출
+                extract_start = time.perf_counter()
                 products = driver.execute_script("""
                     const products = [];
                     const items = document.querySelectorAll('#prodList > li');
@@ -606,9 +729,7 @@ class KTCrawlerV7:
                                 public_support_fee: extractPrice(fullText, '공시지원금'),
                                 additional_support_fee: extractPrice(fullText, '추가지원금'),
                                 device_discount_24: extractPrice(fullText, '단말할인'),
-                                plan_discount_24: extractPrice(fullText, '요금할인'),
-                                manufacturer: deviceName.includes('갤럭시') ? '삼성' : 
-                                             deviceName.includes('아이폰') ? '애플' : '기타'
+                                plan_discount_24: extractPrice(fullText, '요금할인')
                             };
                             
                             if (data.public_support_fee === 0 && data.device_discount_24 > 0) {
@@ -636,16 +757,20 @@ class KTCrawlerV7:
                             'plan_type': plan['plan_type'],
                             'plan_name': plan['name'],
                             'monthly_fee': plan.get('monthlyFee', 0),
+                            'manufacturer': classify_manufacturer(product['device_name']),
                             'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                         })
                         new_products.append(product)
                 
+                self.timer.record('extract', time.perf_counter() - extract_start)
+                
                 if not new_products:
                     break
                 
                 all_products.extend(new_products)
                 
                 # 다음 페이지로 이동
+                pagination_start = time.perf_counter()
                 next_clicked = driver.execute_script(f"""
                     const pageWrap = document.querySelector('.pageWrap');
                     if (!pageWrap) return false;
@@ -677,6 +802,7 @@ class KTCrawlerV7:
                 
                 page += 1
                 time.sleep(1)
+                self.timer.record('pagination', time.perf_counter() - pagination_start)
                 
             except Exception as e:
                 logger.debug(f"페이지 {page} 수집 오류: {e}")
@@ -695,26 +821,53 @@ class KTCrawlerV7:
         with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
             json.dump(checkpoint, f, ensure_ascii=False, indent=2)
     
+    def open_result_sink(self):
+        """중간 저장용 스트리밍 싱크 열기 (실행당 파일 1개)"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        fmt = self.config.get('intermediate_format', 'csv')
+        
+        intermediate_file = os.path.join(
+            self.config['output_dir'],
+            f'kt_intermediate_{timestamp}.{fmt}'
+        )
+        self.result_sink = StreamingResultSink(intermediate_file, fmt=fmt, columns=COLUMN_ORDER).start()
+        
+        logger.info(f"중간 저장 파일: {intermediate_file}")
+    
+    def close_result_sink(self):
+        """스트리밍 싱크 닫기"""
+        if self.result_sink:
+            self.result_sink.close()
+            logger.info(f"중간 저장 완료: {self.result_sink.file_path} ({self.result_sink.rows_written:,}행)")
+            self.result_sink = None
+    
     def save_intermediate(self):
-        """중간 데이터 저장"""
+        """중간 데이터 저장 (새로 수집된 행만 fsync)"""
         if not self.data:
             return
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        with self.data_lock:
-            df = pd.DataFrame(self.data)
+        if self.result_sink:
+            self.result_sink.checkpoint()
+            intermediate_file = self.result_sink.file_path
+            message = f"💾 중간 저장: {intermediate_file} (+{self.result_sink.last_checkpoint_rows:,}행, 누적 {self.result_sink.rows_written:,}행)"
+        else:
+            # 싱크가 없을 때 (예: 크롤링 시작 전 중단) 전체 데이터 저장
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
-        intermediate_file = os.path.join(
-            self.config['output_dir'], 
-            f'kt_intermediate_{timestamp}.csv'
-        )
-        df.to_csv(intermediate_file, index=False, encoding='utf-8-sig')
+            with self.data_lock:
+                df = self.data.to_dataframe()
+                
+            intermediate_file = os.path.join(
+                self.config['output_dir'], 
+                f'kt_intermediate_{timestamp}.csv'
+            )
+            df.to_csv(intermediate_file, index=False, encoding='utf-8-sig')
+            message = f"💾 중간 저장: {intermediate_file}"
         
         if RICH_AVAILABLE:
-            console.print(f"[yellow]💾 중간 저장: {intermediate_file}[/yellow]")
+            console.print(f"[yellow]{message}[/yellow]")
         else:
-            print(f"💾 중간 저장: {intermediate_file}")
+            print(message)
     
     def run_parallel_crawling(self):
         """병렬 크롤링 실행"""
@@ -725,6 +878,12 @@ class KTCrawlerV7:
         else:
             print(f"\n병렬 크롤링 시작 (워커: {self.config['max_workers']}개)\n")
         
+        # 남은 요금제 (--resume 시 저널에 완료 기록이 있는 요금제 제외)
+        pending = self.load_journal()
+        
+        if self.config['save_intermediate']:
+            self.open_result_sink()
+        
         # ThreadPoolExecutor 사용
         with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
             
@@ -743,13 +902,13 @@ class KTCrawlerV7:
                     
                     main_task = progress.add_task(
                         "[green]전체 진행률",
-                        total=len(self.all_plans),
-                        status=f"수집: 0개"
+                        total=len(pending),
+                        status=f"수집: {self.total_products:,}개"
                     )
                     
                     # 모든 작업 제출
                     futures = []
-                    for i in range(len(self.all_plans)):
+                    for i in pending:
                         future = executor.submit(self.process_plan, i, progress, main_task)
                         futures.append(future)
                     
@@ -782,19 +941,22 @@ class KTCrawlerV7:
             else:
                 # Rich가 없을 때
                 futures = []
-                for i in range(len(self.all_plans)):
+                for i in pending:
                     future = executor.submit(self.process_plan, i)
                     futures.append(future)
                 
                 completed = 0
                 for future in as_completed(futures):
                     completed += 1
-                    print(f"진행: {completed}/{len(self.all_plans)} ({completed/len(self.all_plans)*100:.1f}%)")
+                    print(f"진행: {completed}/{len(pending)} ({completed/len(pending)*100:.1f}%)")
                     
                     if (self.config['save_intermediate'] and 
                         completed % self.config['intermediate_interval'] == 0):
                         self.save_intermediate()
         
+        # 남은 행 기록 후 싱크 종료
+        self.close_result_sink()
+        
         # 최종 통계
         elapsed = time.time() - self.start_time
         
@@ -818,6 +980,31 @@ class KTCrawlerV7:
             print(f"성공: {self.completed_count}개")
             print(f"실패: {self.failed_count}개")
             print(f"총 수집 데이터: {self.total_products}개")
+        
+        # 단계별 소요 시간 분포
+        self.timer.print_summary(console)
+    
+    def close_unseen_history(self):
+        """전체 수집을 마쳤으면 이번 실행에서 보이지 않은 키(공시 철회)의 이력 유효기간 종료"""
+        if not self.history_store or self.config['max_rate_plans'] > 0 or self.failed_count:
+            return
+        self.history_store.close_unseen('KT')
+    
+    def save_profile(self):
+        """프로파일 리포트 / .pstats / 메모리 체크포인트 저장"""
+        if not self.profiler.enabled:
+            return
+        self.profiler.stop(os.path.join(
+            self.config['output_dir'], f"KT_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"))
+    
+    def save_metrics(self):
+        """단계별 메트릭 JSON 저장"""
+        metrics_file = self.config.get('metrics_file') or os.path.join(
+            self.config['output_dir'], f"KT_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            self.timer.save(metrics_file)
+        except Exception as e:
+            logger.error(f"메트릭 저장 실패: {e}")
     
     def save_data(self):
         """최종 데이터 저장"""
@@ -828,7 +1015,7 @@ class KTCrawlerV7:
                 print("저장할 데이터가 없습니다.")
             return []
         
-        df = pd.DataFrame(self.data)
+        df = self.data.to_dataframe()
         
         # 중복 제거
         original_count = len(df)
@@ -841,12 +1028,7 @@ class KTCrawlerV7:
                 print(f"중복 제거: {original_count} → {len(df)}")
         
         # 컬럼 순서 정리
-        column_order = [
-            'carrier', 'plan_type', 'plan_name', 'monthly_fee',
-            'device_name', 'manufacturer', 'release_price',
-            'public_support_fee', 'additional_support_fee',
-            'device_discount_24', 'plan_discount_24', 'crawled_at'
-        ]
+        column_order = COLUMN_ORDER
         
         # 누락된 컬럼 처리
         for col in column_order:
@@ -862,15 +1044,13 @@ class KTCrawlerV7:
         if 'excel' in self.config['save_formats']:
             excel_file = os.path.join(self.config['output_dir'], f'KT_공시지원금_{timestamp}.xlsx')
             
-            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+            with StreamingExcelWriter(excel_file) as writer:
                 # 전체 데이터
-                df.to_excel(writer, sheet_name='전체데이터', index=False)
+                writer.write_frame('전체데이터', df)
                 
-                # 요금제별 시트
-                for plan in df['plan_name'].unique():
-                    plan_df = df[df['plan_name'] == plan]
-                    sheet_name = re.sub(r'[^\w\s가-힣]', '', plan)[:31]
-                    plan_df.to_excel(writer, sheet_name=sheet_name, index=False)
+                # 요금제별 시트 (groupby 한 번으로 분할, 시트명 중복은 writer가 처리)
+                for plan, plan_df in df.groupby('plan_name', sort=False):
+                    writer.write_frame(re.sub(r'[^\w\s가-힣]', '', str(plan)), plan_df)
                 
                 # 요약
                 summary = df.groupby(['plan_type', 'plan_name']).agg({
@@ -880,7 +1060,7 @@ class KTCrawlerV7:
                     'public_support_fee': 'mean'
                 }).round(0)
                 summary.columns = ['디바이스수', '월요금', '평균출고가', '평균공시지원금']
-                summary.to_excel(writer, sheet_name='요약')
+                writer.write_frame('요약', summary.reset_index())
             
             saved_files.append(excel_file)
             
@@ -909,15 +1089,52 @@ class KTCrawlerV7:
             else:
                 print(f"✅ JSON 저장: {json_file}")
         
-        # 체크포인트 삭제
+        # JSONL 저장 (행 단위 스트리밍, 선택적 압축)
+        for jsonl_file in save_jsonl_format(iter_frame_records(df), self.config['save_formats'],
+                                            self.config['output_dir'], f'KT_공시지원금_{timestamp}',
+                                            self.config.get('jsonl_compression')):
+            saved_files.append(jsonl_file)
+            
+            if RICH_AVAILABLE:
+                console.print(f"[green]✅ JSONL 저장:[/green] {jsonl_file}")
+            else:
+                print(f"✅ JSONL 저장: {jsonl_file}")
+        
+        # Parquet / Arrow 저장
+        for columnar_file in save_columnar_formats(df, self.config['save_formats'],
+                                                   self.config['output_dir'], f'KT_공시지원금_{timestamp}'):
+            saved_files.append(columnar_file)
+            label = os.path.splitext(columnar_file)[1][1:].capitalize()
+            
+            if RICH_AVAILABLE:
+                console.print(f"[green]✅ {label} 저장:[/green] {columnar_file}")
+            else:
+                print(f"✅ {label} 저장: {columnar_file}")
+        
+        # 정규화 저장 (요금제 / 기기 / 팩트 테이블)
+        for normalized_file in save_normalized_tables(df, self.config['save_formats'],
+                                                      self.config['output_dir'], f'KT_공시지원금_{timestamp}'):
+            saved_files.append(normalized_file)
+            
+            if RICH_AVAILABLE:
+                console.print(f"[green]✅ 정규화 저장:[/green] {normalized_file}")
+            else:
+                print(f"✅ 정규화 저장: {normalized_file}")
+        
+        # 체크포인트 / 저널 삭제
         if os.path.exists(self.checkpoint_file):
             os.remove(self.checkpoint_file)
+        self.journal.clear()
         
         return saved_files
     
     def run(self):
         """메인 실행"""
         try:
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.start()
+            self.profiler.start()
+            
             if RICH_AVAILABLE:
                 console.print(Panel.fit(
                     "[bold cyan]KT 공시지원금 크롤러 v7.0[/bold cyan]\n"
@@ -932,6 +1149,7 @@ class KTCrawlerV7:
             
             # 1. 요금제 수집
             self.collect_all_plans()
+            self.profiler.checkpoint('요금제 수집 완료', all_plans=self.all_plans)
             
             if not self.all_plans:
                 if RICH_AVAILABLE:
@@ -942,9 +1160,13 @@ class KTCrawlerV7:
             
             # 2. 병렬 크롤링
             self.run_parallel_crawling()
+            self.close_unseen_history()
+            self.profiler.checkpoint('크롤링 완료', data=self.data)
             
             # 3. 데이터 저장
-            saved_files = self.save_data()
+            with self.profiler.profile('save'):
+                saved_files = self.save_data()
+            self.profiler.checkpoint('저장 완료', data=self.data)
             
             # 최종 요약
             if saved_files and RICH_AVAILABLE:
@@ -969,6 +1191,7 @@ class KTCrawlerV7:
             # 중간 데이터 저장
             if self.data:
                 self.save_intermediate()
+            self.close_result_sink()
             
             return []
             
@@ -982,8 +1205,18 @@ class KTCrawlerV7:
             # 중간 데이터 저장
             if self.data:
                 self.save_intermediate()
+            self.close_result_sink()
             
             return []
+        
+        finally:
+            self.save_metrics()
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.stop()
+            self.save_profile()
+            self.journal.close()
+            if self.history_store:
+                self.history_store.close()
 
 
 def main():
@@ -1003,6 +1236,30 @@ def main():
                         help='출력 디렉토리')
     parser.add_argument('--no-intermediate', action='store_true',
                         help='중간 저장 비활성화')
+    parser.add_argument('--intermediate-format', choices=['csv', 'jsonl'], default='csv',
+                        help='중간 저장 형식 (기본: csv)')
+    parser.add_argument('--formats', nargs='+',
+                        choices=['excel', 'csv', 'json', 'jsonl', 'parquet', 'arrow', 'normalized'],
+                        default=['excel', 'csv', 'json'],
+                        help='저장 형식 (기본: excel csv json)')
+    parser.add_argument('--resume', action='store_true',
+                        help='이전 실행 저널에서 완료된 요금제를 복원하고 남은 요금제만 수집')
+    parser.add_argument('--jsonl-compression', choices=['none', 'gzip', 'zstd'], default='none',
+                        help='JSONL 압축 방식 (기본: none)')
+    parser.add_argument('--history-db', type=str, default=None,
+                        help='공시지원금 이력 SQLite 경로 (지정 시 실행마다 누적 저장)')
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help='단계별 소요 시간 메트릭 JSON 경로 (기본: 출력 디렉토리에 자동 생성)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='실행 중 Prometheus /metrics 엔드포인트 포트 (기본: 사용 안 함)')
+    parser.add_argument('--metrics-textfile', type=str, default=None,
+                        help='Prometheus textfile collector 경로 (.prom, 기본: 사용 안 함)')
+    parser.add_argument('--profile', action='store_true',
+                        help='작업별 cProfile 결과를 합쳐 리포트(.txt)와 .pstats 저장')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='체크포인트마다 tracemalloc 스냅샷 기록 (--profile 포함)')
+    parser.add_argument('--profile-sort', choices=SORT_KEYS, default='cumulative',
+                        help='프로파일 리포트 정렬 기준 (기본: cumulative)')
     parser.add_argument('--test', action='store_true',
                         help='테스트 모드 (처음 5개만)')
     
@@ -1015,7 +1272,18 @@ def main():
         'show_browser': args.show_browser,
         'headless': not args.show_browser,
         'output_dir': args.output,
-        'save_intermediate': not args.no_intermediate
+        'save_intermediate': not args.no_intermediate,
+        'intermediate_format': args.intermediate_format,
+        'resume': args.resume,
+        'save_formats': args.formats,
+        'jsonl_compression': args.jsonl_compression,
+        'history_db': args.history_db,
+        'metrics_file': args.metrics_file,
+        'metrics_port': args.metrics_port,
+        'metrics_textfile': args.metrics_textfile,
+        'profile': args.profile,
+        'profile_memory': args.profile_memory,
+        'profile_sort': args.profile_sort
     }
     
     # 크롤러 실행
@@ -48,6 +48,16 @@ import re
 from tqdm import tqdm
 from collections import defaultdict
 
+from exporters import save_columnar_formats, save_normalized_tables, save_jsonl_format, iter_frame_records
+from records import ColumnarRows
+from history_store import HistoryStore
+from price_utils import parse_price
+from manufacturers import classify_manufacturer
+from instrumentation import (StageTimer, timed, JOBS_COMPLETED, JOBS_FAILED, ROWS_COLLECTED, RETRIES,
+                             DRIVERS_STARTED, DRIVERS_CLOSED)
+from metrics_exporter import MetricsExporter
+from profiling import Profiler, SORT_KEYS
+
 
 # 로깅 설정
 def setup_logging(log_level='INFO', log_file=None):
@@ -87,7 +97,7 @@ class LGUPlusCrawler:
         """
         self.base_url = "https://www.lguplus.com/mobile/financing-model"
         self.driver = None
-        self.data = []
+        self.data = ColumnarRows()  # 컬럼 단위 저장 (반복 문자열 intern)
         self.wait = None
         
         # 기본 설정 (헤드리스 모드 기본값 True로 변경)
@@ -99,6 +109,7 @@ class LGUPlusCrawler:
             'retry_count': 3,
             'delay_between_actions': 2,  # 헤드리스 모드를 위해 지연 증가
             'save_formats': ['excel', 'csv', 'json'],
+            'jsonl_compression': None,  # JSONL 압축 (None, 'gzip', 'zstd')
             'output_dir': 'data',
             'include_rate_plans': True,
             'max_rate_plans': 0,  # 0=전체 요금제
@@ -108,7 +119,15 @@ class LGUPlusCrawler:
             'test_mode': False,
             'show_progress': True,
             'max_pages': 20,  # 최대 20페이지로 제한
-            'headless_wait_multiplier': 1.5  # 헤드리스 모드에서 대기 시간 배수
+            'headless_wait_multiplier': 1.5,  # 헤드리스 모드에서 대기 시간 배수
+            'history_db': None,  # 이력 저장소 경로 (None = 사용 안 함)
+            'metrics_file': None,  # 단계별 메트릭 JSON 경로 (None = output_dir에 자동 생성)
+            'metrics_port': None,  # 실행 중 /metrics 엔드포인트 포트 (None = 사용 안 함)
+            'metrics_textfile': None,  # Prometheus textfile collector 경로 (.prom, None = 사용 안 함)
+            'metrics_interval': 15.0,  # textfile 갱신 간격 (초)
+            'profile': False,  # 작업별 cProfile 병합 리포트 저장
+            'profile_memory': False,  # 체크포인트마다 tracemalloc 스냅샷 (profile 포함)
+            'profile_sort': 'cumulative'  # 프로파일 리포트 정렬 기준
         }
         
         # 사용자 설정 병합
@@ -128,6 +147,26 @@ class LGUPlusCrawler:
         self.total_tasks = 0
         self.completed_tasks = 0
         
+        # 실행 간 이력 저장소
+        self.history_store = HistoryStore(self.config['history_db']) if self.config.get('history_db') else None
+        
+        # 단계별 소요 시간 계측
+        self.timer = StageTimer('LG U+')
+        
+        # 실행 중 메트릭 노출 (/metrics, textfile)
+        self.metrics_exporter = MetricsExporter({self.timer.name: self.timer},
+                                                port=self.config.get('metrics_port'),
+                                                textfile=self.config.get('metrics_textfile'),
+                                                interval=self.config.get('metrics_interval', 15.0))
+        
+        # 프로파일링 모드 (작업마다 cProfile, 선택적으로 tracemalloc 체크포인트)
+        self.profiler = Profiler(self.config.get('profile', False),
+                                 memory=self.config.get('profile_memory', False),
+                                 sort=self.config.get('profile_sort', 'cumulative'))
+        if self.profiler.enabled:
+            self.timer.profiler = self.profiler
+        
+    @timed('driver_launch')
     def setup_driver(self):
         """Chrome 드라이버 설정 (헤드리스 모드 최적화)"""
         chrome_options = Options()
@@ -199,6 +238,7 @@ class LGUPlusCrawler:
         
         # WebDriverWait 설정
         self.wait = WebDriverWait(self.driver, self.config['element_wait_timeout'])
+        self.timer.increment(DRIVERS_STARTED)
         
         logger.info("Chrome 드라이버 설정 완료")
         
@@ -248,6 +288,7 @@ class LGUPlusCrawler:
         except Exception as e:
             logger.debug(f"페이지 대기 중 타임아웃: {e}")
             
+    @timed('modal')
     def check_and_handle_modal(self, max_attempts=3) -> bool:
         """모달 확인 및 처리 (헤드리스 모드 최적화)"""
         for attempt in range(max_attempts):
@@ -391,6 +432,7 @@ class LGUPlusCrawler:
             except Exception as e:
                 if retry < max_retries - 1:
                     logger.debug(f"{name} 선택 재시도 ({retry + 1}/{max_retries})")
+                    self.timer.increment(RETRIES)
                     time.sleep(self.get_wait_time(1))
                     continue
                 else:
@@ -484,6 +526,7 @@ class LGUPlusCrawler:
             logger.error(f"테이블 대기 중 오류: {e}")
             return False
             
+    @timed('rate_plan_price')
     def get_rate_plan_price(self, rate_plan_id: str) -> str:
         """요금제의 월 납부금액 조회"""
         try:
@@ -699,6 +742,7 @@ class LGUPlusCrawler:
             logger.debug(f"현재 페이지 가격 조회 오류: {e}")
             return "0"
             
+    @timed('extract')
     def extract_table_data(self, subscription_type: str, device_type: str, manufacturer: str = "전체", 
                           rate_plan_name: str = "전체", rate_plan_id: str = None, monthly_price: str = "0") -> int:
         """테이블 데이터 추출 (헤드리스 모드 최적화)"""
@@ -786,26 +830,32 @@ class LGUPlusCrawler:
             """)
             
             # 추출된 데이터 처리
+            page_rows = []
             for item in extracted_data:
-                self.data.append({
+                page_rows.append({
                     '가입유형': subscription_type,
                     '기기종류': device_type,
-                    '제조사': manufacturer,
+                    '제조사': manufacturer if manufacturer != '전체' else classify_manufacturer(item['device']),
                     '요금제': rate_plan_name,
                     '요금제ID': rate_plan_id,
-                    '월납부금액': monthly_price,
+                    '월납부금액': parse_price(monthly_price),
                     '기기명': item['device'],
-                    '출고가': item['price'],
+                    '출고가': parse_price(item['price']),
                     '공시일자': item['date'],
                     '요금제유지기간': item['planDuration'],
-                    '공시지원금': item['subsidy'],
-                    '추가공시지원금': item['additionalSubsidy'],
-                    '지원금총액': item['totalSubsidy'],
-                    '추천할인': item['recommendedDiscount'],
-                    '최종구매가': item['finalPrice'],
+                    '공시지원금': parse_price(item['subsidy']),
+                    '추가공시지원금': parse_price(item['additionalSubsidy']),
+                    '지원금총액': parse_price(item['totalSubsidy']),
+                    '추천할인': parse_price(item['recommendedDiscount']),
+                    '최종구매가': parse_price(item['finalPrice']),
                     '크롤링시간': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
                 extracted_count += 1
+            
+            self.data.extend(page_rows)
+            self.timer.increment(ROWS_COLLECTED, len(page_rows))
+            if self.history_store:
+                self.history_store.record_rows(page_rows, carrier='LG U+')
                 
             logger.info(f"페이지에서 {extracted_count}개 데이터 추출")
             return extracted_count
@@ -872,6 +922,7 @@ class LGUPlusCrawler:
                     break
                     
                 # 다음 페이지 확인 (JavaScript 사용)
+                pagination_start = time.perf_counter()
                 has_next = self.driver.execute_script("""
                     var pagination = document.querySelector('ul.pagination, div.pagination, nav[aria-label="pagination"]');
                     if (!pagination) return false;
@@ -907,6 +958,7 @@ class LGUPlusCrawler:
                     logger.info(f"다음 페이지로 이동 (페이지 {page + 1})")
                     time.sleep(self.get_wait_time(3))
                     self.wait_for_page_ready()
+                    self.timer.record('pagination', time.perf_counter() - pagination_start)
                     page += 1
                 else:
                     logger.info(f"마지막 페이지 도달 (페이지 {page})")
@@ -1015,6 +1067,7 @@ class LGUPlusCrawler:
         try:
             if self.driver:
                 self.driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
                 logger.info("기존 드라이버 종료")
                 
             time.sleep(2)
@@ -1064,9 +1117,10 @@ class LGUPlusCrawler:
                 for sub_value, sub_name in subscription_types:
                     try:
                         # 페이지 로드
-                        self.driver.get(self.base_url)
-                        self.wait_for_page_ready()
-                        time.sleep(self.get_wait_time(1))
+                        with self.timer.span('page_load'):
+                            self.driver.get(self.base_url)
+                            self.wait_for_page_ready()
+                            time.sleep(self.get_wait_time(1))
                         
                         # 옵션 선택
                         if not self.select_option('가입유형', sub_value):
@@ -1154,6 +1208,8 @@ class LGUPlusCrawler:
                     
                     retry_count = 0
                     while retry_count < self.config['retry_count']:
+                        if retry_count > 0:
+                            self.timer.increment(RETRIES)
                         try:
                             # 세션 상태 확인 및 재시작
                             if not self.check_driver_session():
@@ -1161,9 +1217,10 @@ class LGUPlusCrawler:
                                 self.restart_driver()
                             
                             # 페이지 새로고침
-                            self.driver.get(self.base_url)
-                            self.wait_for_page_ready()
-                            time.sleep(self.get_wait_time(3))
+                            with self.timer.span('page_load'):
+                                self.driver.get(self.base_url)
+                                self.wait_for_page_ready()
+                                time.sleep(self.get_wait_time(3))
                             
                             # 옵션 선택
                             if not self.select_option('가입유형', sub_value):
@@ -1187,6 +1244,7 @@ class LGUPlusCrawler:
                             
                             if extracted > 0:
                                 logger.info(f"✓ {sub_name} - {dev_name} - 전체: {extracted}개 데이터 수집 성공")
+                                self.timer.increment(JOBS_COMPLETED)
                                 break
                             else:
                                 logger.warning(f"데이터 추출 실패, 재시도 {retry_count + 1}/{self.config['retry_count']}")
@@ -1206,6 +1264,8 @@ class LGUPlusCrawler:
                             if retry_count >= self.config['retry_count']:
                                 logger.error(f"최대 재시도 횟수 초과: {sub_name} - {dev_name}")
                                 
+                    else:
+                        self.timer.increment(JOBS_FAILED)
                     pbar.update(1)
                     
                     # 메모리 관리를 위해 주기적으로 드라이버 재시작
@@ -1239,98 +1299,108 @@ class LGUPlusCrawler:
                     for i, rate_plan in enumerate(rate_plans):
                         logger.info(f"\n요금제 ({i+1}/{len(rate_plans)}): {rate_plan['name']}")
                         
-                        try:
-                            # 세션 체크
-                            if not self.check_driver_session():
-                                self.restart_driver()
+                        with self.timer.job(f"{sub_name} - {dev_name} - {rate_plan['name']}"):
+                            try:
+                                # 세션 체크
+                                if not self.check_driver_session():
+                                    self.restart_driver()
                                 
-                            # 페이지 새로고침
-                            self.driver.get(self.base_url)
-                            self.wait_for_page_ready()
-                            time.sleep(self.get_wait_time(3))
+                                # 페이지 새로고침
+                                with self.timer.span('page_load'):
+                                    self.driver.get(self.base_url)
+                                    self.wait_for_page_ready()
+                                    time.sleep(self.get_wait_time(3))
                             
-                            # 옵션 재선택
-                            self.select_option('가입유형', sub_value)
-                            self.select_option('기기종류', dev_value)
+                                # 옵션 재선택
+                                self.select_option('가입유형', sub_value)
+                                self.select_option('기기종류', dev_value)
                             
-                            # 요금제 선택
-                            if self.open_rate_plan_modal():
-                                # JavaScript로 요금제 선택
-                                selected = self.driver.execute_script("""
-                                    var radio = document.querySelector('input[id="' + arguments[0] + '"]');
-                                    if (radio && !radio.checked) {
-                                        radio.checked = true;
-                                        var event = new Event('change', { bubbles: true });
-                                        radio.dispatchEvent(event);
+                                # 요금제 선택
+                                plan_select_start = time.perf_counter()
+                                if self.open_rate_plan_modal():
+                                    # JavaScript로 요금제 선택
+                                    selected = self.driver.execute_script("""
+                                        var radio = document.querySelector('input[id="' + arguments[0] + '"]');
+                                        if (radio && !radio.checked) {
+                                            radio.checked = true;
+                                            var event = new Event('change', { bubbles: true });
+                                            radio.dispatchEvent(event);
                                         
-                                        var label = document.querySelector('label[for="' + arguments[0] + '"]');
-                                        if (label) label.click();
+                                            var label = document.querySelector('label[for="' + arguments[0] + '"]');
+                                            if (label) label.click();
                                         
-                                        return true;
-                                    }
-                                    return false;
-                                """, rate_plan["id"])
+                                            return true;
+                                        }
+                                        return false;
+                                    """, rate_plan["id"])
                                 
-                                if not selected:
-                                    logger.error(f"요금제 선택 실패: {rate_plan['name']}")
-                                    main_pbar.update(1)
-                                    continue
+                                    if not selected:
+                                        logger.error(f"요금제 선택 실패: {rate_plan['name']}")
+                                        self.timer.increment(JOBS_FAILED)
+                                        main_pbar.update(1)
+                                        continue
                                 
-                                time.sleep(self.get_wait_time(1))
+                                    time.sleep(self.get_wait_time(1))
                                 
-                                # 적용 버튼 클릭
-                                applied = self.driver.execute_script("""
-                                    var applyBtn = document.querySelector('button.c-btn-solid-1-m');
-                                    if (applyBtn) {
-                                        applyBtn.click();
-                                        return true;
-                                    }
-                                    return false;
-                                """)
+                                    # 적용 버튼 클릭
+                                    applied = self.driver.execute_script("""
+                                        var applyBtn = document.querySelector('button.c-btn-solid-1-m');
+                                        if (applyBtn) {
+                                            applyBtn.click();
+                                            return true;
+                                        }
+                                        return false;
+                                    """)
                                 
-                                if not applied:
-                                    logger.error("적용 버튼을 찾을 수 없습니다")
-                                    main_pbar.update(1)
-                                    continue
+                                    if not applied:
+                                        logger.error("적용 버튼을 찾을 수 없습니다")
+                                        self.timer.increment(JOBS_FAILED)
+                                        main_pbar.update(1)
+                                        continue
                                     
-                                time.sleep(self.get_wait_time(3))
+                                    time.sleep(self.get_wait_time(3))
+                                self.timer.record('plan_select', time.perf_counter() - plan_select_start)
                                 
-                            # 제조사 전체 선택
-                            if not self.select_all_manufacturers():
-                                logger.error("제조사 전체 선택 실패")
-                                main_pbar.update(1)
-                                continue
+                                # 제조사 전체 선택
+                                if not self.select_all_manufacturers():
+                                    logger.error("제조사 전체 선택 실패")
+                                    self.timer.increment(JOBS_FAILED)
+                                    main_pbar.update(1)
+                                    continue
                             
-                            # 데이터 로딩 대기
-                            time.sleep(self.get_wait_time(3))
+                                # 데이터 로딩 대기
+                                time.sleep(self.get_wait_time(3))
                             
-                            # 요금제 월 납부금액 조회
-                            monthly_price = "0"
-                            if 'value' in rate_plan and rate_plan['value']:
-                                logger.info(f"요금제 {rate_plan['name']} ({rate_plan['value']}) 월 납부금액 조회 중...")
-                                monthly_price = self.get_rate_plan_price(rate_plan['value'])
+                                # 요금제 월 납부금액 조회
+                                monthly_price = "0"
+                                if 'value' in rate_plan and rate_plan['value']:
+                                    logger.info(f"요금제 {rate_plan['name']} ({rate_plan['value']}) 월 납부금액 조회 중...")
+                                    monthly_price = self.get_rate_plan_price(rate_plan['value'])
                                 
-                                if monthly_price == "0":
-                                    logger.warning(f"요금제 {rate_plan['name']}의 가격을 찾을 수 없습니다. 가격 정보 없이 진행합니다.")
-                                else:
-                                    logger.info(f"월 납부금액: {monthly_price}원")
+                                    if monthly_price == "0":
+                                        logger.warning(f"요금제 {rate_plan['name']}의 가격을 찾을 수 없습니다. 가격 정보 없이 진행합니다.")
+                                    else:
+                                        logger.info(f"월 납부금액: {monthly_price}원")
                             
-                            # 데이터 추출
-                            extracted = self.handle_pagination(sub_name, dev_name, "전체", rate_plan['name'], 
-                                                             rate_plan.get('value'), monthly_price)
+                                # 데이터 추출
+                                extracted = self.handle_pagination(sub_name, dev_name, "전체", rate_plan['name'], 
+                                                                 rate_plan.get('value'), monthly_price)
                             
-                            if extracted > 0:
-                                logger.info(f"✓ {rate_plan['name']}: {extracted}개 데이터 수집 성공")
-                            else:
-                                logger.warning(f"데이터 추출 실패: {rate_plan['name']}")
+                                if extracted > 0:
+                                    logger.info(f"✓ {rate_plan['name']}: {extracted}개 데이터 수집 성공")
+                                    self.timer.increment(JOBS_COMPLETED)
+                                else:
+                                    logger.warning(f"데이터 추출 실패: {rate_plan['name']}")
+                                    self.timer.increment(JOBS_FAILED)
                                 
-                        except Exception as e:
-                            error_msg = str(e).lower()
-                            if 'invalid session id' in error_msg or 'session' in error_msg:
-                                logger.error("세션 오류 발생. 드라이버를 재시작합니다.")
-                                self.restart_driver()
+                            except Exception as e:
+                                error_msg = str(e).lower()
+                                if 'invalid session id' in error_msg or 'session' in error_msg:
+                                    logger.error("세션 오류 발생. 드라이버를 재시작합니다.")
+                                    self.restart_driver()
                                 
-                            logger.error(f"요금제별 크롤링 오류: {e}")
+                                logger.error(f"요금제별 크롤링 오류: {e}")
+                                self.timer.increment(JOBS_FAILED)
                             
                         main_pbar.update(1)
                     
@@ -1347,7 +1417,7 @@ class LGUPlusCrawler:
             return []
             
         # DataFrame 생성
-        df = pd.DataFrame(self.data)
+        df = self.data.to_dataframe()
         
         # 중복 제거
         original_count = len(df)
@@ -1375,9 +1445,22 @@ class LGUPlusCrawler:
         if 'json' in self.config['save_formats']:
             json_file = os.path.join(self.config['output_dir'], f'LGUPlus_지원금정보_{timestamp}.json')
             with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+                json.dump(self.data.to_dicts(), f, ensure_ascii=False, indent=2)
             saved_files.append(json_file)
             logger.info(f"JSON 파일 저장: {json_file}")
+        
+        # JSONL 저장 (행 단위 스트리밍, 선택적 압축)
+        saved_files.extend(save_jsonl_format(iter_frame_records(df), self.config['save_formats'],
+                                             self.config['output_dir'], f'LGUPlus_지원금정보_{timestamp}',
+                                             self.config.get('jsonl_compression')))
+        
+        # Parquet / Arrow 저장 (가격 문자열 컬럼은 정수로 변환됨)
+        saved_files.extend(save_columnar_formats(df, self.config['save_formats'],
+                                                 self.config['output_dir'], f'LGUPlus_지원금정보_{timestamp}'))
+        
+        # 정규화 저장 (요금제 / 기기 / 팩트 테이블)
+        saved_files.extend(save_normalized_tables(df, self.config['save_formats'],
+                                                  self.config['output_dir'], f'LGUPlus_지원금정보_{timestamp}'))
             
         # 통계 출력
         self._print_statistics(df)
@@ -1480,6 +1563,10 @@ class LGUPlusCrawler:
         start_time = time.time()
         
         try:
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.start()
+            self.profiler.start()
+            
             logger.info("="*60)
             logger.info("LG U+ 휴대폰 지원금 크롤러 v3.9 시작")
             logger.info("="*60)
@@ -1497,24 +1584,35 @@ class LGUPlusCrawler:
             
             # 초기 페이지 로드
             logger.info(f"페이지 로딩: {self.base_url}")
-            self.driver.get(self.base_url)
-            self.wait_for_page_ready()
-            time.sleep(self.get_wait_time(3))
-            
-            # 테스트 모드 확인
-            if self.config.get('test_mode', False):
-                self._test_one_rate_plan()
-            else:
-                # 크롤링 실행
-                self.crawl_all_combinations()
+            with self.timer.span('page_load'):
+                self.driver.get(self.base_url)
+                self.wait_for_page_ready()
+                time.sleep(self.get_wait_time(3))
+            
+            # 테스트 모드 확인 (단일 스레드라 크롤링 전체를 한 프로파일 구간으로)
+            with self.profiler.profile('crawl'):
+                if self.config.get('test_mode', False):
+                    self._test_one_rate_plan()
+                else:
+                    # 크롤링 실행
+                    self.crawl_all_combinations()
+            self.close_unseen_history()
+            self.profiler.checkpoint('크롤링 완료', data=self.data,
+                                     rate_plan_price_cache=self.rate_plan_price_cache,
+                                     all_rate_plans=self.all_rate_plans)
             
             # 데이터 저장
-            saved_files = self.save_data()
+            with self.profiler.profile('save'):
+                saved_files = self.save_data()
+            self.profiler.checkpoint('저장 완료', data=self.data)
             
             # 실행 시간
             elapsed_time = time.time() - start_time
             logger.info(f"\n총 실행 시간: {elapsed_time/60:.1f}분")
             
+            # 단계별 소요 시간 분포
+            self.timer.print_summary()
+            
             if saved_files:
                 logger.info("\n✅ 크롤링이 성공적으로 완료되었습니다!")
                 logger.info("저장된 파일:")
@@ -1538,7 +1636,38 @@ class LGUPlusCrawler:
         finally:
             if self.driver:
                 self.driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
                 logger.info("드라이버 종료")
+            self.save_metrics()
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.stop()
+            self.save_profile()
+            if self.history_store:
+                self.history_store.close()
+    
+    def close_unseen_history(self):
+        """전체 수집을 마쳤으면 이번 실행에서 보이지 않은 키(공시 철회)의 이력 유효기간 종료"""
+        if not self.history_store or self.config.get('test_mode'):
+            return
+        if self.config['max_rate_plans'] > 0 or self.timer.counters().get(JOBS_FAILED):
+            return
+        self.history_store.close_unseen('LG U+')
+    
+    def save_profile(self):
+        """프로파일 리포트 / .pstats / 메모리 체크포인트 저장"""
+        if not self.profiler.enabled:
+            return
+        self.profiler.stop(os.path.join(
+            self.config['output_dir'], f"LGUPlus_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"))
+    
+    def save_metrics(self):
+        """단계별 메트릭 JSON 저장"""
+        metrics_file = self.config.get('metrics_file') or os.path.join(
+            self.config['output_dir'], f"LGUPlus_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            self.timer.save(metrics_file)
+        except Exception as e:
+            logger.error(f"메트릭 저장 실패: {e}")
 
 
 def main():
@@ -1570,7 +1699,7 @@ def main():
     parser.add_argument('--output', type=str, default='data',
                         help='출력 디렉토리 (기본값: data)')
     parser.add_argument('--formats', nargs='+', 
-                        choices=['excel', 'csv', 'json'],
+                        choices=['excel', 'csv', 'json', 'jsonl', 'parquet', 'arrow', 'normalized'],
                         default=['excel', 'csv'],
                         help='저장 형식 선택 (기본값: excel csv)')
     parser.add_argument('--debug', action='store_true',
@@ -1583,6 +1712,22 @@ def main():
                         help='재시도 횟수 (기본값: 3)')
     parser.add_argument('--restart-interval', type=int, default=3,
                         help='드라이버 재시작 간격 (조합 수, 기본값=3)')
+    parser.add_argument('--jsonl-compression', choices=['none', 'gzip', 'zstd'], default='none',
+                        help='JSONL 압축 방식 (기본: none)')
+    parser.add_argument('--history-db', type=str, default=None,
+                        help='공시지원금 이력 SQLite 경로 (지정 시 실행마다 누적 저장)')
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help='단계별 소요 시간 메트릭 JSON 경로 (기본: 출력 디렉토리에 자동 생성)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='실행 중 Prometheus /metrics 엔드포인트 포트 (기본: 사용 안 함)')
+    parser.add_argument('--metrics-textfile', type=str, default=None,
+                        help='Prometheus textfile collector 경로 (.prom, 기본: 사용 안 함)')
+    parser.add_argument('--profile', action='store_true',
+                        help='작업별 cProfile 결과를 합쳐 리포트(.txt)와 .pstats 저장')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='체크포인트마다 tracemalloc 스냅샷 기록 (--profile 포함)')
+    parser.add_argument('--profile-sort', choices=SORT_KEYS, default='cumulative',
+                        help='프로파일 리포트 정렬 기준 (기본: cumulative)')
     
     args = parser.parse_args()
     
@@ -1599,10 +1744,18 @@ def main():
         'max_pages': args.max_pages,
         'output_dir': args.output,
         'save_formats': args.formats,
+        'jsonl_compression': args.jsonl_compression,
         'debug_mode': args.debug,
         'retry_count': args.retry,
         'restart_interval': args.restart_interval,
-        'test_mode': args.test_one_rate_plan
+        'test_mode': args.test_one_rate_plan,
+        'history_db': args.history_db,
+        'metrics_file': args.metrics_file,
+        'metrics_port': args.metrics_port,
+        'metrics_textfile': args.metrics_textfile,
+        'profile': args.profile,
+        'profile_memory': args.profile_memory,
+        'profile_sort': args.profile_sort
     }
     
     # 크롤러 생성
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+기기명 기반 제조사 분류기
+
+3사 크롤러가 공통으로 사용하는 제조사 판별 함수 모음.
+모든 키워드를 정규식 하나로 컴파일해 기기명을 한 번만 훑고,
+같은 기기명은 캐시된 결과를 그대로 반환한다.
+
+주요 특징:
+    - 제조사별 한글/영문 키워드를 하나의 컴파일된 패턴으로 매칭
+    - 기기명 단위 LRU 캐시 (고유 기기 수만큼만 계산)
+    - 리스트 / pandas 컬럼 일괄 분류
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Iterable
+
+import pandas as pd
+
+# 알 수 없는 제조사
+UNKNOWN_MANUFACTURER = '기타'
+
+# 제조사 → 키워드 (소문자, 정규식)
+MANUFACTURER_KEYWORDS = {
+    '삼성': ['갤럭시', 'galaxy', '삼성', 'samsung', r'sm-[a-z]\d'],
+    '애플': ['아이폰', 'iphone', '아이패드', 'ipad', '애플', 'apple'],
+    'LG': [r'(?<![a-z])lg(?![a-z])', '엘지'],
+    '샤오미': ['샤오미', 'xiaomi', '레드미', 'redmi', '홍미'],
+    '모토로라': ['모토로라', 'motorola', r'(?<![a-z])moto(?![a-z])'],
+    '구글': ['픽셀', 'pixel'],
+}
+
+# 제조사마다 named group 하나 → 단일 패턴
+_GROUP_NAMES = {f"m{i}": name for i, name in enumerate(MANUFACTURER_KEYWORDS)}
+_MANUFACTURER_PATTERN = re.compile('|'.join(
+    f"(?P<{group}>{'|'.join(MANUFACTURER_KEYWORDS[name])})"
+    for group, name in _GROUP_NAMES.items()
+))
+
+
+@lru_cache(maxsize=8192)
+def classify_manufacturer(device_name: str) -> str:
+    """기기명 → 제조사 (결과 캐시)"""
+    if not device_name:
+        return UNKNOWN_MANUFACTURER
+    match = _MANUFACTURER_PATTERN.search(device_name.lower())
+    return _GROUP_NAMES[match.lastgroup] if match else UNKNOWN_MANUFACTURER
+
+
+def classify_manufacturers(device_names: Iterable[str]) -> List[str]:
+    """기기명 목록 일괄 분류"""
+    return [classify_manufacturer(name) if isinstance(name, str) else UNKNOWN_MANUFACTURER
+            for name in device_names]
+
+
+def manufacturer_series(device_names: pd.Series) -> pd.Series:
+    """기기명 컬럼 → 제조사 컬럼 (고유 기기명만 분류)"""
+    if isinstance(device_names.dtype, pd.CategoricalDtype):
+        device_names = device_names.astype(object)
+    unique_names = device_names.dropna().unique()
+    mapping = {name: classify_manufacturer(str(name)) for name in unique_names}
+    return device_names.map(mapping).fillna(UNKNOWN_MANUFACTURER)
+
+
+def clear_cache():
+    """분류 캐시 초기화"""
+    classify_manufacturer.cache_clear()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Prometheus 형식 메트릭 내보내기
+
+크롤러의 StageTimer(단계 구간 + 카운터)를 Prometheus 텍스트 형식으로 변환해
+실행 중에 /metrics HTTP 엔드포인트와 textfile collector 파일로 내보낸다.
+예약 실행되는 크롤링의 처리량 저하와 멈춤을 대시보드에서 보기 위한 용도.
+
+주요 특징:
+    - 통신사 라벨이 붙은 메트릭 (통합 크롤러는 통신사별 StageTimer를 한 번에 노출)
+    - 작업 완료/실패, 수집 행, 재시도 카운터 / 실행 중 드라이버, 진행 중 작업 게이지
+    - 단계별 소요 시간 히스토그램 (드라이버 실행, 페이지 로드, 모달, 추출, 페이지 이동 등)
+    - 마지막 활동 시각 게이지 → time() - 값 으로 멈춤 감지
+    - 외부 의존성 없음 (prometheus_client 미사용, http.server)
+    - textfile은 임시 파일에 쓴 뒤 교체 (node_exporter가 쓰다 만 파일을 읽지 않도록)
+"""
+
+import os
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Sequence, Union
+
+from instrumentation import (StageTimer, JOBS_COMPLETED, JOBS_FAILED, ROWS_COLLECTED, RETRIES)
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = 'telecom_crawler'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 단계 소요 시간 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# StageTimer 카운터 → (메트릭 이름, 설명)
+COUNTER_METRICS = [
+    (JOBS_COMPLETED, 'jobs_completed_total', '완료된 작업 수 (요금제/조합 단위)'),
+    (JOBS_FAILED, 'jobs_failed_total', '실패한 작업 수'),
+    (ROWS_COLLECTED, 'rows_collected_total', '수집한 데이터 행 수'),
+    (RETRIES, 'retries_total', '재시도 횟수'),
+]
+
+TimerSource = Union[Dict[str, StageTimer], Callable[[], Dict[str, StageTimer]]]
+
+
+def _escape(value: str) -> str:
+    """라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    """{key="value",...} 라벨 문자열"""
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    """Prometheus 숫자 표기"""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metrics(timers: Dict[str, StageTimer], buckets: Sequence[float] = DEFAULT_BUCKETS) -> str:
+    """
+    통신사별 StageTimer → Prometheus 텍스트 형식
+
+    Args:
+        timers: {통신사: StageTimer}
+        buckets: 단계 소요 시간 히스토그램 버킷 상한 (초)
+    """
+    timers = list(timers.items())
+    lines = []
+
+    def family(name: str, metric_type: str, help_text: str):
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+
+    counters = {carrier: timer.counters() for carrier, timer in timers}
+    for counter, name, help_text in COUNTER_METRICS:
+        family(name, 'counter', help_text)
+        for carrier, _ in timers:
+            lines.append(f"{METRIC_PREFIX}_{name}{_labels(carrier=carrier)} {counters[carrier].get(counter, 0)}")
+
+    family('active_drivers', 'gauge', '실행 중인 Chrome 드라이버 수')
+    for carrier, timer in timers:
+        lines.append(f"{METRIC_PREFIX}_active_drivers{_labels(carrier=carrier)} {timer.active_drivers}")
+
+    family('active_jobs', 'gauge', '진행 중인 작업 수')
+    for carrier, timer in timers:
+        lines.append(f"{METRIC_PREFIX}_active_jobs{_labels(carrier=carrier)} {timer.active_jobs}")
+
+    family('start_time_seconds', 'gauge', '크롤링 시작 시각 (유닉스 시간)')
+    for carrier, timer in timers:
+        lines.append(f"{METRIC_PREFIX}_start_time_seconds{_labels(carrier=carrier)} {_number(timer.started_at)}")
+
+    family('last_activity_seconds', 'gauge', '마지막 단계 기록/카운터 갱신 시각 (유닉스 시간)')
+    for carrier, timer in timers:
+        lines.append(f"{METRIC_PREFIX}_last_activity_seconds{_labels(carrier=carrier)} {_number(timer.last_activity)}")
+
+    family('stage_duration_seconds', 'histogram', '단계별 소요 시간 (초)')
+    for carrier, timer in timers:
+        for stage, (bucket_counts, total, count) in timer.histograms(buckets).items():
+            for bound, bucket_count in zip(buckets, bucket_counts):
+                lines.append(f"{METRIC_PREFIX}_stage_duration_seconds_bucket"
+                             f"{_labels(carrier=carrier, stage=stage, le=_number(float(bound)))} {bucket_count}")
+            lines.append(f"{METRIC_PREFIX}_stage_duration_seconds_bucket"
+                         f"{_labels(carrier=carrier, stage=stage, le='+Inf')} {count}")
+            lines.append(f"{METRIC_PREFIX}_stage_duration_seconds_sum"
+                         f"{_labels(carrier=carrier, stage=stage)} {_number(round(total, 6))}")
+            lines.append(f"{METRIC_PREFIX}_stage_duration_seconds_count"
+                         f"{_labels(carrier=carrier, stage=stage)} {count}")
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_textfile(file_path: str, content: str):
+    """textfile collector 파일 교체 쓰기 (임시 파일 → os.replace)"""
+    directory = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, file_path)
+
+
+def make_handler(exporter: 'MetricsExporter'):
+    """/metrics 요청 핸들러 클래스 생성"""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        server_version = 'TelecomCrawlerMetrics/1.0'
+
+        def do_GET(self):
+            if self.path.split('?', 1)[0].rstrip('/') != '/metrics':
+                self.send_error(404)
+                return
+
+            body = exporter.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return MetricsHandler
+
+
+class MetricsExporter:
+    """실행 중 메트릭 노출 (/metrics 엔드포인트 + textfile 주기 저장)"""
+
+    def __init__(self, timers: TimerSource, port: Optional[int] = None, host: str = '127.0.0.1',
+                 textfile: Optional[str] = None, interval: float = 15.0,
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            timers: {통신사: StageTimer} 또는 이를 돌려주는 함수 (실행 중 추가되는 통신사 반영)
+            port: /metrics 포트 (None = HTTP 엔드포인트 사용 안 함)
+            host: 바인드 주소
+            textfile: textfile collector 경로 (.prom, None = 사용 안 함)
+            interval: textfile 갱신 간격 (초)
+            buckets: 단계 소요 시간 히스토그램 버킷 상한 (초)
+        """
+        self.timers = timers
+        self.port = port
+        self.host = host
+        self.textfile = textfile
+        self.interval = interval
+        self.buckets = buckets
+
+        self._server = None
+        self._threads = []
+        self._stop = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        """내보낼 대상이 있는지"""
+        return self.port is not None or bool(self.textfile)
+
+    def render(self) -> str:
+        """현재 메트릭 텍스트"""
+        timers = self.timers() if callable(self.timers) else self.timers
+        return render_metrics(timers, self.buckets)
+
+    def write_textfile(self):
+        """textfile 갱신"""
+        if not self.textfile:
+            return
+        try:
+            write_textfile(self.textfile, self.render())
+        except Exception as e:
+            logger.error(f"메트릭 textfile 저장 실패: {e}")
+
+    def _textfile_loop(self):
+        while not self._stop.wait(self.interval):
+            self.write_textfile()
+
+    def start(self) -> 'MetricsExporter':
+        """HTTP 엔드포인트 / textfile 갱신 시작 (설정된 것만)"""
+        if self.port is not None:
+            self._server = ThreadingHTTPServer((self.host, self.port), make_handler(self))
+            self._server.daemon_threads = True
+            thread = threading.Thread(target=self._server.serve_forever, name='metrics-http', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            logger.info(f"메트릭 엔드포인트: http://{self.host}:{self._server.server_address[1]}/metrics")
+
+        if self.textfile:
+            self.write_textfile()
+            thread = threading.Thread(target=self._textfile_loop, name='metrics-textfile', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            logger.info(f"메트릭 textfile: {self.textfile} ({self.interval:.0f}초 간격)")
+
+        return self
+
+    def stop(self):
+        """종료 (textfile은 최종 값으로 한 번 더 갱신)"""
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+        self.write_textfile()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+가격 문자열 정규화 유틸리티
+
+3사 크롤러, 통합 크롤러, 검증기, 저장 모듈이 공통으로 사용하는 가격 파싱 함수 모음.
+"1,250,000원", "₩ 99,000", "0원" 같은 문자열을 모두 정수로 변환한다.
+
+주요 특징:
+    - 미리 만든 translate 테이블로 흔한 구분자(쉼표, 원, 공백) 제거
+    - 같은 문자열 반복 파싱 결과 캐시 (lru_cache)
+    - 리스트 일괄 변환 / pandas 컬럼 벡터화 변환
+    - 항상 int 반환 (숫자가 없으면 default)
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Iterable
+
+import numpy as np
+import pandas as pd
+
+# 가격 문자열에 흔히 섞이는 문자 제거용 translate 테이블
+PRICE_STRIP_TABLE = str.maketrans('', '', ',원₩ \t\r\n')
+
+# translate 후에도 숫자 외 문자가 남은 경우 (예: "월 55,000원~", "-")
+_NON_DIGIT = re.compile(r'[^0-9]')
+
+
+@lru_cache(maxsize=16384)
+def _parse_price_text(text: str) -> Optional[int]:
+    """가격 문자열 → 정수 (숫자가 없으면 None, 결과 캐시)"""
+    stripped = text.translate(PRICE_STRIP_TABLE)
+    if not (stripped.isascii() and stripped.isdigit()):
+        stripped = _NON_DIGIT.sub('', stripped)
+    return int(stripped) if stripped else None
+
+
+def parse_price(value, default: Optional[int] = 0) -> Optional[int]:
+    """
+    가격 값 1개 → 정수
+
+    Args:
+        value: 문자열 / 숫자 / None
+        default: 값이 비어 있거나 숫자가 없을 때 반환값
+
+    Returns:
+        int (또는 default)
+    """
+    if value is None:
+        return default
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return default if value != value else int(value)
+
+    text = value if isinstance(value, str) else str(value)
+    if not text:
+        return default
+
+    parsed = _parse_price_text(text)
+    return default if parsed is None else parsed
+
+
+def parse_prices(values: Iterable, default: Optional[int] = 0) -> List[Optional[int]]:
+    """가격 값 목록 일괄 변환"""
+    return [parse_price(value, default) for value in values]
+
+
+def parse_price_series(series: pd.Series, default: Optional[int] = 0) -> pd.Series:
+    """
+    pandas 가격 컬럼 벡터화 변환
+
+    문자열은 숫자만 남긴 뒤 to_numeric, 숫자는 소수점 이하 버림.
+
+    Args:
+        series: 가격 컬럼 (문자열/숫자 혼합 가능)
+        default: 변환 실패 값 (None이면 NaN 유지, float64 반환)
+
+    Returns:
+        default가 있으면 int64, None이면 float64 Series
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        numeric = series.astype('float64')
+    else:
+        is_str = series.map(type).eq(str)
+        digits = series.where(is_str).str.replace(r'[^0-9]', '', regex=True)
+        from_str = pd.to_numeric(digits.where(digits != ''), errors='coerce')
+        from_other = pd.to_numeric(series.where(~is_str), errors='coerce')
+        numeric = from_str.where(is_str, from_other).astype('float64')
+
+    # int() 와 같은 0 방향 버림
+    numeric = np.trunc(numeric)
+
+    if default is None:
+        return numeric
+    return numeric.fillna(default).astype('int64')
+
+
+def clear_cache():
+    """파싱 캐시 초기화"""
+    _parse_price_text.cache_clear()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+크롤러 프로파일링 모드
+
+--profile 로 켜면 워커 스레드의 작업(StageTimer.job)마다 cProfile을 걸고, 끝날 때 스레드별
+결과를 하나로 합쳐 정렬된 텍스트 리포트와 .pstats 파일로 저장한다. 저장/검증 같은 메인 스레드
+구간은 profiler.profile('save')로 감싼다. 스크립트를 고치지 않고 파이썬 쪽 병목(파싱, 검증,
+내보내기)을 찾기 위한 용도.
+
+주요 특징:
+    - 작업 단위 cProfile → pstats.Stats.add로 병합 (스레드 안전)
+    - 같은 스레드 안의 중첩 구간은 바깥 구간 하나로만 계측 (프로파일러 훅 충돌 방지)
+    - Python 3.12+에서 다른 스레드 프로파일러가 켜져 있으면 해당 작업은 건너뛰고 개수만 기록
+    - --profile-memory: 체크포인트마다 tracemalloc 스냅샷 → 직전 대비 증가한 할당 위치와
+      추적 구조(self.data, all_data, rate_plan_price_cache, 복제본 등)의 항목 수 / 대략적 크기
+    - 결과: <prefix>.pstats / <prefix>.txt / <prefix>_memory.json
+
+사용법:
+    python kt_crawler.py --profile
+    python integrated_crawler.py --profile --profile-memory --profile-sort tottime
+    python -m pstats data/KT_profile_20250101_120000.pstats
+"""
+
+import io
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 리포트 정렬 기준 (pstats 정렬 키)
+SORT_KEYS = ['cumulative', 'tottime', 'calls', 'ncalls']
+
+# tracemalloc 스냅샷에서 제외할 프레임 (계측 자체의 할당)
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+def deep_sizeof(obj) -> int:
+    """컨테이너를 따라가며 합친 대략적 크기 (바이트, 공유 객체는 한 번만 계산)"""
+    if hasattr(obj, 'memory_usage') and hasattr(obj, 'columns'):
+        # pandas DataFrame
+        return int(obj.memory_usage(deep=True).sum())
+
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, bool, type(None))):
+            if hasattr(current, '__dict__'):
+                stack.append(vars(current))
+            for slot in getattr(type(current), '__slots__', ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+class Profiler:
+    """작업 단위 cProfile 병합 + tracemalloc 체크포인트"""
+
+    def __init__(self, enabled: bool = False, memory: bool = False, sort: str = 'cumulative',
+                 top: int = 40, memory_top: int = 15, memory_frames: int = 1,
+                 worker_hint: Optional[str] = None):
+        """
+        Args:
+            enabled: 프로파일링 사용 여부 (False면 모든 메서드가 아무것도 하지 않음)
+            memory: tracemalloc 체크포인트 기록 여부
+            sort: 리포트 정렬 기준 (SORT_KEYS)
+            top: 리포트에 남길 함수 수
+            memory_top: 체크포인트마다 남길 할당 위치 수
+            memory_frames: tracemalloc 트레이스백 깊이
+            worker_hint: 작업을 한 스레드로 돌리는 CLI 옵션 (건너뛴 작업 경고에 표시, 예: '--workers 1')
+        """
+        self.enabled = enabled or memory
+        self.memory = memory
+        self.sort = sort
+        self.top = top
+        self.memory_top = memory_top
+        self.memory_frames = memory_frames
+        self.worker_hint = worker_hint
+
+        self.profiled_jobs = 0
+        self.skipped_jobs = 0
+        self.checkpoints = []
+
+        self._stats = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_snapshot = None
+        self._started_tracemalloc = False
+
+    def start(self) -> 'Profiler':
+        """tracemalloc 시작 (memory 모드만)"""
+        if self.enabled and self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(self.memory_frames)
+            self._started_tracemalloc = True
+        return self
+
+    @contextmanager
+    def profile(self, label: Optional[str] = None):
+        """구간 cProfile - 결과는 전체 통계에 병합"""
+        if not self.enabled or getattr(self._local, 'active', False):
+            yield
+            return
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+: 프로파일러는 한 번에 하나만 켤 수 있음
+            with self._lock:
+                self.skipped_jobs += 1
+            logger.debug(f"다른 프로파일러 실행 중 - 건너뜀: {label}")
+            yield
+            return
+
+        self._local.active = True
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._local.active = False
+            self._merge(profile)
+
+    def _merge(self, profile: cProfile.Profile):
+        """작업 프로파일을 전체 통계에 합침"""
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+            self.profiled_jobs += 1
+
+    def checkpoint(self, label: str, **structures):
+        """
+        tracemalloc 스냅샷 기록
+
+        Args:
+            label: 체크포인트 이름 (예: 'KT 수집 완료')
+            **structures: 크기를 잴 구조 (예: data=self.data, rate_plan_price_cache=...)
+        """
+        if not (self.enabled and self.memory and tracemalloc.is_tracing()):
+            return
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+
+        with self._lock:
+            previous, self._last_snapshot = self._last_snapshot, snapshot
+
+        if previous is not None:
+            stats = snapshot.compare_to(previous, 'lineno')
+        else:
+            stats = snapshot.statistics('lineno')
+
+        tracked = {}
+        for name, value in structures.items():
+            if value is None:
+                continue
+            try:
+                tracked[name] = {'items': len(value), 'mb': round(deep_sizeof(value) / (1024 * 1024), 2)}
+            except TypeError:
+                tracked[name] = {'items': None, 'mb': round(deep_sizeof(value) / (1024 * 1024), 2)}
+
+        entry = {
+            'label': label,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'traced_mb': round(current / (1024 * 1024), 2),
+            'peak_mb': round(peak / (1024 * 1024), 2),
+            'structures': tracked,
+            'top_allocations': [{
+                'location': str(stat.traceback[0]),
+                'size_kb': round(stat.size / 1024, 1),
+                'size_diff_kb': round(getattr(stat, 'size_diff', stat.size) / 1024, 1),
+                'count': stat.count,
+            } for stat in stats[:self.memory_top]],
+        }
+        with self._lock:
+            self.checkpoints.append(entry)
+
+        sizes = ', '.join(f"{name} {info['items']:,}개/{info['mb']:.1f}MB" if info['items'] is not None
+                          else f"{name} {info['mb']:.1f}MB" for name, info in tracked.items())
+        logger.info(f"메모리 체크포인트 [{label}]: 추적 {entry['traced_mb']:.1f}MB "
+                    f"(최대 {entry['peak_mb']:.1f}MB){' - ' + sizes if sizes else ''}")
+
+    def report(self) -> str:
+        """정렬된 텍스트 리포트"""
+        if self._stats is None:
+            return ''
+        stream = io.StringIO()
+        with self._lock:
+            self._stats.stream = stream
+            self._stats.sort_stats(self.sort).print_stats(self.top)
+        return stream.getvalue()
+
+    def save(self, prefix: str) -> List[str]:
+        """
+        결과 저장
+
+        Args:
+            prefix: 파일 경로 접두어 (<prefix>.pstats / <prefix>.txt / <prefix>_memory.json)
+
+        Returns:
+            저장한 파일 경로 목록
+        """
+        if not self.enabled:
+            return []
+
+        saved = []
+        if self._stats is not None:
+            with self._lock:
+                self._stats.dump_stats(f"{prefix}.pstats")
+            saved.append(f"{prefix}.pstats")
+
+            with open(f"{prefix}.txt", 'w', encoding='utf-8') as f:
+                f.write(f"프로파일 작업 {self.profiled_jobs:,}개 (건너뜀 {self.skipped_jobs:,}개), "
+                        f"정렬: {self.sort}\n\n")
+                f.write(self.report())
+            saved.append(f"{prefix}.txt")
+
+        if self.checkpoints:
+            with open(f"{prefix}_memory.json", 'w', encoding='utf-8') as f:
+                json.dump(self.checkpoints, f, ensure_ascii=False, indent=2)
+            saved.append(f"{prefix}_memory.json")
+
+        for file_path in saved:
+            logger.info(f"프로파일 저장: {file_path}")
+        if self.skipped_jobs:
+            hint = f", {self.worker_hint} 로 전체 계측 가능" if self.worker_hint else ''
+            logger.warning(f"동시 프로파일러 제한으로 {self.skipped_jobs:,}개 작업은 프로파일에서 빠졌습니다 "
+                           f"(Python 3.12+{hint})")
+        return saved
+
+    def stop(self, prefix: str) -> List[str]:
+        """결과 저장 후 tracemalloc 종료"""
+        try:
+            return self.save(prefix)
+        except Exception as e:
+            logger.error(f"프로파일 저장 실패: {e}")
+            return []
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
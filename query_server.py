@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+최신 크롤링 결과 조회 API 서버 (읽기 전용)
+
+가장 최근 통합 결과 파일(또는 이력 저장소 현재값)을 메모리에 올리고
+통신사 / 기기키 / 요금제 / 네트워크 인덱스로 JSON 조회에 응답한다.
+
+엔드포인트:
+    GET /health                               서버/데이터 상태
+    GET /devices?q=갤럭시 S25                   기기키 검색 (접두어)
+    GET /best?device=갤럭시 S25&top=5           기기별 총지원금 상위 조합
+    GET /plans?device=갤럭시 S25&carrier=KT     기기의 요금제별 지원금 목록
+    GET /tco?device=갤럭시 S25&months=24        총소유비용 최저 조합
+    공통 필터: carrier, network, subscription_type, plan
+
+주요 특징:
+    - 통신사 / 기기키 / 요금제 / 네트워크별 행 위치 인덱스 (조회는 위치 배열 교집합)
+    - 같은 요청은 직렬화된 응답을 캐시
+    - 새 결과 파일이 생기면 백그라운드에서 다시 로드 후 교체 (요청 중단 없음)
+
+사용법:
+    python integrated_crawler.py serve --source data --port 8080
+    python integrated_crawler.py serve --history-db history.db
+"""
+
+import os
+import re
+import json
+import bisect
+import logging
+import argparse
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import List, Dict, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from schema import to_canonical, load_canonical
+from exporters import iter_frame_records
+from history_store import HistoryStore
+from device_index import DeviceIndex
+from tco_engine import TCOEngine
+
+logger = logging.getLogger(__name__)
+
+# 통합 결과 파일명 (정규화 테이블 _plans/_devices 등은 제외)
+RESULT_FILE_PATTERN = re.compile(r'^통신3사_공시지원금_통합_(\d{8}_\d{6})\.(parquet|arrow|jsonl(?:\.gz|\.zst)?|csv|json)$')
+
+# 같은 시점 결과가 여러 형식이면 앞쪽 형식 우선 (로드가 빠른 순)
+FORMAT_PRIORITY = ['parquet', 'arrow', 'jsonl', 'jsonl.gz', 'jsonl.zst', 'csv', 'json']
+
+# 인덱스를 만들 컬럼 (요청 파라미터 → 컬럼)
+INDEX_COLUMNS = {
+    'carrier': '통신사',
+    'device': '기기키',
+    'plan': '요금제',
+    'network': '네트워크',
+    'subscription_type': '가입유형',
+}
+
+# 응답 캐시 최대 항목 수
+MAX_CACHE_ENTRIES = 2048
+
+
+def find_latest_result(source_dir: str) -> Optional[str]:
+    """출력 디렉토리에서 가장 최근 통합 결과 파일 (파일명 타임스탬프 기준)"""
+    if not os.path.isdir(source_dir):
+        return None
+
+    candidates = []
+    for name in os.listdir(source_dir):
+        match = RESULT_FILE_PATTERN.match(name)
+        if match:
+            timestamp, extension = match.groups()
+            candidates.append((timestamp, -FORMAT_PRIORITY.index(extension), name))
+    return os.path.join(source_dir, max(candidates)[2]) if candidates else None
+
+
+class QueryIndex:
+    """조회용 인덱스가 붙은 결과 스냅샷 (생성 후 변경 없음)"""
+
+    def __init__(self, df: pd.DataFrame, source: str, device_index: DeviceIndex):
+        self.source = source
+        self.version = 0
+        self.loaded_at = datetime.now().isoformat(timespec='seconds')
+        self.device_index = device_index
+
+        self.frame = to_canonical(df).reset_index(drop=True)
+        self.frame['기기키'] = device_index.key_series(self.frame['기기명'].astype(object))
+        self.frame['총지원금'] = self.frame['공시지원금'] + self.frame['추가지원금']
+
+        # 컬럼 값 → 행 위치 배열
+        self.indexes = {
+            column: {key: np.asarray(positions) for key, positions in
+                     self.frame.groupby(column, observed=True, sort=False).indices.items()}
+            for column in INDEX_COLUMNS.values()
+        }
+        self.device_keys = sorted(self.indexes['기기키'])
+        self.total_support = self.frame['총지원금'].to_numpy(dtype=np.int64)
+
+        self._tco = None
+        self._tco_lock = threading.Lock()
+
+        logger.info(f"조회 인덱스 생성: {len(self.frame):,}행, 기기 {len(self.device_keys):,}종 ({source})")
+
+    def tco(self, months: int) -> TCOEngine:
+        """TCO 엔진 (처음 요청 시 생성, 개월 수가 바뀌면 다시 생성)"""
+        with self._tco_lock:
+            if self._tco is None or self._tco.months != months:
+                self._tco = TCOEngine(self.frame, months, self.device_index)
+            return self._tco
+
+    def match_devices(self, query: str) -> List[str]:
+        """기기명/기기키 → 기기키 목록 (정확히 일치하면 1개, 아니면 접두어 일치)"""
+        key = self.device_index.key_for(query)
+        if not key:
+            return []
+        if key in self.indexes['기기키']:
+            return [key]
+        start = bisect.bisect_left(self.device_keys, key)
+        matches = []
+        for device_key in self.device_keys[start:]:
+            if not device_key.startswith(key):
+                break
+            matches.append(device_key)
+        return matches
+
+    def select(self, params: Dict[str, str]) -> np.ndarray:
+        """필터 파라미터 → 행 위치 (인덱스 교집합)"""
+        selected = None
+        for param, column in INDEX_COLUMNS.items():
+            value = params.get(param)
+            if not value:
+                continue
+            if param == 'device':
+                keys = self.match_devices(value)
+                parts = [self.indexes[column][key] for key in keys]
+                positions = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+            else:
+                positions = self.indexes[column].get(value, np.empty(0, dtype=np.int64))
+            selected = positions if selected is None else np.intersect1d(selected, positions, assume_unique=True)
+            if not len(selected):
+                break
+        return np.arange(len(self.frame)) if selected is None else selected
+
+    def records(self, positions: np.ndarray, columns: Optional[List[str]] = None) -> List[Dict]:
+        """행 위치 → JSON용 dict 목록"""
+        frame = self.frame.iloc[positions]
+        if columns:
+            frame = frame[columns]
+        return list(iter_frame_records(frame))
+
+
+class QueryService:
+    """데이터 소스 감시 + 인덱스 교체 + 응답 캐시"""
+
+    def __init__(self, source_dir: Optional[str] = None, history_db: Optional[str] = None,
+                 reload_interval: float = 30.0, device_aliases: Optional[str] = None):
+        """
+        Args:
+            source_dir (str): 통합 결과 파일이 저장되는 디렉토리
+            history_db (str): 이력 저장소 경로 (지정 시 현재값을 조회 대상으로 사용)
+            reload_interval (float): 새 결과 확인 간격 (초)
+            device_aliases (str): 기기 별칭/모델코드 테이블 JSON 경로
+        """
+        if not source_dir and not history_db:
+            raise ValueError("source_dir 또는 history_db가 필요합니다")
+
+        self.source_dir = source_dir
+        self.history_db = history_db
+        self.reload_interval = reload_interval
+        self.device_index = DeviceIndex(device_aliases)
+
+        self.index = None
+        self._version = 0
+        self._signature = None
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    def _current_signature(self):
+        """데이터 소스 변경 감지용 (경로, 수정 시각)"""
+        if self.history_db:
+            paths = [self.history_db, self.history_db + '-wal']
+            return tuple((path, os.path.getmtime(path)) for path in paths if os.path.exists(path))
+        latest = find_latest_result(self.source_dir)
+        return (latest, os.path.getmtime(latest)) if latest else None
+
+    def reload(self, force: bool = False) -> bool:
+        """데이터 소스가 바뀌었으면 새 인덱스를 만든 뒤 교체"""
+        signature = self._current_signature()
+        if not signature or (signature == self._signature and not force):
+            return False
+
+        if self.history_db:
+            with HistoryStore(self.history_db) as store:
+                rows = store.snapshot()
+            df = to_canonical(pd.DataFrame(rows), 'history') if rows else None
+            source = self.history_db
+        else:
+            source = signature[0]
+            df = load_canonical(source)
+
+        if df is None or df.empty:
+            logger.warning(f"조회할 데이터가 없습니다: {source}")
+            return False
+
+        index = QueryIndex(df, source, self.device_index)
+        with self._lock:
+            self._version += 1
+            index.version = self._version
+            self.index = index
+            self._signature = signature
+            self._cache.clear()
+        logger.info(f"데이터 로드 완료: {source}")
+        return True
+
+    def start_watcher(self):
+        """백그라운드 변경 감시 시작"""
+        def watch():
+            while not self._stop.wait(self.reload_interval):
+                try:
+                    self.reload()
+                except Exception as e:
+                    logger.error(f"데이터 다시 로드 실패: {e}")
+
+        self._watcher = threading.Thread(target=watch, name='query-reload', daemon=True)
+        self._watcher.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def handle(self, path: str, params: Dict[str, str]) -> Tuple[int, bytes]:
+        """요청 처리 → (상태 코드, JSON 본문), 같은 요청은 캐시"""
+        index = self.index
+        if index is None:
+            return 503, _dumps({'error': '데이터가 아직 로드되지 않았습니다'})
+
+        cache_key = (index.version, path, tuple(sorted(params.items())))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            status, payload = self._dispatch(index, path, params)
+        except ValueError as e:
+            status, payload = 400, {'error': str(e)}
+
+        response = (status, _dumps(payload))
+        if status == 200:
+            with self._lock:
+                if len(self._cache) >= MAX_CACHE_ENTRIES:
+                    self._cache.clear()
+                self._cache[cache_key] = response
+        return response
+
+    def _dispatch(self, index: QueryIndex, path: str, params: Dict[str, str]):
+        """경로별 조회"""
+        top = int(params.get('top', 10))
+
+        if path == '/health':
+            return 200, {
+                'status': 'ok',
+                'source': index.source,
+                'loaded_at': index.loaded_at,
+                'rows': len(index.frame),
+                'devices': len(index.device_keys),
+                'carriers': sorted(index.indexes['통신사']),
+            }
+
+        if path == '/devices':
+            query = params.get('q', '')
+            keys = index.match_devices(query) if query else index.device_keys
+            return 200, {'devices': keys[:int(params.get('limit', 100))]}
+
+        if path in ('/best', '/plans', '/tco') and not params.get('device'):
+            raise ValueError("device 파라미터가 필요합니다")
+
+        if path == '/best':
+            positions = index.select(params)
+            order = np.argsort(-index.total_support[positions], kind='stable')[:top]
+            return 200, {'device': params['device'], 'results': index.records(positions[order])}
+
+        if path == '/plans':
+            positions = index.select(params)
+            columns = ['통신사', '가입유형', '네트워크', '요금제', '월요금', '기기명', '기기키',
+                       '출고가', '공시지원금', '추가지원금', '총지원금', '공시일자']
+            return 200, {'device': params['device'], 'count': int(len(positions)),
+                         'results': index.records(positions, columns)}
+
+        if path == '/tco':
+            engine = index.tco(int(params.get('months', 24)))
+            result = engine.cheapest(params['device'], top, params.get('carrier'), params.get('subscription_type'))
+            return 200, {'device': params['device'], 'months': engine.months,
+                         'results': list(iter_frame_records(result))}
+
+        return 404, {'error': f'알 수 없는 경로: {path}'}
+
+
+def _dumps(payload) -> bytes:
+    """JSON 직렬화 (한글 그대로)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def make_handler(service: QueryService):
+    """서비스를 참조하는 요청 핸들러 클래스 생성"""
+
+    class QueryHandler(BaseHTTPRequestHandler):
+        server_version = 'TelecomQuery/1.0'
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+            status, body = service.handle(parsed.path.rstrip('/') or '/health', params)
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return QueryHandler
+
+
+def main(argv: Optional[List[str]] = None):
+    """serve CLI"""
+    parser = argparse.ArgumentParser(
+        prog='integrated_crawler.py serve',
+        description='최신 크롤링 결과 조회 API 서버 (읽기 전용)'
+    )
+    parser.add_argument('--source', default='data', help='통합 결과 디렉토리 (기본: data)')
+    parser.add_argument('--history-db', help='이력 저장소 경로 (지정 시 현재값 조회)')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='포트 (기본: 8080)')
+    parser.add_argument('--reload-interval', type=float, default=30.0, help='새 결과 확인 간격 (초, 기본: 30)')
+    parser.add_argument('--device-aliases', help='기기 별칭/모델코드 테이블 JSON 경로')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    service = QueryService(None if args.history_db else args.source, args.history_db,
+                           args.reload_interval, args.device_aliases)
+    if not service.reload(force=True):
+        logger.warning("시작 시 로드할 데이터가 없습니다. 새 결과가 생기면 자동으로 로드합니다.")
+    service.start_watcher()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+    logger.info(f"조회 서버 시작: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+        logger.info("조회 서버 종료")
+
+
+if __name__ == '__main__':
+    main()
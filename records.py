@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+열 단위 크롤링 결과 저장소
+
+행마다 dict를 보관하는 대신 컬럼별 리스트에 값을 쌓는다.
+요금제명, 카테고리, 크롤링시간처럼 반복되는 문자열은 intern 하여
+같은 객체 하나만 참조하게 한다.
+
+주요 특징:
+    - 행마다 반복되던 컬럼 키 제거 (컬럼당 1개)
+    - 반복 문자열 intern (요금제명, 기기명, 제조사, crawled_at 등)
+    - 행 dict를 거치지 않는 DataFrame 변환 (컬럼 리스트 직접 전달)
+    - list[dict]와 호환되는 append/extend/len/iter/인덱싱 지원
+"""
+
+import sys
+from typing import List, Dict, Optional, Iterable
+
+import pandas as pd
+
+
+def intern_value(value):
+    """문자열이면 intern, 그 외 값은 그대로"""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class ColumnarRows:
+    """컬럼 리스트 기반 행 저장소 (list[dict] 대체)"""
+
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, rows: Optional[Iterable[Dict]] = None, columns: Optional[List[str]] = None):
+        """
+        저장소 초기화
+
+        Args:
+            rows (iterable): 초기 행 (dict 또는 ColumnarRows)
+            columns (list): 미리 정할 컬럼 순서 (없으면 처음 들어온 순서)
+        """
+        self._columns = {}
+        self._length = 0
+
+        for column in columns or []:
+            self._columns[sys.intern(column)] = []
+
+        if rows is not None:
+            self.extend(rows)
+
+    @property
+    def columns(self) -> List[str]:
+        """컬럼 목록 (입력 순서)"""
+        return list(self._columns)
+
+    def _add_column(self, column: str) -> List:
+        """새 컬럼 추가 (기존 행은 None으로 채움)"""
+        values = [None] * self._length
+        self._columns[sys.intern(column)] = values
+        return values
+
+    def append(self, row: Dict):
+        """행 추가"""
+        columns = self._columns
+        for key, value in row.items():
+            values = columns.get(key)
+            if values is None:
+                values = self._add_column(key)
+            values.append(intern_value(value))
+
+        # 이번 행에 없는 컬럼은 None으로 길이 맞춤
+        length = self._length + 1
+        if len(row) != len(columns):
+            for values in columns.values():
+                if len(values) < length:
+                    values.append(None)
+
+        self._length = length
+
+    def extend(self, rows: Iterable[Dict]):
+        """여러 행 추가"""
+        if isinstance(rows, ColumnarRows):
+            self._extend_columnar(rows)
+            return
+        for row in rows:
+            self.append(row)
+
+    def _extend_columnar(self, other: 'ColumnarRows'):
+        """다른 ColumnarRows를 컬럼 단위로 이어 붙임"""
+        if not other._length:
+            return
+        for column in other._columns:
+            if column not in self._columns:
+                self._add_column(column)
+        for column, values in self._columns.items():
+            source = other._columns.get(column)
+            values.extend(source if source is not None else [None] * other._length)
+        self._length += other._length
+
+    def row(self, index: int) -> Dict:
+        """index번째 행을 dict로 반환"""
+        return {column: values[index] for column, values in self._columns.items()}
+
+    def copy(self) -> 'ColumnarRows':
+        """얕은 복사 (컬럼 리스트만 새로 생성)"""
+        copied = ColumnarRows()
+        copied._columns = {column: list(values) for column, values in self._columns.items()}
+        copied._length = self._length
+        return copied
+
+    def to_dicts(self) -> List[Dict]:
+        """list[dict] 변환 (JSON 저장 등)"""
+        return list(self)
+
+    def to_dataframe(self, columns: Optional[List[str]] = None,
+                     categorical_columns: Optional[List[str]] = None, dtype=None) -> pd.DataFrame:
+        """
+        DataFrame 변환 (행 dict를 만들지 않고 컬럼 리스트를 그대로 전달)
+
+        Args:
+            columns (list): 출력 컬럼 순서 (없으면 입력 순서, 없는 컬럼은 제외)
+            categorical_columns (list): category 타입으로 변환할 컬럼
+            dtype: 전체 컬럼 타입 (예: object - 값 그대로 보관, categorical_columns보다 우선)
+        """
+        order = self.columns if columns is None else [c for c in columns if c in self._columns]
+        categorical = set(categorical_columns or []) if dtype is None else set()
+
+        data = {}
+        for column in order:
+            values = self._columns[column]
+            data[column] = pd.Categorical(values) if column in categorical else values
+
+        return pd.DataFrame(data, columns=order, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        # 순회 중 다른 스레드가 추가해도 시작 시점 길이까지만 반환
+        for index in range(self._length):
+            yield self.row(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("행 인덱스 범위 초과")
+        return self.row(index)
+
+    def __getstate__(self):
+        return {'columns': self._columns, 'length': self._length}
+
+    def __setstate__(self, state):
+        self._columns = {sys.intern(column): [intern_value(v) for v in values]
+                         for column, values in state['columns'].items()}
+        self._length = state['length']
+
+    def __repr__(self) -> str:
+        return f"ColumnarRows({self._length}행, {len(self._columns)}컬럼)"
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+스트리밍 결과 싱크 - append-only 중간 저장
+
+크롤링 도중 수집된 행을 하나의 CSV/JSONL 파일에 이어 붙여 기록한다.
+워커 스레드는 큐에 행을 넣기만 하고, 실제 파일 기록은 전용 writer 스레드가 담당한다.
+
+주요 특징:
+    - 새로 수집된 행만 기록 (중간 저장 비용 O(새 행))
+    - 큐 기반 writer 스레드로 워커 블로킹 최소화
+    - 체크포인트 시점에 flush + fsync 로 내구성 보장
+    - 기존 파일에 이어쓰기 지원 (헤더 자동 인식)
+"""
+
+import os
+import csv
+import json
+import queue
+import logging
+import threading
+from typing import List, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 큐 메시지 종류
+_ROWS = 'rows'
+_CHECKPOINT = 'checkpoint'
+_CLOSE = 'close'
+
+
+class StreamingResultSink:
+    """큐 + writer 스레드 기반 append-only 결과 싱크"""
+
+    SUPPORTED_FORMATS = ('csv', 'jsonl')
+
+    def __init__(self, file_path: str, fmt: str = 'csv', columns: Optional[List[str]] = None,
+                 max_queue_size: int = 0):
+        """
+        싱크 초기화
+
+        Args:
+            file_path (str): 기록할 파일 경로 (이미 있으면 이어쓰기)
+            fmt (str): 'csv' 또는 'jsonl'
+            columns (list): CSV 컬럼 순서 (없으면 첫 행 기준)
+            max_queue_size (int): 큐 최대 크기 (0=무제한)
+        """
+        if fmt not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+        self.file_path = file_path
+        self.fmt = fmt
+        self.columns = list(columns) if columns else None
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._file = None
+        self._csv_writer = None
+        self._error = None
+
+        # 통계
+        self.rows_written = 0
+        self.rows_since_checkpoint = 0
+        self.last_checkpoint_rows = 0
+        self.checkpoint_count = 0
+
+    def start(self):
+        """writer 스레드 시작"""
+        if self._thread is not None:
+            return self
+
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._open_file()
+
+        self._thread = threading.Thread(
+            target=self._writer_loop,
+            name='ResultSinkWriter',
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _open_file(self):
+        """파일 열기 (기존 파일이면 헤더를 읽어 이어쓰기)"""
+        is_new = not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0
+
+        if self.fmt == 'csv':
+            if not is_new and self.columns is None:
+                with open(self.file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    header = next(csv.reader(f), None)
+                if header:
+                    self.columns = header
+
+            # 새 파일은 Excel 호환을 위해 BOM 포함
+            encoding = 'utf-8-sig' if is_new else 'utf-8'
+            self._file = open(self.file_path, 'a', encoding=encoding, newline='')
+
+            if self.columns:
+                self._csv_writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='ignore')
+                if is_new:
+                    self._csv_writer.writeheader()
+        else:
+            self._file = open(self.file_path, 'a', encoding='utf-8')
+
+    def write_rows(self, rows: List[Dict]):
+        """행 기록 요청 (비동기, 호출 스레드는 큐에 넣기만 함)"""
+        if not rows:
+            return
+        if self._thread is None:
+            raise RuntimeError("싱크가 시작되지 않았습니다")
+        # 호출자가 이후 dict를 수정해도 안전하도록 얕은 복사
+        self._queue.put((_ROWS, [dict(row) for row in rows]))
+
+    def checkpoint(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 요청된 행을 flush + fsync 하고 완료까지 대기"""
+        if self._thread is None:
+            return False
+        done = threading.Event()
+        self._queue.put((_CHECKPOINT, done))
+        finished = done.wait(timeout)
+        if self._error:
+            logger.error(f"결과 싱크 기록 오류: {self._error}")
+        return finished and self._error is None
+
+    def close(self):
+        """남은 행을 모두 기록하고 파일을 닫음"""
+        if self._thread is None:
+            return
+        self._queue.put((_CLOSE, None))
+        self._thread.join()
+        self._thread = None
+
+    def _writer_loop(self):
+        """writer 스레드 메인 루프"""
+        while True:
+            kind, payload = self._queue.get()
+            try:
+                if kind == _ROWS:
+                    self._write(payload)
+                elif kind == _CHECKPOINT:
+                    self._sync()
+                    payload.set()
+                elif kind == _CLOSE:
+                    self._sync()
+                    self._file.close()
+                    return
+            except Exception as e:
+                self._error = e
+                logger.error(f"결과 싱크 처리 오류: {e}")
+                if kind == _CHECKPOINT:
+                    payload.set()
+                elif kind == _CLOSE:
+                    return
+            finally:
+                self._queue.task_done()
+
+    def _write(self, rows: List[Dict]):
+        """행 기록 (writer 스레드 전용)"""
+        if self.fmt == 'csv':
+            if self._csv_writer is None:
+                self.columns = list(rows[0].keys())
+                self._csv_writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='ignore')
+                self._csv_writer.writeheader()
+            self._csv_writer.writerows(rows)
+        else:
+            self._file.writelines(
+                json.dumps(row, ensure_ascii=False, separators=(',', ':')) + '\n'
+                for row in rows
+            )
+
+        self.rows_written += len(rows)
+        self.rows_since_checkpoint += len(rows)
+
+    def _sync(self):
+        """flush + fsync"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.checkpoint_count += 1
+        self.last_checkpoint_rows = self.rows_since_checkpoint
+        self.rows_since_checkpoint = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
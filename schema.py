@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+통신 3사 공통 데이터 스키마
+
+통합 크롤러 컬럼(통신사, 요금제, 기기명, 공시지원금 ...)을 표준 스키마로 정하고,
+단독 크롤러별 컬럼(KT/SKT 영문 키, LG 한글 키)을 DataFrame 단위로 변환하는 어댑터를 둔다.
+
+주요 특징:
+    - 표준 컬럼 순서 + 타입 (범주형 / 정수 가격 / 문자열)
+    - 통신사별 어댑터: 컬럼명 변경, 파생 컬럼, 상수 컬럼 (행 dict 재작성 없음)
+    - 컬럼명 변경과 이미 맞는 타입은 복사 없이 그대로 사용
+    - 컬럼 구성으로 통신사 형식 자동 판별
+    - 3사 프레임 결합 + 키 기준 중복 제거
+    - 저장된 결과 파일을 표준 스키마로 로드
+"""
+
+import logging
+from typing import List, Dict, Optional
+
+import pandas as pd
+
+from price_utils import parse_price_series
+from manufacturers import manufacturer_series
+from exporters import load_result_file
+
+logger = logging.getLogger(__name__)
+
+# 표준 컬럼 → 타입 (순서 = 출력 순서)
+CANONICAL_SCHEMA = {
+    '통신사': 'category',
+    '가입유형': 'category',
+    '네트워크': 'category',
+    '요금제_카테고리': 'category',
+    '요금제': 'object',
+    '월요금': 'int64',
+    '기기명': 'object',
+    '제조사': 'category',
+    '출고가': 'int64',
+    '공시지원금': 'int64',
+    '추가지원금': 'int64',
+    '총지원금': 'int64',
+    '공시일자': 'object',
+    '크롤링시간': 'object',
+    # LG U+ 전용 (다른 통신사는 기본값)
+    '요금제유지기간': 'object',
+    '추천할인': 'int64',
+    '최종구매가': 'int64',
+}
+
+CANONICAL_COLUMNS = list(CANONICAL_SCHEMA)
+
+# 같은 행으로 볼 기준 컬럼 (LG U+는 기기·요금제마다 요금제유지기간별 행이 따로 있음)
+DEDUPE_KEYS = ['통신사', '가입유형', '네트워크', '요금제', '기기명', '요금제유지기간']
+
+# 통신사별 어댑터
+#   rename: 원본 컬럼 → 표준 컬럼
+#   copies: 표준 컬럼 → 값을 복사해 올 표준 컬럼 (없을 때만)
+#   constants: 없을 때 채울 상수
+#   detect: 이 컬럼이 모두 있으면 해당 형식으로 판별
+CARRIER_ADAPTERS = {
+    'unified': {
+        'rename': {},
+        'copies': {},
+        'constants': {},
+        'detect': ['통신사', '기기명', '월요금'],
+    },
+    'SKT': {
+        'rename': {
+            'scrb_type_name': '가입유형',
+            'network_type': '네트워크',
+            'plan_category': '요금제_카테고리',
+            'plan_name': '요금제',
+            'plan_monthly_fee': '월요금',
+            'device_name': '기기명',
+            'manufacturer': '제조사',
+            'release_price': '출고가',
+            'public_support_fee': '공시지원금',
+            'additional_support_fee': '추가지원금',
+            'total_support_fee': '총지원금',
+            'date': '공시일자',
+            'crawled_at': '크롤링시간',
+        },
+        'copies': {},
+        'constants': {'통신사': 'SKT'},
+        'detect': ['scrb_type_name', 'plan_monthly_fee'],
+    },
+    'KT': {
+        'rename': {
+            'carrier': '통신사',
+            'plan_type': '네트워크',
+            'plan_name': '요금제',
+            'monthly_fee': '월요금',
+            'device_name': '기기명',
+            'manufacturer': '제조사',
+            'release_price': '출고가',
+            'public_support_fee': '공시지원금',
+            'additional_support_fee': '추가지원금',
+            'crawled_at': '크롤링시간',
+        },
+        'copies': {'요금제_카테고리': '네트워크'},
+        'constants': {'통신사': 'KT', '가입유형': '전체'},
+        'detect': ['plan_type', 'monthly_fee', 'device_name'],
+    },
+    'LG U+': {
+        'rename': {
+            '기기종류': '네트워크',
+            '월납부금액': '월요금',
+            '추가공시지원금': '추가지원금',
+            '지원금총액': '총지원금',
+        },
+        'copies': {'요금제_카테고리': '네트워크'},
+        'constants': {'통신사': 'LG U+'},
+        'detect': ['기기종류', '월납부금액'],
+    },
+    # 이력 저장소(HistoryStore) 조회 결과
+    'history': {
+        'rename': {
+            'carrier': '통신사',
+            'subscription_type': '가입유형',
+            'network': '네트워크',
+            'plan_name': '요금제',
+            'monthly_fee': '월요금',
+            'device_name': '기기명',
+            'release_price': '출고가',
+            'public_support_fee': '공시지원금',
+            'additional_support_fee': '추가지원금',
+            'term': '요금제유지기간',
+            'last_seen': '크롤링시간',
+        },
+        'copies': {'요금제_카테고리': '네트워크'},
+        'constants': {},
+        'carrier_defaults': True,  # 빈 값은 통신사별 파일 어댑터 상수로 채움 (KT 가입유형 '전체' 등)
+        'detect': ['plan_key', 'valid_from'],
+    },
+}
+
+
+def detect_carrier_format(columns) -> Optional[str]:
+    """컬럼 구성으로 어댑터 이름 판별 (판별 불가 시 None)"""
+    columns = set(columns)
+    for name in ('history', 'SKT', 'KT', 'LG U+', 'unified'):
+        if all(col in columns for col in CARRIER_ADAPTERS[name]['detect']):
+            return name
+    return None
+
+
+def _fill_carrier_defaults(source: pd.DataFrame) -> pd.DataFrame:
+    """행마다 통신사가 있는 결과(이력 저장소)의 빈 값을 통신사별 어댑터 상수로 채움"""
+    if '통신사' not in source.columns:
+        return source
+
+    filled = {}
+    for carrier, adapter in CARRIER_ADAPTERS.items():
+        for column, value in adapter['constants'].items():
+            if column == '통신사' or column not in source.columns:
+                continue
+            values = filled.get(column, source[column])
+            blank = (source['통신사'] == carrier) & (values.isna() | values.eq(''))
+            if blank.any():
+                filled[column] = values.astype(object).mask(blank, value)
+
+    return source.assign(**filled) if filled else source
+
+
+def _cast_column(column: pd.Series, dtype: str) -> pd.Series:
+    """표준 타입으로 변환 (이미 같은 타입이면 그대로)"""
+    if dtype == 'int64':
+        if column.dtype == 'int64':
+            return column
+        return parse_price_series(column)
+    if dtype == 'category':
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return column
+        return column.astype('category')
+    if column.dtype == object:
+        return column
+    return column.astype(object)
+
+
+def _default_column(dtype: str, index: pd.Index) -> pd.Series:
+    """없는 표준 컬럼 기본값 (가격 0, 그 외 None)"""
+    if dtype == 'int64':
+        return pd.Series(0, index=index, dtype='int64')
+    return pd.Series(None, index=index, dtype=object).astype(dtype)
+
+
+def to_canonical(df: pd.DataFrame, carrier_format: Optional[str] = None,
+                 keep_extra: bool = False) -> pd.DataFrame:
+    """
+    통신사별 DataFrame → 표준 스키마 DataFrame
+
+    Args:
+        df: 크롤러 결과 DataFrame
+        carrier_format: 어댑터 이름 ('SKT', 'KT', 'LG U+', 'unified', 'history', None이면 자동 판별)
+        keep_extra: 표준 스키마에 없는 컬럼을 뒤에 유지할지 여부
+
+    Returns:
+        표준 컬럼 순서 / 타입의 DataFrame
+    """
+    if carrier_format is None:
+        carrier_format = detect_carrier_format(df.columns)
+        if carrier_format is None:
+            raise ValueError(f"통신사 형식을 판별할 수 없습니다: {list(df.columns)}")
+    if carrier_format not in CARRIER_ADAPTERS:
+        raise ValueError(f"알 수 없는 통신사 형식: {carrier_format}")
+
+    adapter = CARRIER_ADAPTERS[carrier_format]
+
+    # 컬럼명 변경 (데이터 복사 없음)
+    rename = {src: dst for src, dst in adapter['rename'].items() if src in df.columns}
+    source = df.rename(columns=rename) if rename else df
+    if adapter.get('carrier_defaults'):
+        source = _fill_carrier_defaults(source)
+
+    columns = {}
+    for column, dtype in CANONICAL_SCHEMA.items():
+        if column in source.columns:
+            values = source[column]
+        elif column in adapter['copies'] and adapter['copies'][column] in source.columns:
+            values = source[adapter['copies'][column]]
+        elif column in adapter['constants']:
+            values = pd.Series(adapter['constants'][column], index=source.index)
+        else:
+            values = None
+
+        columns[column] = (_default_column(dtype, source.index) if values is None
+                           else _cast_column(values, dtype))
+
+    # 파생 컬럼: 제조사 / 총지원금 / 공시일자
+    if '제조사' not in source.columns and '기기명' in source.columns:
+        columns['제조사'] = manufacturer_series(source['기기명']).astype('category')
+    if '총지원금' not in source.columns:
+        columns['총지원금'] = columns['공시지원금'] + columns['추가지원금']
+    if '공시일자' not in source.columns and '크롤링시간' in source.columns:
+        columns['공시일자'] = columns['크롤링시간'].str[:10]
+
+    if keep_extra:
+        for column in source.columns:
+            if column not in columns:
+                columns[column] = source[column]
+
+    return pd.DataFrame(columns, index=source.index, copy=False)
+
+
+def load_canonical(file_path: str, carrier_format: Optional[str] = None) -> pd.DataFrame:
+    """저장된 크롤링 결과 파일 → 표준 스키마 DataFrame (형식 자동 판별)"""
+    return to_canonical(load_result_file(file_path), carrier_format)
+
+
+def combine_canonical(frames: Dict[str, pd.DataFrame], dedupe: bool = True) -> pd.DataFrame:
+    """
+    통신사별 DataFrame을 표준 스키마로 변환 후 결합
+
+    Args:
+        frames: {어댑터 이름 또는 None: DataFrame}
+        dedupe: DEDUPE_KEYS 기준 중복 제거 여부 (마지막 행 유지)
+    """
+    converted = [to_canonical(df, carrier_format) for carrier_format, df in frames.items() if len(df)]
+    if not converted:
+        return pd.DataFrame({column: _default_column(dtype, pd.RangeIndex(0))
+                             for column, dtype in CANONICAL_SCHEMA.items()})
+
+    # 범주형 컬럼은 카테고리가 달라도 유지되도록 union 후 결합
+    for column, dtype in CANONICAL_SCHEMA.items():
+        if dtype == 'category' and len(converted) > 1:
+            categories = pd.api.types.union_categoricals([frame[column] for frame in converted]).categories
+            for frame in converted:
+                frame[column] = frame[column].cat.set_categories(categories)
+
+    combined = pd.concat(converted, ignore_index=True)
+    return dedupe_canonical(combined) if dedupe else combined
+
+
+def dedupe_canonical(df: pd.DataFrame, keys: Optional[List[str]] = None) -> pd.DataFrame:
+    """표준 스키마 DataFrame 중복 제거 (마지막 행 유지)"""
+    keys = [key for key in (keys or DEDUPE_KEYS) if key in df.columns]
+    if not keys:
+        return df
+
+    duplicated = df.duplicated(subset=keys, keep='last')
+    removed = int(duplicated.sum())
+    if not removed:
+        return df
+
+    logger.info(f"중복 행 {removed:,}개 제거")
+    return df[~duplicated].reset_index(drop=True)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+통신사별 세그먼트 체크포인트
+
+작업 단위(SKT 조합, KT 요금제, LG 가입유형×기기종류×요금제)가 끝날 때마다
+그 작업의 행만 별도 파일 하나로 기록한다. 통신사 단계가 끝나면 완료 표시를 남긴다.
+
+디렉토리 구조:
+    <checkpoint_dir>/<통신사>/<세그먼트 해시>.parquet (pyarrow 없으면 .jsonl)
+    <checkpoint_dir>/<통신사>/_COMPLETE (세그먼트 수, 실패 작업 수, 요금제 제한 여부 JSON)
+
+주요 특징:
+    - 세그먼트당 파일 1개, 기존 파일을 다시 쓰지 않음 (체크포인트 비용 O(새 작업))
+    - Parquet 컬럼 포맷 저장 (pyarrow 없거나 타입/키 구성이 섞인 경우 JSONL)
+    - 임시 파일 + rename 으로 원자적 기록
+    - 완료된 통신사는 통째로 복원, 진행 중이던 통신사는 남은 세그먼트만 수집
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from typing import List, Dict
+
+from exporters import PYARROW_AVAILABLE
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+COMPLETE_MARKER = '_COMPLETE'
+SEGMENT_EXTENSIONS = ('.parquet', '.jsonl')
+
+
+class SegmentCheckpoint:
+    """통신사 1개의 세그먼트 체크포인트"""
+
+    def __init__(self, checkpoint_dir: str, carrier: str):
+        """
+        Args:
+            checkpoint_dir (str): 체크포인트 루트 디렉토리
+            carrier (str): 통신사명 (디렉토리명으로 사용)
+        """
+        self.carrier = carrier
+        self.directory = os.path.join(checkpoint_dir, re.sub(r'[^\w]+', '_', carrier).strip('_'))
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.segments_written = 0
+
+    def _segment_path(self, key: str, ext: str) -> str:
+        """세그먼트 키 → 파일 경로"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.directory, digest + ext)
+
+    def has(self, key: str) -> bool:
+        """완료된 세그먼트인지 확인"""
+        return any(os.path.exists(self._segment_path(key, ext)) for ext in SEGMENT_EXTENSIONS)
+
+    @staticmethod
+    def _same_keys(rows: List[Dict]) -> bool:
+        """
+        모든 행의 키 구성이 같은지 확인
+
+        from_pylist는 첫 행으로 스키마를 정해 뒤 행에만 있는 키를 버리고,
+        스키마를 합쳐도 없는 키가 None으로 복원되므로 키가 다르면 JSONL로 기록한다.
+        """
+        keys = rows[0].keys()
+        return all(row.keys() == keys for row in rows)
+
+    def write(self, key: str, rows: List[Dict]):
+        """세그먼트 기록 (워커 스레드에서 호출 가능)"""
+        path = None
+        if PYARROW_AVAILABLE and rows and self._same_keys(rows):
+            try:
+                table = pa.Table.from_pylist(rows)
+                path = self._segment_path(key, '.parquet')
+                pq.write_table(table, path + '.tmp', compression='zstd')
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                # 한 컬럼에 숫자/문자열이 섞인 경우 등
+                logger.debug(f"Parquet 세그먼트 기록 불가, JSONL 사용: {e}")
+                path = None
+
+        if path is None:
+            path = self._segment_path(key, '.jsonl')
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False, separators=(',', ':'), default=str) + '\n')
+
+        os.replace(path + '.tmp', path)
+
+        with self._lock:
+            self.segments_written += 1
+
+    def load_rows(self) -> List[Dict]:
+        """모든 세그먼트 행 로드 (기록 순서)"""
+        files = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_EXTENSIONS)
+        ]
+        files.sort(key=os.path.getmtime)
+
+        rows = []
+        for path in files:
+            try:
+                if path.endswith('.parquet'):
+                    if not PYARROW_AVAILABLE:
+                        logger.warning(f"pyarrow가 없어 세그먼트를 읽을 수 없습니다: {path}")
+                        continue
+                    rows.extend(pq.read_table(path).to_pylist())
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        rows.extend(json.loads(line) for line in f if line.strip())
+            except Exception as e:
+                logger.error(f"세그먼트 로드 실패 ({path}): {e}")
+
+        return rows
+
+    def segment_count(self) -> int:
+        """기록된 세그먼트 수"""
+        return sum(1 for name in os.listdir(self.directory) if name.endswith(SEGMENT_EXTENSIONS))
+
+    def is_complete(self) -> bool:
+        """통신사 단계 완료 여부"""
+        return os.path.exists(os.path.join(self.directory, COMPLETE_MARKER))
+
+    def mark_complete(self, failed_jobs: int = 0, limited: bool = False):
+        """
+        통신사 단계 완료 표시
+
+        Args:
+            failed_jobs (int): 실패한 작업 수
+            limited (bool): 요금제 수 제한으로 일부만 수집했는지 여부
+        """
+        with open(os.path.join(self.directory, COMPLETE_MARKER), 'w', encoding='utf-8') as f:
+            json.dump({'segments': self.segments_written, 'failed_jobs': failed_jobs, 'limited': limited}, f)
+
+    def completion(self) -> Dict:
+        """완료 표시 내용 (이전 형식이거나 읽을 수 없으면 실패/제한 여부는 None)"""
+        info = {'segments': None, 'failed_jobs': None, 'limited': None}
+        try:
+            with open(os.path.join(self.directory, COMPLETE_MARKER), 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return info
+        if isinstance(stored, dict):
+            info.update(stored)
+        return info
+
+    def is_full_crawl(self) -> bool:
+        """완료 표시가 실패/제한 없는 전체 수집인지 (빠진 키 이력 종료 판단용)"""
+        info = self.completion()
+        return info['failed_jobs'] == 0 and info['limited'] is False
+
+    def clear(self):
+        """체크포인트 삭제"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
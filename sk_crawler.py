@@ -18,7 +18,6 @@ Rich UI, 병렬 처리, 실시간 진행률 표시
 
 import time
 import json
-import re
 import os
 from urllib.parse import urlencode, quote_plus
 from selenium import webdriver
@@ -37,9 +36,19 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from typing import List, Dict, Optional, Tuple
 import traceback
-import pickle
 import argparse
 
+from exporters import save_columnar_formats, save_normalized_tables
+from records import ColumnarRows
+from history_store import HistoryStore
+from journal import CrawlJournal
+from price_utils import parse_price
+from manufacturers import classify_manufacturer
+from instrumentation import (StageTimer, JOBS_COMPLETED, JOBS_FAILED, ROWS_COLLECTED,
+                             DRIVERS_STARTED, DRIVERS_CLOSED)
+from metrics_exporter import MetricsExporter
+from profiling import Profiler, SORT_KEYS
+
 # Rich library for better UI
 try:
     from rich.console import Console
@@ -81,7 +90,7 @@ class TworldCrawlerV2:
     def __init__(self, config=None):
         """초기화"""
         self.driver = None
-        self.all_data = []
+        self.all_data = ColumnarRows()  # 컬럼 단위 저장 (반복 문자열 intern)
         self.data_lock = threading.Lock()
         self.rate_plans = []
         self.categories = []
@@ -92,11 +101,18 @@ class TworldCrawlerV2:
             'max_workers': 5,
             'retry_count': 3,
             'page_load_timeout': 30,
-            'checkpoint_interval': 50,
             'save_formats': ['excel', 'csv'],
             'output_dir': DATA_DIR,
             'max_rate_plans': 0,  # 0 = 모든 요금제
-            'show_browser': False
+            'show_browser': False,
+            'history_db': None,  # 이력 저장소 경로 (None = 사용 안 함)
+            'metrics_file': None,  # 단계별 메트릭 JSON 경로 (None = output_dir에 자동 생성)
+            'metrics_port': None,  # 실행 중 /metrics 엔드포인트 포트 (None = 사용 안 함)
+            'metrics_textfile': None,  # Prometheus textfile collector 경로 (.prom, None = 사용 안 함)
+            'metrics_interval': 15.0,  # textfile 갱신 간격 (초)
+            'profile': False,  # 작업별 cProfile 병합 리포트 저장
+            'profile_memory': False,  # 체크포인트마다 tracemalloc 스냅샷 (profile 포함)
+            'profile_sort': 'cumulative'  # 프로파일 리포트 정렬 기준
         }
         
         if config:
@@ -107,7 +123,8 @@ class TworldCrawlerV2:
         self.failed_count = 0
         self.total_devices = 0
         self.start_time = None
-        self.checkpoint_file = os.path.join(DATA_DIR, 'skt_checkpoint.pkl')
+        self.checkpoint_file = os.path.join(DATA_DIR, 'skt_checkpoint.jsonl')
+        self.journal = CrawlJournal(self.checkpoint_file)  # 완료된 조합 + 수집 행 저널
         
         # 스레드 안전 변수
         self.status_lock = threading.Lock()
@@ -116,6 +133,26 @@ class TworldCrawlerV2:
         # 크롤링 조합
         self.all_combinations = []
         
+        # 실행 간 이력 저장소
+        self.history_store = HistoryStore(self.config['history_db']) if self.config.get('history_db') else None
+        
+        # 단계별 소요 시간 계측
+        self.timer = StageTimer('SKT')
+        
+        # 실행 중 메트릭 노출 (/metrics, textfile)
+        self.metrics_exporter = MetricsExporter({self.timer.name: self.timer},
+                                                port=self.config.get('metrics_port'),
+                                                textfile=self.config.get('metrics_textfile'),
+                                                interval=self.config.get('metrics_interval', 15.0))
+        
+        # 프로파일링 모드 (작업마다 cProfile, 선택적으로 tracemalloc 체크포인트)
+        self.profiler = Profiler(self.config.get('profile', False),
+                                 memory=self.config.get('profile_memory', False),
+                                 sort=self.config.get('profile_sort', 'cumulative'),
+                                 worker_hint='--workers 1')
+        if self.profiler.enabled:
+            self.timer.profiler = self.profiler
+        
     def setup_driver(self):
         """Chrome 드라이버 설정"""
         options = Options()
@@ -148,10 +185,12 @@ class TworldCrawlerV2:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.set_page_load_timeout(self.config['page_load_timeout'])
-        driver.implicitly_wait(5)
+        with self.timer.span('driver_launch'):
+            service = Service(ChromeDriverManager().install())
+            driver = webdriver.Chrome(service=service, options=options)
+            driver.set_page_load_timeout(self.config['page_load_timeout'])
+            driver.implicitly_wait(5)
+        self.timer.increment(DRIVERS_STARTED)
         
         return driver
     
@@ -181,8 +220,9 @@ class TworldCrawlerV2:
             else:
                 logger.info(f"요금제 목록 페이지 접속: {url}")
             
-            driver.get(url)
-            time.sleep(5)
+            with self.timer.span('page_load'):
+                driver.get(url)
+                time.sleep(5)
             
             # 카테고리 목록 수집
             self.collect_categories(driver)
@@ -290,6 +330,7 @@ class TworldCrawlerV2:
                 
         finally:
             driver.quit()
+            self.timer.increment(DRIVERS_CLOSED)
     
     def collect_categories(self, driver):
         """카테고리 목록 수집"""
@@ -411,7 +452,17 @@ class TworldCrawlerV2:
         else:
             logger.info(f"\n총 {len(self.all_combinations)}개 조합 준비 완료")
     
+    def _combination_key(self, combo):
+        """저널용 조합 키 (요금제ID|네트워크|가입유형)"""
+        return f"{combo['plan']['id']}|{combo['network']['code']}|{combo['scrb_type']['value']}"
+    
     def process_combination(self, combo_index, progress=None, task_id=None):
+        """단일 조합 처리 (작업 단위 시간 계측)"""
+        combo = self.all_combinations[combo_index]
+        with self.timer.job(f"{combo['plan']['name']} - {combo['network']['name']}"):
+            return self._process_combination(combo_index, progress, task_id)
+    
+    def _process_combination(self, combo_index, progress=None, task_id=None):
         """단일 조합 처리"""
         combo = self.all_combinations[combo_index]
         driver = None
@@ -442,11 +493,17 @@ class TworldCrawlerV2:
             url = f"{BASE_URL}/notice?{urlencode(params, quote_via=quote_plus)}"
             
             # 페이지 로드
-            driver.get(url)
-            time.sleep(2)
+            with self.timer.span('page_load'):
+                driver.get(url)
+                time.sleep(2)
             
             # 데이터 수집
-            items_count = self._collect_all_pages_data(driver, combo)
+            combo_rows = self._collect_all_pages_data(driver, combo)
+            items_count = len(combo_rows)
+            
+            # 완료된 조합과 행을 저널에 기록 (재개 시 건너뜀, 빈 결과는 재시도하도록 기록하지 않음)
+            if combo_rows:
+                self.journal.record(self._combination_key(combo), combo_rows)
             
             with self.status_lock:
                 if items_count > 0:
@@ -457,6 +514,8 @@ class TworldCrawlerV2:
                         console.print(f"[green]✓[/green] [{combo_index+1}/{len(self.all_combinations)}] {combo['plan']['name'][:40]}... ({combo['network']['name']}) - [bold]{items_count}개[/bold]")
                 else:
                     self.failed_count += 1
+            self.timer.increment(JOBS_COMPLETED if items_count > 0 else JOBS_FAILED)
+            self.timer.increment(ROWS_COLLECTED, items_count)
             
             return True
             
@@ -464,30 +523,37 @@ class TworldCrawlerV2:
             logger.error(f"처리 오류 [{combo_index+1}]: {str(e)}")
             with self.status_lock:
                 self.failed_count += 1
+            self.timer.increment(JOBS_FAILED)
             return False
             
         finally:
             if driver:
                 driver.quit()
+                self.timer.increment(DRIVERS_CLOSED)
             # 작업 상태 제거
             with self.status_lock:
                 self.current_tasks.pop(thread_id, None)
     
     def _collect_all_pages_data(self, driver, combo):
-        """모든 페이지 데이터 수집"""
-        all_items = 0
+        """모든 페이지 데이터 수집 (조합에서 수집한 행 목록 반환)"""
+        all_items = []
         current_page = 1
         max_pages = 10
         
         while current_page <= max_pages:
-            items = self._collect_current_page_data(driver, combo)
+            with self.timer.span('extract'):
+                items = self._collect_current_page_data(driver, combo)
             
             if not items:
                 break
                 
-            all_items += len(items)
+            all_items.extend(items)
+            
+            if self.history_store:
+                self.history_store.record_rows(items, carrier='SKT')
             
             # 다음 페이지 확인
+            pagination_start = time.perf_counter()
             try:
                 pagination = driver.find_element(By.CSS_SELECTOR, ".pagination, .paginate, .paging")
                 
@@ -507,6 +573,8 @@ class TworldCrawlerV2:
                     
             except:
                 break
+            finally:
+                self.timer.record('pagination', time.perf_counter() - pagination_start)
         
         return all_items
     
@@ -565,29 +633,11 @@ class TworldCrawlerV2:
     
     def clean_price(self, price_str):
         """가격 정리"""
-        if not price_str:
-            return 0
-        cleaned = re.sub(r'[^0-9]', '', str(price_str))
-        try:
-            return int(cleaned) if cleaned else 0
-        except:
-            return 0
+        return parse_price(price_str)
     
     def get_manufacturer(self, device_name):
         """제조사 추출"""
-        name_lower = device_name.lower()
-        if '갤럭시' in name_lower or 'galaxy' in name_lower:
-            return '삼성'
-        elif '아이폰' in name_lower or 'iphone' in name_lower or 'ipad' in name_lower:
-            return '애플'
-        elif 'lg' in name_lower:
-            return 'LG'
-        elif '샤오미' in name_lower or 'xiaomi' in name_lower:
-            return '샤오미'
-        elif '모토로라' in name_lower:
-            return '모토로라'
-        else:
-            return '기타'
+        return classify_manufacturer(device_name)
     
     def run_parallel_crawling(self):
         """병렬 크롤링 실행"""
@@ -605,8 +655,12 @@ class TworldCrawlerV2:
             print(f"병렬 처리 (워커: {self.config['max_workers']}개)")
             print("="*50)
         
-        # 체크포인트 확인
-        start_index = self.load_checkpoint()
+        # 체크포인트 확인 (저널에 없는 조합만 처리)
+        completed_keys = self.load_checkpoint()
+        pending = [
+            i for i, combo in enumerate(self.all_combinations)
+            if self._combination_key(combo) not in completed_keys
+        ]
         
         with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
             
@@ -625,13 +679,13 @@ class TworldCrawlerV2:
                     
                     main_task = progress.add_task(
                         "[green]전체 진행률",
-                        total=len(self.all_combinations) - start_index,
+                        total=len(pending),
                         status=f"디바이스: 0개"
                     )
                     
                     # 작업 제출
                     futures = []
-                    for i in range(start_index, len(self.all_combinations)):
+                    for i in pending:
                         future = executor.submit(self.process_combination, i, progress, main_task)
                         futures.append((future, i))
                     
@@ -650,28 +704,22 @@ class TworldCrawlerV2:
                                 status=f"디바이스: {self.total_devices:,}개 | 속도: {speed:.1f}/분"
                             )
                             
-                            # 체크포인트 저장
-                            if (idx + 1) % self.config['checkpoint_interval'] == 0:
-                                self.save_checkpoint(idx + 1)
-                            
                         except Exception as e:
                             logger.error(f"Future 오류: {str(e)}")
                             progress.advance(main_task)
             else:
                 # Rich 없을 때
                 futures = []
-                for i in range(start_index, len(self.all_combinations)):
+                for i in pending:
                     future = executor.submit(self.process_combination, i)
                     futures.append((future, i))
                 
                 completed = 0
-                total = len(self.all_combinations) - start_index
+                total = len(pending)
                 for future, idx in futures:
+                    future.result()
                     completed += 1
                     print(f"진행: {completed}/{total} ({completed/total*100:.1f}%)")
-                    
-                    if (idx + 1) % self.config['checkpoint_interval'] == 0:
-                        self.save_checkpoint(idx + 1)
         
         # 다른 가입유형 데이터 복사
         self._duplicate_data_for_other_types()
@@ -701,9 +749,35 @@ class TworldCrawlerV2:
             print(f"실패: {self.failed_count}개")
             print(f"총 데이터: {len(self.all_data)}개")
         
+        # 단계별 소요 시간 분포
+        self.timer.print_summary(console)
+        
         # 체크포인트 삭제
         self.clear_checkpoint()
     
+    def close_unseen_history(self):
+        """전체 수집을 마쳤으면 이번 실행에서 보이지 않은 키(공시 철회)의 이력 유효기간 종료"""
+        if not self.history_store or self.config['max_rate_plans'] > 0 or self.failed_count:
+            return
+        self.history_store.close_unseen('SKT')
+    
+    def save_profile(self):
+        """프로파일 리포트 / .pstats / 메모리 체크포인트 저장"""
+        if not self.profiler.enabled:
+            return
+        self.profiler.stop(os.path.join(
+            self.config['output_dir'], f"SKT_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"))
+    
+    def save_metrics(self):
+        """단계별 메트릭 JSON 저장"""
+        metrics_file = self.config.get('metrics_file') or os.path.join(
+            self.config['output_dir'], f"SKT_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            os.makedirs(os.path.dirname(metrics_file) or '.', exist_ok=True)
+            self.timer.save(metrics_file)
+        except Exception as e:
+            logger.error(f"메트릭 저장 실패: {e}")
+    
     def _duplicate_data_for_other_types(self):
         """다른 가입유형용 데이터 복사"""
         if RICH_AVAILABLE:
@@ -724,58 +798,39 @@ class TworldCrawlerV2:
                 new_item['scrb_type_name'] = scrb_type['name']
                 self.all_data.append(new_item)
         
+        if self.history_store:
+            self.history_store.record_rows(self.all_data[len(original_data):], carrier='SKT')
+        self.profiler.checkpoint('가입유형 복제', all_data=self.all_data, original_data=original_data)
+        
         if RICH_AVAILABLE:
             console.print(f"[green]✓[/green] 총 {len(self.all_data):,}개 데이터 생성 완료")
         else:
             logger.info(f"✓ 총 {len(self.all_data)}개 데이터 생성 완료")
     
-    def save_checkpoint(self, index):
-        """체크포인트 저장"""
-        checkpoint_data = {
-            'index': index,
-            'all_data': self.all_data,
-            'rate_plans': self.rate_plans,
-            'categories': self.categories,
-            'timestamp': datetime.now().isoformat()
-        }
-        
+    def load_checkpoint(self):
+        """저널 로드 → 완료된 조합 키 집합 (수집된 행은 all_data로 복원)"""
         try:
-            with open(self.checkpoint_file, 'wb') as f:
-                pickle.dump(checkpoint_data, f)
-            logger.debug(f"체크포인트 저장: {index}")
+            completed_keys, rows = self.journal.load()
         except Exception as e:
-            logger.error(f"체크포인트 저장 실패: {e}")
-    
-    def load_checkpoint(self):
-        """체크포인트 로드"""
-        if not os.path.exists(self.checkpoint_file):
-            return 0
+            logger.error(f"체크포인트 로드 실패: {e}")
+            return set()
         
-        try:
-            with open(self.checkpoint_file, 'rb') as f:
-                checkpoint_data = pickle.load(f)
-            
-            self.all_data = checkpoint_data.get('all_data', [])
-            saved_index = checkpoint_data.get('index', 0)
+        if completed_keys:
+            self.all_data = ColumnarRows(rows)
+            # 복원 행도 이번 실행에서 관측된 것으로 기록 (미관측 키 종료 대상에서 제외)
+            if self.history_store:
+                self.history_store.record_rows(rows, carrier='SKT')
             
             if RICH_AVAILABLE:
-                console.print(f"[yellow]체크포인트 로드: {saved_index}번째부터 재개[/yellow]")
+                console.print(f"[yellow]체크포인트 로드: 완료된 조합 {len(completed_keys)}개 건너뜀 ({len(rows):,}행 복원)[/yellow]")
             else:
-                logger.info(f"체크포인트 로드: {saved_index}번째부터 재개")
-            
-            return saved_index
-        except Exception as e:
-            logger.error(f"체크포인트 로드 실패: {e}")
-            return 0
+                logger.info(f"체크포인트 로드: 완료된 조합 {len(completed_keys)}개 건너뜀 ({len(rows):,}행 복원)")
+        
+        return completed_keys
     
     def clear_checkpoint(self):
-        """체크포인트 삭제"""
-        if os.path.exists(self.checkpoint_file):
-            try:
-                os.remove(self.checkpoint_file)
-                logger.debug("체크포인트 파일 삭제")
-            except:
-                pass
+        """체크포인트(저널) 삭제"""
+        self.journal.clear()
     
     def clean_sheet_name(self, name):
         """Excel 시트명 정리"""
@@ -799,7 +854,7 @@ class TworldCrawlerV2:
         
         try:
             # DataFrame 생성
-            df = pd.DataFrame(self.all_data)
+            df = self.all_data.to_dataframe()
             
             # CSV 저장
             if 'csv' in self.config['save_formats']:
@@ -886,6 +941,27 @@ class TworldCrawlerV2:
                 else:
                     logger.info(f"Excel 저장: {excel_file}")
             
+            # Parquet / Arrow 저장
+            for columnar_file in save_columnar_formats(df, self.config['save_formats'],
+                                                       self.config['output_dir'], f"tworld_v2_{timestamp}"):
+                saved_files.append(columnar_file)
+                label = os.path.splitext(columnar_file)[1][1:].capitalize()
+                
+                if RICH_AVAILABLE:
+                    console.print(f"[green]{label} 저장:[/green] {columnar_file}")
+                else:
+                    logger.info(f"{label} 저장: {columnar_file}")
+            
+            # 정규화 저장 (요금제 / 기기 / 팩트 테이블)
+            for normalized_file in save_normalized_tables(df, self.config['save_formats'],
+                                                          self.config['output_dir'], f"tworld_v2_{timestamp}"):
+                saved_files.append(normalized_file)
+                
+                if RICH_AVAILABLE:
+                    console.print(f"[green]정규화 저장:[/green] {normalized_file}")
+                else:
+                    logger.info(f"정규화 저장: {normalized_file}")
+            
             # 통계 출력
             self._print_statistics(df)
             
@@ -958,6 +1034,10 @@ class TworldCrawlerV2:
     def run(self):
         """전체 실행"""
         try:
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.start()
+            self.profiler.start()
+            
             if RICH_AVAILABLE:
                 console.print(Panel.fit(
                     "[bold cyan]T world 전체 카테고리 크롤러 v2.0[/bold cyan]\n"
@@ -986,9 +1066,13 @@ class TworldCrawlerV2:
             
             # 3. 병렬 크롤링
             self.run_parallel_crawling()
+            self.close_unseen_history()
+            self.profiler.checkpoint('크롤링 완료', all_data=self.all_data)
             
             # 4. 결과 저장
-            saved_files = self.save_results()
+            with self.profiler.profile('save'):
+                saved_files = self.save_results()
+            self.profiler.checkpoint('저장 완료', all_data=self.all_data)
             
             return saved_files
             
@@ -1011,6 +1095,15 @@ class TworldCrawlerV2:
                 logger.error(f"크롤링 중 오류: {e}")
             traceback.print_exc()
             return []
+        
+        finally:
+            self.save_metrics()
+            if self.metrics_exporter.enabled:
+                self.metrics_exporter.stop()
+            self.save_profile()
+            self.journal.close()
+            if self.history_store:
+                self.history_store.close()
 
 
 def main():
@@ -1028,13 +1121,27 @@ def main():
                         help='브라우저 표시')
     parser.add_argument('--output', type=str, default='data',
                         help='출력 디렉토리')
-    parser.add_argument('--format', nargs='+', choices=['excel', 'csv'],
+    parser.add_argument('--format', nargs='+', choices=['excel', 'csv', 'parquet', 'arrow', 'normalized'],
                         default=['excel', 'csv'],
                         help='저장 형식')
     parser.add_argument('--test', action='store_true',
                         help='테스트 모드 (처음 10개 요금제만)')
     parser.add_argument('--resume', action='store_true',
                         help='체크포인트에서 재개')
+    parser.add_argument('--history-db', type=str, default=None,
+                        help='공시지원금 이력 SQLite 경로 (지정 시 실행마다 누적 저장)')
+    parser.add_argument('--metrics-file', type=str, default=None,
+                        help='단계별 소요 시간 메트릭 JSON 경로 (기본: 출력 디렉토리에 자동 생성)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='실행 중 Prometheus /metrics 엔드포인트 포트 (기본: 사용 안 함)')
+    parser.add_argument('--metrics-textfile', type=str, default=None,
+                        help='Prometheus textfile collector 경로 (.prom, 기본: 사용 안 함)')
+    parser.add_argument('--profile', action='store_true',
+                        help='작업별 cProfile 결과를 합쳐 리포트(.txt)와 .pstats 저장')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='체크포인트마다 tracemalloc 스냅샷 기록 (--profile 포함)')
+    parser.add_argument('--profile-sort', choices=SORT_KEYS, default='cumulative',
+                        help='프로파일 리포트 정렬 기준 (기본: cumulative)')
     
     args = parser.parse_args()
     
@@ -1045,7 +1152,14 @@ def main():
         'show_browser': args.show_browser,
         'headless': not args.show_browser,
         'output_dir': args.output,
-        'save_formats': args.format
+        'save_formats': args.format,
+        'history_db': args.history_db,
+        'metrics_file': args.metrics_file,
+        'metrics_port': args.metrics_port,
+        'metrics_textfile': args.metrics_textfile,
+        'profile': args.profile,
+        'profile_memory': args.profile_memory,
+        'profile_sort': args.profile_sort
     }
     
     if RICH_AVAILABLE:
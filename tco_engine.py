@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+통신 3사 총소유비용(TCO) 엔진
+
+"기기 X를 통신사/요금제별로 24개월 쓰면 얼마인가"를 바로 답하기 위한 모듈.
+표준 스키마 데이터에서 모든 (기기, 요금제, 통신사, 가입유형) 조합의 비용을
+numpy 배열로 한 번에 계산하고, 기기별로 비용 순 정렬 인덱스를 미리 만들어 둔다.
+
+비용 계산:
+    기기 부담금 = 최종구매가 (LG U+, 값이 있는 경우)
+                  그 외 max(출고가 - 공시지원금 - 추가지원금, 0)
+    총비용     = 기기 부담금 + 월요금 × 개월 수
+    월요금이 0(수집하지 않음)인 조합은 같은 기기 안에서 월요금이 있는 조합 뒤에 정렬
+
+주요 특징:
+    - 전체 조합 비용 벡터 연산 (행 단위 반복 없음)
+    - 기기키(device_index) 기준 기기별 정렬 인덱스 사전 계산 → 조회는 슬라이스
+    - 기기명/기기키 접두어 조회 ("갤럭시 S25" → galaxy s 25 256gb/512gb ...)
+    - 통신사 / 가입유형 필터, 통신사별 최저가 비교
+
+사용법:
+    python tco_engine.py data/통신3사_공시지원금_통합.parquet --device "갤럭시 S25" --top 5
+"""
+
+import re
+import sys
+import bisect
+import argparse
+import logging
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from schema import to_canonical, load_canonical
+from device_index import DeviceIndex
+
+logger = logging.getLogger(__name__)
+
+# 기본 사용 기간 (개월)
+DEFAULT_MONTHS = 24
+
+# 조회 결과 컬럼
+RESULT_COLUMNS = [
+    '통신사', '가입유형', '네트워크', '요금제', '월요금', '기기명', '기기키',
+    '출고가', '공시지원금', '추가지원금', '기기부담금', '요금제유지기간',
+    '요금합계', '총비용', '월평균비용'
+]
+
+_STORAGE_SUFFIX = re.compile(r' \d+(?:gb|tb)$')
+
+
+class TCOEngine:
+    """기기별 비용 순 정렬 인덱스를 가진 TCO 계산기"""
+
+    def __init__(self, df: pd.DataFrame, months: int = DEFAULT_MONTHS,
+                 device_index: Optional[DeviceIndex] = None):
+        """
+        Args:
+            df: 크롤링 결과 DataFrame (통신사별 형식은 표준 스키마로 자동 변환)
+            months: 사용 기간 (개월)
+            device_index: 기기키 인덱스 (없으면 기본 별칭으로 생성)
+        """
+        df = to_canonical(df)
+
+        self.months = months
+        self.device_index = device_index or DeviceIndex()
+        self.frame = df.reset_index(drop=True)
+
+        # 기기키 → 정수 코드
+        device_keys = self.device_index.key_series(self.frame['기기명'].astype(object))
+        codes, uniques = pd.factorize(device_keys)
+        self._codes = codes
+        self.device_keys = np.asarray(uniques, dtype=object)
+        self._key_to_code = {key: code for code, key in enumerate(self.device_keys)}
+        self._sorted_device_keys = sorted(self._key_to_code)
+
+        # 비용 계산 (벡터 연산)
+        release = self.frame['출고가'].to_numpy(dtype=np.int64)
+        public = self.frame['공시지원금'].to_numpy(dtype=np.int64)
+        additional = self.frame['추가지원금'].to_numpy(dtype=np.int64)
+        final_price = self.frame['최종구매가'].to_numpy(dtype=np.int64)
+        monthly = self.frame['월요금'].to_numpy(dtype=np.int64)
+
+        self.device_cost = np.where(final_price > 0, final_price,
+                                    np.maximum(release - public - additional, 0))
+        self.plan_cost = monthly * months
+        self.total_cost = self.device_cost + self.plan_cost
+        self.fee_unknown = monthly <= 0
+
+        # 필터용 컬럼 배열
+        self._carriers = self.frame['통신사'].to_numpy(dtype=object)
+        self._subscription_types = self.frame['가입유형'].to_numpy(dtype=object)
+
+        # 기기별 정렬 인덱스: 기기 코드 → (월요금 미상 여부, 총비용) 순
+        self._order = np.lexsort((self.total_cost, self.fee_unknown, codes))
+        self._offsets = np.searchsorted(codes[self._order], np.arange(len(self.device_keys) + 1))
+
+        self.frame['기기키'] = device_keys
+        logger.info(f"TCO 인덱스 생성: {len(self.frame):,}개 조합, 기기 {len(self.device_keys):,}종 ({months}개월)")
+
+    @classmethod
+    def from_file(cls, file_path: str, months: int = DEFAULT_MONTHS,
+                  device_index: Optional[DeviceIndex] = None) -> 'TCOEngine':
+        """저장된 결과 파일에서 생성"""
+        return cls(load_canonical(file_path), months, device_index)
+
+    def resolve_devices(self, query: str) -> List[str]:
+        """
+        기기명/기기키 → 일치하는 기기키 목록
+
+        저장용량만 다른 기기키를 우선 반환하고, 없으면 접두어가 같은 모든 기기키를 반환한다.
+        ("갤럭시 S25" → galaxy s 25 256gb, galaxy s 25 512gb / 울트라·엣지는 제외)
+        """
+        key = self.device_index.key_for(query)
+        if not key:
+            return []
+        if key in self._key_to_code:
+            return [key]
+
+        start = bisect.bisect_left(self._sorted_device_keys, key)
+        candidates = []
+        for device_key in self._sorted_device_keys[start:]:
+            if not device_key.startswith(key):
+                break
+            candidates.append(device_key)
+
+        same_model = [k for k in candidates if _STORAGE_SUFFIX.sub('', k) == key]
+        return same_model or candidates
+
+    def _positions(self, device_keys: List[str]) -> np.ndarray:
+        """기기키 목록 → 행 위치 (기기별 정렬 인덱스 슬라이스 결합)"""
+        slices = []
+        for key in device_keys:
+            code = self._key_to_code[key]
+            slices.append(self._order[self._offsets[code]:self._offsets[code + 1]])
+        if not slices:
+            return np.empty(0, dtype=np.int64)
+        if len(slices) == 1:
+            return slices[0]
+
+        # 여러 기기(용량별)를 합친 경우 다시 비용 순 정렬
+        positions = np.concatenate(slices)
+        order = np.lexsort((self.total_cost[positions], self.fee_unknown[positions]))
+        return positions[order]
+
+    def _result_frame(self, positions: np.ndarray) -> pd.DataFrame:
+        """행 위치 → 결과 DataFrame"""
+        result = self.frame.iloc[positions].copy()
+        result['기기부담금'] = self.device_cost[positions]
+        result['요금합계'] = self.plan_cost[positions]
+        result['총비용'] = self.total_cost[positions]
+        result['월평균비용'] = np.round(self.total_cost[positions] / self.months).astype(np.int64)
+        return result[[col for col in RESULT_COLUMNS if col in result.columns]].reset_index(drop=True)
+
+    def cheapest(self, query: str, top: int = 5, carrier: Optional[str] = None,
+                 subscription_type: Optional[str] = None, known_fee_only: bool = False) -> pd.DataFrame:
+        """
+        기기의 최저 비용 조합
+
+        Args:
+            query: 기기명 또는 기기키 (예: "갤럭시 S25", "galaxy s 25 256gb")
+            top: 반환할 조합 수
+            carrier: 통신사 필터 (SKT, KT, LG U+)
+            subscription_type: 가입유형 필터 (기기변경, 번호이동, 신규가입 ...)
+            known_fee_only: 월요금이 있는 조합만
+        """
+        positions = self._positions(self.resolve_devices(query))
+
+        mask = np.ones(len(positions), dtype=bool)
+        if carrier:
+            mask &= (self._carriers[positions] == carrier)
+        if subscription_type:
+            mask &= (self._subscription_types[positions] == subscription_type)
+        if known_fee_only:
+            mask &= ~self.fee_unknown[positions]
+
+        return self._result_frame(positions[mask][:top])
+
+    def compare_carriers(self, query: str, subscription_type: Optional[str] = None) -> pd.DataFrame:
+        """통신사별 최저 비용 조합 1개씩"""
+        positions = self._positions(self.resolve_devices(query))
+        if subscription_type:
+            positions = positions[self._subscription_types[positions] == subscription_type]
+
+        # 정렬된 위치에서 통신사별 첫 행 = 통신사별 최저가
+        carriers = self._carriers[positions]
+        _, first = np.unique(carriers.astype(str), return_index=True)
+        return self._result_frame(positions[np.sort(first)])
+
+    def to_frame(self) -> pd.DataFrame:
+        """전체 조합 비용표 (기기키, 총비용 순)"""
+        return self._result_frame(self._order[self._offsets[0]:])
+
+
+def main():
+    """TCO 조회 CLI"""
+    parser = argparse.ArgumentParser(description='통신 3사 총소유비용(TCO) 조회')
+    parser.add_argument('file', help='크롤링 결과 파일 (csv, json, jsonl, parquet, arrow, xlsx)')
+    parser.add_argument('--device', required=True, help='기기명 (예: "갤럭시 S25")')
+    parser.add_argument('--top', type=int, default=5, help='조회할 조합 수 (기본: 5)')
+    parser.add_argument('--months', type=int, default=DEFAULT_MONTHS, help='사용 기간 (기본: 24개월)')
+    parser.add_argument('--carrier', choices=['SKT', 'KT', 'LG U+'], help='통신사 필터')
+    parser.add_argument('--subscription-type', help='가입유형 필터 (예: 기기변경)')
+    parser.add_argument('--by-carrier', action='store_true', help='통신사별 최저가 비교')
+    parser.add_argument('--device-aliases', help='기기 별칭/모델코드 테이블 JSON 경로')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    engine = TCOEngine.from_file(args.file, args.months, DeviceIndex(args.device_aliases))
+
+    if args.by_carrier:
+        result = engine.compare_carriers(args.device, args.subscription_type)
+    else:
+        result = engine.cheapest(args.device, args.top, args.carrier, args.subscription_type)
+
+    if result.empty:
+        print(f"'{args.device}'에 해당하는 기기가 없습니다.")
+        sys.exit(1)
+
+    with pd.option_context('display.max_columns', None, 'display.width', 200):
+        print(result.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
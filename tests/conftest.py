@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""루트 모듈(schema, history_store, integrated_crawler 등)을 테스트에서 import 하도록 경로 추가"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
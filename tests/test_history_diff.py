@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""이력 저장소 스냅샷 ↔ 결과 파일 비교 회귀 테스트 (통신사별 기본값이 같은 키로 맞춰지는지)"""
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from history_store import HistoryStore  # noqa: E402
+from diff_engine import diff_snapshots  # noqa: E402
+from schema import to_canonical  # noqa: E402
+
+
+def kt_rows(count=20):
+    """KT 단독 크롤러 형식 행 (가입유형 컬럼 없음)"""
+    return [{
+        'carrier': 'KT',
+        'plan_type': '5G',
+        'plan_name': f"요금제 {i % 4}",
+        'monthly_fee': 60000 + (i % 4) * 10000,
+        'device_name': f"갤럭시 S25 {i}",
+        'manufacturer': '삼성',
+        'release_price': 1155000,
+        'public_support_fee': 500000,
+        'additional_support_fee': 75000,
+        'crawled_at': '2025-06-08 22:43:45',
+    } for i in range(count)]
+
+
+def test_history_snapshot_uses_carrier_defaults(tmp_path):
+    with HistoryStore(str(tmp_path / 'h.db')) as store:
+        store.record_rows(kt_rows(3))
+        store.flush()
+        rows = store.snapshot()
+
+    df = to_canonical(pd.DataFrame(rows), 'history')
+    assert set(df['가입유형'].astype(str)) == {'전체'}
+
+
+def test_history_vs_file_diff(tmp_path):
+    rows = kt_rows()
+    with HistoryStore(str(tmp_path / 'h.db')) as store:
+        store.record_rows(rows)
+
+    new = pd.DataFrame(rows)
+    new.loc[0, 'public_support_fee'] += 1000
+    new = new.iloc[:-3]
+    new_path = tmp_path / 'new.csv'
+    new.to_csv(new_path, index=False, encoding='utf-8-sig')
+
+    result = diff_snapshots(str(tmp_path / 'h.db'), str(new_path))
+    assert len(result.added) == 0
+    assert len(result.removed) == 3
+    assert len(result.changed) == 1
+    assert result.unchanged_count == len(rows) - 4
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""세그먼트 체크포인트 기록/복원 테스트 (행마다 키 구성이 다른 경우)"""
+
+import pytest
+
+pytest.importorskip('pandas')
+
+from segment_checkpoint import SegmentCheckpoint  # noqa: E402
+
+
+def test_rows_with_different_keys_round_trip(tmp_path):
+    checkpoint = SegmentCheckpoint(str(tmp_path), 'KT')
+    mixed = [{'기기명': 'A', '출고가': 1000}, {'기기명': 'B', '출고가': 2000, '추가지원금': 300}]
+    uniform = [{'기기명': 'C', '출고가': 3000}]
+    checkpoint.write('mixed', mixed)
+    checkpoint.write('uniform', uniform)
+
+    rows = checkpoint.load_rows()
+    assert sorted(rows, key=lambda row: row['기기명']) == mixed + uniform
+
+
+def test_completion_marker_records_full_crawl(tmp_path):
+    checkpoint = SegmentCheckpoint(str(tmp_path), 'SKT')
+    assert not checkpoint.is_complete()
+
+    checkpoint.mark_complete(failed_jobs=0, limited=True)
+    assert checkpoint.is_complete()
+    assert not checkpoint.is_full_crawl()
+
+    checkpoint.mark_complete(failed_jobs=2)
+    assert checkpoint.completion()['failed_jobs'] == 2
+    assert not checkpoint.is_full_crawl()
+
+    checkpoint.mark_complete()
+    assert checkpoint.is_full_crawl()
+
+
+def test_legacy_completion_marker_is_not_full_crawl(tmp_path):
+    checkpoint = SegmentCheckpoint(str(tmp_path), 'KT')
+    (tmp_path / 'KT' / '_COMPLETE').write_text('12', encoding='utf-8')
+    assert checkpoint.is_complete()
+    assert not checkpoint.is_full_crawl()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""통합 크롤러 수집 후 검증 테스트 (수집 중 검증 구간은 건너뛰고 복원분/복사본만 검증)"""
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('selenium')
+pytest.importorskip('webdriver_manager')
+
+from integrated_crawler import UnifiedTelecomCrawler  # noqa: E402
+from records import ColumnarRows  # noqa: E402
+
+
+def row(name, carrier='SKT', price=1155000):
+    return {'통신사': carrier, '기기명': name, '출고가': price, '공시지원금': 500000,
+            '크롤링시간': '2025-06-08 22:43:45'}
+
+
+def test_only_unverified_rows_are_validated(tmp_path):
+    crawler = UnifiedTelecomCrawler({'output_dir': str(tmp_path / 'data'),
+                                     'checkpoint_dir': str(tmp_path / 'checkpoints')})
+    # SKT: 복원 1 | 수집 중 검증 2 | 복사본 1, KT: 완료 체크포인트 복원 (전부 미검증)
+    skt = ColumnarRows([row('복원 무효', price=None), row('갤럭시 A'), row('수집 검증됨', price=1),
+                        row('복사 무효', price=None)])
+    kt = ColumnarRows([row('아이폰 16', 'KT'), row('KT 무효', 'KT', None)])
+    crawler.data_by_carrier = {'SKT': skt, 'KT': kt, 'LG U+': ColumnarRows()}
+    crawler.all_data = ColumnarRows(skt)
+    crawler.all_data.extend(kt)
+    crawler.stream_validated = {'SKT': (1, 3)}
+
+    valid_data, result = crawler._validate_unverified()
+
+    # 수집 중 검증 구간의 행은 다시 걸러지지 않음
+    assert [item['기기명'] for item in valid_data] == ['갤럭시 A', '수집 검증됨', '아이폰 16']
+    assert (result['total'], result['valid'], result['invalid']) == (6, 3, 3)
+    assert result['error_summary']['유효하지 않은 출고가: None'] == 3
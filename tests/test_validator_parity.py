@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""DataValidator ↔ VectorizedDataValidator 결과 일치 테스트 (무효 값이 섞인 행)"""
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('selenium')
+pytest.importorskip('webdriver_manager')
+
+from integrated_crawler import DataValidator, VectorizedDataValidator  # noqa: E402
+from records import ColumnarRows  # noqa: E402
+
+
+def base_row(i):
+    return {
+        '통신사': 'SKT',
+        '기기명': f"갤럭시 S25 {i}",
+        '요금제': '5GX 프라임',
+        '월요금': 89000,
+        '출고가': '1,155,000원',
+        '공시지원금': 500000,
+        '추가지원금': 75000,
+        '크롤링시간': '2025-06-08 22:43:45',
+    }
+
+
+def mutated_rows():
+    """필드별로 한 가지씩 깨뜨린 행 + 정상 행"""
+    mutations = [
+        {},
+        {'출고가': None},
+        {'공시지원금': None},
+        {'추가지원금': None},
+        {'월요금': None},
+        {'월요금': 0},
+        {'월요금': '0'},
+        {'출고가': ''},
+        {'출고가': 'abc'},
+        {'출고가': 50000},
+        {'공시지원금': 0},
+        {'추가지원금': 9999999},
+        {'기기명': 'ab'},
+        {'기기명': 'None'},
+        {'기기명': None},
+        {'통신사': ''},
+        {'크롤링시간': '2025/06/08'},
+        {'크롤링시간': None},
+    ]
+    rows = []
+    for i, mutation in enumerate(mutations):
+        row = base_row(i)
+        row.update(mutation)
+        rows.append(row)
+
+    # 키가 없는 행
+    for i, field in enumerate(['추가지원금', '월요금', '크롤링시간', '공시지원금']):
+        row = base_row(100 + i)
+        del row[field]
+        rows.append(row)
+    return rows
+
+
+def strip_times(rows):
+    """교체된 크롤링시간은 실행 시각이라 비교에서 제외"""
+    return [{k: v for k, v in row.items() if k != '크롤링시간'} for row in rows]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_vectorized_matches_row_validator(columnar):
+    # ColumnarRows는 없는 키를 None으로 채우므로 같은 저장소의 행 dict와 비교
+    data = ColumnarRows(mutated_rows()) if columnar else mutated_rows()
+    expected_rows, expected = DataValidator().validate_dataset(list(data))
+
+    actual_rows, actual = VectorizedDataValidator().validate_dataset(data)
+
+    assert actual['error_summary'] == expected['error_summary']
+    assert (actual['valid'], actual['invalid']) == (expected['valid'], expected['invalid'])
+    assert 'None' in ' '.join(actual['error_summary'])
+    assert len(actual_rows) == len(expected_rows)
+    for got, want in zip(strip_times(actual_rows), strip_times(expected_rows)):
+        assert {k: v for k, v in got.items() if v is not None} == {k: v for k, v in want.items() if v is not None}